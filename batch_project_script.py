@@ -0,0 +1,150 @@
+import os
+import csv
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# ---------- 프로젝트 패키지에 필요한 모듈 가져오기 ----------
+
+from network_tool_pkg.utils.preprocessing import preprocess_network
+from network_tool_pkg.utils.degree_utils import create_degree_sequence, preprocess_stub
+from network_tool_pkg.utils.average_utils import ensemble_average
+from network_tool_pkg.utils.global_utils import calculate_global
+from network_tool_pkg.analysis.centrality_generator import CentralityCalculator
+from network_tool_pkg.analysis.ensemble_runner import run_ensemble, ENSEMBLE_MODELS
+
+from data_loader_script import load_network_from_file
+
+# ====================================================================
+# 배치 설정
+# ====================================================================
+
+# 🚨 data/ 아래의 관계 유형(friendship, health_advice)별 마을 파일을 모두 분석하여 하나의 결과 표로 저장
+DATA_DIR = 'data'
+OUTPUT_PATH = 'results/batch_results.csv'
+NUM_SIMULATIONS = 100
+MASTER_SEED = 2013
+N_WORKERS = os.cpu_count() or 1
+
+RESULT_COLUMNS = ['relation', 'village', 'N', 'M', 'model', 'CC', 'APL', 'DIAM', 'mean_betweenness', 'mean_closeness']
+
+# -------------------- 마을 파일 탐색 함수 --------------------
+def find_village_files(data_dir) :
+
+  if not os.path.isdir(data_dir) :
+    raise FileNotFoundError('입력한 데이터 폴더 경로가 잘못되었습니다. 현재 경로 : {}'.format(data_dir))
+
+  villages = []
+
+  for relation in sorted(os.listdir(data_dir)) :
+    relation_dir = os.path.join(data_dir, relation)
+
+    if not os.path.isdir(relation_dir) :
+      continue
+
+    # 마을 번호 순서로 정렬 (1, 2, ..., 17)
+    names = [name for name in os.listdir(relation_dir) if os.path.isfile(os.path.join(relation_dir, name))]
+    names.sort(key = lambda name : (not name.isdigit(), int(name) if name.isdigit() else 0, name))
+
+    for name in names :
+      villages.append((relation, name, os.path.join(relation_dir, name)))
+
+  return villages
+
+
+
+
+
+# -------------------- 마을 하나 분석 함수 : 로드 → 전처리 → 앙상블 → 지표 (프로세스 풀에서 실행) --------------------
+def analyze_village(relation, village, file_path, num_simulations, seed) :
+
+  G_project = preprocess_network(load_network_from_file(file_path))
+  degrees_project = preprocess_stub(create_degree_sequence(G_project), verbose = False)
+
+  N = G_project.number_of_nodes()
+  M = G_project.number_of_edges()
+  ER_P = sum(degrees_project) / N / (N - 1)
+
+  # ---------- 원본 네트워크 지표 ----------
+
+  calc = CentralityCalculator(G_project)
+  original_global = calculate_global(G_project)
+
+  rows = [{'model' : 'Original',
+           'CC' : original_global['CC'], 'APL' : original_global['APL'], 'DIAM' : original_global['DIAM'],
+           'mean_betweenness' : float(np.mean(list(calc.calculate_betweenness_centrality().values()))),
+           'mean_closeness' : float(np.mean(list(calc.calculate_closeness_centrality().values())))}]
+
+  # ---------- 랜덤 모델 앙상블 지표 (마을 내부는 직렬 실행, 마을 간 병렬화) ----------
+
+  ensemble = run_ensemble(N, degrees_project, ER_P, num_simulations, seed = seed, n_workers = 1, verbose = False)
+
+  for model in ENSEMBLE_MODELS :
+    cc, apl, diam = ensemble_average(ensemble[model]['global'])
+
+    rows.append({'model' : model, 'CC' : cc, 'APL' : apl, 'DIAM' : diam,
+                 'mean_betweenness' : float(np.nanmean(ensemble_average(ensemble[model]['btw']))),
+                 'mean_closeness' : float(np.nanmean(ensemble_average(ensemble[model]['cls'])))})
+
+  for row in rows :
+    row.update({'relation' : relation, 'village' : village, 'N' : N, 'M' : M})
+
+  return rows
+
+
+
+
+
+# -------------------- 배치 실행 함수 : 마을들을 worker pool에 분배하고 하나의 결과 표로 저장 --------------------
+def run_batch(data_dir = DATA_DIR, output_path = OUTPUT_PATH, num_simulations = NUM_SIMULATIONS, seed = MASTER_SEED, n_workers = N_WORKERS) :
+
+  villages = find_village_files(data_dir)
+
+  if not villages :
+    raise ValueError('분석할 마을 파일이 없습니다. 데이터 폴더를 확인하십시오. 현재 경로 : {}'.format(data_dir))
+
+  # 마을별 seed는 파일 순서 기준으로 spawn → worker 수 및 완료 순서와 관계없이 동일한 결과
+  village_seeds = np.random.SeedSequence(seed).spawn(len(villages))
+  tasks = [(relation, village, path, num_simulations, village_seed) for (relation, village, path), village_seed in zip(villages, village_seeds)]
+
+  # 큰 파일(느린 마을)부터 제출하여 전체 소요 시간이 가장 느린 마을에 가깝도록 스케줄링
+  tasks.sort(key = lambda task : os.path.getsize(task[2]), reverse = True)
+
+  results = {}
+
+  with ProcessPoolExecutor(max_workers = n_workers) as executor :
+    futures = {executor.submit(analyze_village, *task) : task[:2] for task in tasks}
+
+    for future in as_completed(futures) :
+      relation, village = futures[future]
+
+      try :
+        results[(relation, village)] = future.result()
+        print('[batch] {} / {} 완료'.format(relation, village))
+
+      except Exception as e :
+        # 분석이 불가능한 마을은 건너뛰고 나머지 마을 결과는 유지
+        # 🚨 worker의 모든 예외(NetworkXError, MemoryError, BrokenProcessPool 등)를 마을 단위로 처리 → 완료된 마을 결과는 항상 표로 저장
+        print('[batch] {} / {} 분석 실패 ({}) : {}'.format(relation, village, type(e).__name__, e))
+
+  # ---------- 결과 표 저장 (파일 순서 유지) ----------
+
+  output_dir = os.path.dirname(output_path)
+
+  if output_dir :
+    os.makedirs(output_dir, exist_ok = True)
+
+  with open(output_path, 'w', newline = '') as f :
+    writer = csv.DictWriter(f, fieldnames = RESULT_COLUMNS)
+    writer.writeheader()
+
+    for relation, village, _ in villages :
+      for row in results.get((relation, village), []) :
+        writer.writerow(row)
+
+  print('----- {}개 마을 배치 분석이 완료되었습니다 : {} -----'.format(len(results), output_path))
+
+  return results
+
+
+if __name__ == '__main__' :
+  run_batch()
@@ -0,0 +1,75 @@
+import argparse
+
+from benchmarks.cases import ALL_CASES, synthetic_input, village_inputs
+from benchmarks.runner import run_benchmarks, save_results, compare_results, plot_scaling, environment_info
+
+# ====================================================================
+# 벤치마크 실행 : 프로젝트 루트에서 python -m benchmarks
+# ====================================================================
+
+# 🚨 예시
+#    python -m benchmarks                                   # N = 100 ~ 100k 합성 네트워크 + 마을 데이터 전체 실행
+#    python -m benchmarks --sizes 100 1000 --case centrality  # 일부 크기 / 케이스만 실행
+#    python -m benchmarks --compare benchmarks/results/bench_<commit>.json   # 이전 커밋 결과와 비교
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+RESULT_DIR = 'benchmarks/results'
+
+def main() :
+
+  parser = argparse.ArgumentParser(prog = 'python -m benchmarks', description = '랜덤 네트워크 생성기, 중심성, 전역 지표 벤치마크')
+  parser.add_argument('--sizes', type = int, nargs = '+', default = DEFAULT_SIZES, help = '합성 네트워크 노드 수')
+  parser.add_argument('--mean-degree', type = float, default = 6, help = '합성 네트워크 평균 degree')
+  parser.add_argument('--data-dir', default = 'data', help = '마을 데이터 폴더 (빈 문자열이면 생략)')
+  parser.add_argument('--case', nargs = '+', default = None, help = '실행할 케이스 이름 또는 그룹 (generator / centrality / global)')
+  parser.add_argument('--repeat', type = int, default = 3, help = '케이스별 반복 횟수')
+  parser.add_argument('--no-memory', action = 'store_true', help = 'tracemalloc 최대 메모리 측정 생략')
+  parser.add_argument('--output', default = None, help = '결과 JSON 경로 (기본 : benchmarks/results/bench_<commit>.json)')
+  parser.add_argument('--plot', default = None, help = '스케일링 그래프 경로 (기본 : 결과 JSON과 같은 이름의 .png)')
+  parser.add_argument('--compare', default = None, help = '비교할 이전 결과 JSON 경로')
+  args = parser.parse_args()
+
+  if args.repeat < 1 :
+    parser.error('--repeat는 1 이상이어야 합니다.')
+
+  cases = ALL_CASES
+
+  if args.case :
+    cases = [case for case in ALL_CASES if case[0] in args.case or case[1] in args.case]
+
+    if not cases :
+      parser.error('일치하는 케이스가 없습니다 : {}'.format(args.case))
+
+  # ---------- 입력 그래프 준비 (측정 시간에 포함하지 않음) ----------
+
+  inputs = [synthetic_input(N, args.mean_degree) for N in sorted(args.sizes)]
+
+  if args.data_dir :
+    inputs += village_inputs(args.data_dir)
+
+  # ---------- 실행 및 저장 ----------
+
+  records = run_benchmarks(inputs, cases, repeat = args.repeat, memory = not args.no_memory)
+
+  commit = environment_info()['commit']
+  output = args.output or '{}/bench_{}.json'.format(RESULT_DIR, commit[:10] if commit else 'nogit')
+  config = {'sizes' : sorted(args.sizes), 'mean_degree' : args.mean_degree, 'repeat' : args.repeat,
+            'data_dir' : args.data_dir, 'cases' : [case[0] for case in cases]}
+
+  report = save_results(output, records, config)
+  print('----- 벤치마크 결과가 저장되었습니다 : {} -----'.format(output))
+
+  if args.plot is None :
+    args.plot = (output[:-len('.json')] if output.endswith('.json') else output) + '.png'
+
+  plot_path = plot_scaling(records, args.plot)
+
+  if plot_path :
+    print('----- 스케일링 그래프가 저장되었습니다 : {} -----'.format(plot_path))
+
+  if args.compare :
+    compare_results(report, args.compare)
+
+
+if __name__ == '__main__' :
+  main()
@@ -0,0 +1,143 @@
+import os
+import networkx as nx
+import numpy as np
+
+# ---------- 프로젝트 패키지에 필요한 모듈 가져오기 ----------
+
+from network_tool_pkg.utils.preprocessing import preprocess_network
+from network_tool_pkg.utils.degree_utils import create_degree_sequence, preprocess_stub
+from network_tool_pkg.utils.average_utils import ensemble_average
+from network_tool_pkg.utils.global_utils import calculate_global
+from network_tool_pkg.analysis.centrality_generator import CentralityCalculator
+from network_tool_pkg.analysis.random_nets_generator import RandomNetGenerator
+
+from data_loader_script import load_network_from_file_fast
+
+# 🚨 벤치마크 케이스 : (이름, 그룹, 실행 함수, 최대 노드 수)
+# 🚨 실행 함수는 입력 그래프 정보(bench_input)를 받아 측정할 작업 하나를 수행 (매번 새 객체를 만들어 캐시된 결과를 재사용하지 않음)
+# 🚨 최대 노드 수를 넘는 입력은 O(N²) 또는 순수 Python O(N·M) 구현이라 건너뛰고 결과에 skipped로 기록
+
+BENCH_SEED = 2013
+
+# -------------------- 벤치마크 입력 생성 함수 : 그래프 하나에 대해 케이스들이 공유하는 입력 준비 --------------------
+def make_bench_input(name, G) :
+
+  degrees = preprocess_stub(create_degree_sequence(G))
+  N = G.number_of_nodes()
+
+  # ensemble_average 입력 : 노드별 값을 가진 dict 20개 (betweenness 결과와 같은 형태)
+  rng = np.random.default_rng(BENCH_SEED)
+  nodes = list(G.nodes())
+  node_results = [dict(zip(nodes, rng.random(N).tolist())) for _ in range(20)]
+
+  return {'name' : name,
+          'G' : G,
+          'N' : N,
+          'M' : G.number_of_edges(),
+          'degrees' : degrees,
+          'p' : sum(degrees) / N / (N - 1),
+          'node_results' : node_results}
+
+
+
+
+
+# -------------------- 합성 그래프 생성 함수 : 평균 degree가 약 mean_degree인 heavy-tailed Chung-Lu 네트워크 --------------------
+def synthetic_input(N, mean_degree = 6) :
+
+  # 마을 네트워크처럼 degree가 불균일한 네트워크 사용 (기대 degree ~ Pareto(2.5), 최대값은 sqrt(N · mean_degree)로 제한)
+  # 🚨 degree가 균일한 ER 네트워크는 iFUB 지름 계산의 최악 입력이라 큰 N에서 전역 지표 측정이 비현실적으로 느려짐
+  rng = np.random.default_rng(BENCH_SEED)
+  weights = (rng.pareto(2.5, N) + 1) * mean_degree * 0.6
+  weights = np.minimum(weights, np.sqrt(N * mean_degree))
+
+  degrees = np.maximum(1, np.round(weights)).astype(int).tolist()
+  degrees[0] += sum(degrees) % 2
+
+  generator = RandomNetGenerator(N_nodes = N, initial_degrees = degrees, seed = BENCH_SEED)
+  G = generator.create_chunglu_net_fast()
+
+  # 전처리 파이프라인과 같이 고립 노드 제거 (노드 수가 많아 preprocess_network의 노드 목록 출력은 생략)
+  G.remove_nodes_from(list(nx.isolates(G)))
+
+  return make_bench_input('synthetic_N{}'.format(N), G)
+
+
+
+
+
+# -------------------- 마을 데이터 입력 생성 함수 : 관계 유형별로 가장 큰 마을 파일 사용 --------------------
+def village_inputs(data_dir = 'data') :
+
+  inputs = []
+
+  if not os.path.isdir(data_dir) :
+    return inputs
+
+  for relation in sorted(os.listdir(data_dir)) :
+    relation_dir = os.path.join(data_dir, relation)
+
+    if not os.path.isdir(relation_dir) :
+      continue
+
+    files = [os.path.join(relation_dir, name) for name in os.listdir(relation_dir)]
+    files = [path for path in files if os.path.isfile(path)]
+
+    if not files :
+      continue
+
+    path = max(files, key = os.path.getsize)
+    G = preprocess_network(load_network_from_file_fast(path))
+    inputs.append(make_bench_input('{}_{}'.format(relation, os.path.basename(path)), G))
+
+  return inputs
+
+
+
+
+
+# -------------------- 케이스 정의 : RandomNetGenerator --------------------
+
+def _generator(inp) :
+  return RandomNetGenerator(N_nodes = inp['N'], initial_degrees = inp['degrees'], seed = BENCH_SEED)
+
+GENERATOR_CASES = [
+  ('create_er_net', 'generator', lambda inp : _generator(inp).create_er_net(inp['p']), 5000),
+  ('create_er_net_fast', 'generator', lambda inp : _generator(inp).create_er_net_fast(inp['p']), None),
+  ('create_configuration_net', 'generator', lambda inp : _generator(inp).create_configuration_net(), 10000),
+  ('create_configuration_net_fast', 'generator', lambda inp : _generator(inp).create_configuration_net_fast(), None),
+  ('create_chunglu_net', 'generator', lambda inp : _generator(inp).create_chunglu_net(), 5000),
+  ('create_chunglu_net_fast', 'generator', lambda inp : _generator(inp).create_chunglu_net_fast(), None),
+  ('create_edge_swap_net', 'generator', lambda inp : _generator(inp).create_edge_swap_net(inp['G'], swaps_per_edge = 10, as_csr = True), None),
+  ('create_ba_net', 'generator', lambda inp : _generator(inp).create_ba_net(3), 5000),
+  ('create_ba_net_fast', 'generator', lambda inp : _generator(inp).create_ba_net_fast(3), None),
+  ('generate_ensemble_ER', 'generator', lambda inp : _generator(inp).generate_ensemble('ER', 10, seed = BENCH_SEED, p = inp['p']), None),
+  ('generate_ensemble_Configuration', 'generator', lambda inp : _generator(inp).generate_ensemble('Configuration', 10, seed = BENCH_SEED), None),
+  ('generate_ensemble_Chung-Lu', 'generator', lambda inp : _generator(inp).generate_ensemble('Chung-Lu', 10, seed = BENCH_SEED), None),
+]
+
+# -------------------- 케이스 정의 : CentralityCalculator --------------------
+
+CENTRALITY_CASES = [
+  ('calculate_degree_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_degree_centrality(), None),
+  ('calculate_closeness_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_closeness_centrality(), 10000),
+  ('calculate_harmonic_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_harmonic_centrality(), 10000),
+  ('calculate_betweenness_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_betweenness_centrality(), 2000),
+  ('calculate_betweenness_centrality_k100', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_betweenness_centrality(k = min(100, inp['N'] - 1), seed = BENCH_SEED), None),
+  ('calculate_eigenvector_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_eigenvector_centrality(), 10000),
+  ('calculate_eigenvector_centrality_matrix', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_eigenvector_centrality_matrix(), 5000),
+  ('calculate_eigenvector_centrality_sparse', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_eigenvector_centrality_sparse(), None),
+  ('calculate_eigenvector_centrality_lanczos', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_eigenvector_centrality_sparse(method = 'lanczos'), None),
+  ('calculate_pagerank', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_pagerank(), None),
+  ('calculate_katz_centrality', 'centrality', lambda inp : CentralityCalculator(inp['G']).calculate_katz_centrality(alpha = 0.5 / max(inp['degrees'])), None),
+]
+
+# -------------------- 케이스 정의 : 전역 지표 및 앙상블 평균 --------------------
+
+GLOBAL_CASES = [
+  ('calculate_global', 'global', lambda inp : calculate_global(inp['G'], mode = 'exact'), 10000),
+  ('calculate_global_approx', 'global', lambda inp : calculate_global(inp['G'], mode = 'approx', seed = BENCH_SEED), None),
+  ('ensemble_average', 'global', lambda inp : ensemble_average(inp['node_results']), None),
+]
+
+ALL_CASES = GENERATOR_CASES + CENTRALITY_CASES + GLOBAL_CASES
@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import platform
+import datetime
+import subprocess
+import tracemalloc
+import numpy as np
+
+# 🚨 커밋 간 비교가 가능하도록 결과 JSON에 git commit, 작업 트리 변경 여부, 라이브러리 버전, 입력 크기, seed를 함께 기록
+
+# -------------------- 실행 환경 정보 수집 함수 --------------------
+def environment_info() :
+
+  import networkx
+  import scipy
+
+  repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+  def git(*args) :
+    try :
+      return subprocess.run(['git'] + list(args), cwd = repo_dir, capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) :
+      return None
+
+  status = git('status', '--porcelain', '--untracked-files=no')
+
+  return {'commit' : git('rev-parse', 'HEAD'),
+          'dirty' : bool(status) if status is not None else None,
+          'timestamp' : datetime.datetime.now().isoformat(timespec = 'seconds'),
+          'python' : platform.python_version(),
+          'numpy' : np.__version__,
+          'scipy' : scipy.__version__,
+          'networkx' : networkx.__version__,
+          'platform' : platform.platform(),
+          'cpu_count' : os.cpu_count()}
+
+
+
+
+
+# -------------------- 케이스 1개 측정 함수 : 실행 시간(반복) + 최대 메모리(tracemalloc 1회) --------------------
+def measure(fn, inp, repeat = 3, memory = True, slow_threshold = 1.0) :
+
+  times = []
+
+  for _ in range(repeat) :
+    start = time.perf_counter()
+    fn(inp)
+    times.append(time.perf_counter() - start)
+
+    # 한 번에 slow_threshold초 이상 걸리는 케이스는 반복하지 않음
+    if times[-1] > slow_threshold :
+      break
+
+  result = {'times' : times, 'best' : min(times), 'median' : float(np.median(times))}
+
+  # tracemalloc은 실행 속도를 늦추므로 시간 측정과 분리하여 한 번만 실행
+  if memory :
+    tracemalloc.start()
+
+    try :
+      fn(inp)
+      result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+
+    finally :
+      tracemalloc.stop()
+
+  return result
+
+
+
+
+
+# -------------------- 벤치마크 실행 함수 --------------------
+def run_benchmarks(inputs, cases, repeat = 3, memory = True, verbose = True) :
+
+  records = []
+
+  for inp in inputs :
+    for name, group, fn, max_n in cases :
+      record = {'case' : name, 'group' : group, 'graph' : inp['name'], 'N' : inp['N'], 'M' : inp['M']}
+
+      if max_n is not None and inp['N'] > max_n :
+        record['skipped'] = 'N > {}'.format(max_n)
+        records.append(record)
+        continue
+
+      try :
+        record.update(measure(fn, inp, repeat, memory))
+
+      except (ValueError, TypeError, RuntimeError, MemoryError) as e :
+        record['error'] = '{}: {}'.format(type(e).__name__, e)
+
+      records.append(record)
+
+      if verbose :
+        if 'best' in record :
+          print('[bench] {:<24} {:<42} {:>10.4f} s'.format(inp['name'], name, record['best']))
+        else :
+          print('[bench] {:<24} {:<42} 실패 : {}'.format(inp['name'], name, record['error']))
+
+  return records
+
+
+
+
+
+# -------------------- 결과 저장 함수 (JSON) --------------------
+def save_results(path, records, config) :
+
+  output_dir = os.path.dirname(path)
+
+  if output_dir :
+    os.makedirs(output_dir, exist_ok = True)
+
+  report = {'environment' : environment_info(), 'config' : config, 'results' : records}
+
+  with open(path, 'w') as f :
+    json.dump(report, f, indent = 2)
+
+  return report
+
+
+
+
+
+# -------------------- 결과 비교 함수 : 이전 커밋의 결과 JSON 대비 실행 시간 비율 출력 --------------------
+def compare_results(report, baseline_path, threshold = 1.2) :
+
+  with open(baseline_path) as f :
+    baseline = json.load(f)
+
+  base_times = {(r['case'], r['graph']) : r['best'] for r in baseline['results'] if 'best' in r}
+  slower = []
+
+  print('\n----- 비교 기준 : {} (commit {}) -----'.format(baseline_path, baseline['environment'].get('commit')))
+
+  for r in report['results'] :
+    key = (r['case'], r['graph'])
+
+    if 'best' not in r or key not in base_times or base_times[key] == 0 :
+      continue
+
+    ratio = r['best'] / base_times[key]
+    flag = '  🚨 느려짐' if ratio > threshold else ''
+    print('{:<24} {:<42} {:>8.2f}x{}'.format(r['graph'], r['case'], ratio, flag))
+
+    if ratio > threshold :
+      slower.append(key)
+
+  return slower
+
+
+
+
+
+# -------------------- 스케일링 그래프 저장 함수 (matplotlib이 설치된 경우에만) --------------------
+def plot_scaling(records, path) :
+
+  try :
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+  except ImportError :
+    print('[bench] matplotlib이 설치되어 있지 않아 스케일링 그래프를 생략합니다.', file = sys.stderr)
+    return None
+
+  groups = sorted({r['group'] for r in records})
+  fig, axes = plt.subplots(1, len(groups), figsize = (6 * len(groups), 5), squeeze = False)
+
+  for ax, group in zip(axes[0], groups) :
+    rows = [r for r in records if r['group'] == group and 'best' in r and r['graph'].startswith('synthetic')]
+
+    for case in sorted({r['case'] for r in rows}) :
+      points = sorted((r['N'], r['best']) for r in rows if r['case'] == case)
+      ax.plot([n for n, _ in points], [t for _, t in points], marker = 'o', label = case)
+
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('N')
+    ax.set_ylabel('time (s)')
+    ax.set_title(group)
+    ax.legend(fontsize = 7)
+
+  fig.tight_layout()
+
+  output_dir = os.path.dirname(path)
+
+  if output_dir :
+    os.makedirs(output_dir, exist_ok = True)
+
+  fig.savefig(path)
+  plt.close(fig)
+
+  return path
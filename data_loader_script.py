@@ -1,6 +1,15 @@
 import networkx as nx
+import numpy as np
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.edge_file_utils import iter_edge_chunks
+from network_tool_pkg.utils.cache_utils import GraphCache
+from network_tool_pkg.utils.preprocessing import preprocess_network_bulk
+from network_tool_pkg.utils.degree_utils import create_degree_sequence, preprocess_stub
+from network_tool_pkg.utils.profiling_utils import profile_stage
 
 # -------------------- 파일을 로드하여 네트워크 생성하는 함수 --------------------
+@profile_stage('loader')
 def load_network_from_file(file_path) :
 
   # 🚨 파일 형식 : 각 줄이 'nodeA,nodeB' 형식으로 이루어진 경우에만 사용 가능
@@ -50,3 +59,79 @@ def load_network_from_file(file_path) :
     
   return G_load
       
+
+
+
+
+
+# -------------------- 대용량 파일을 chunk 단위로 로드하여 네트워크 생성하는 함수 --------------------
+@profile_stage('loader')
+def load_network_from_file_fast(file_path, chunk_size = 1 << 24, as_csr = False) :
+
+  # 🚨 파일 형식은 load_network_from_file과 동일 ('nodeA,nodeB'), 노드 이름도 동일하게 household0000 형태로 부여
+  # 🚨 chunk_size 바이트 단위로 읽어 문자열 분리 → 원본 ID를 정수 인덱스로 일괄 변환(unique/inverse) → 그래프 일괄 생성
+  # 🚨 형식이 잘못된 줄은 숨기지 않고 줄 번호와 함께 ValueError 발생 (모든 줄의 쉼표 수를 검사, iter_edge_chunks 참고)
+
+  id_map = {}
+  edge_chunks = list(iter_edge_chunks(file_path, id_map, chunk_size))
+
+  if not edge_chunks :
+    raise ValueError('입력한 파일에 엣지가 없습니다. 파일을 확인하십시오. 현재 경로 : {}'.format(file_path))
+
+  edges = np.concatenate(edge_chunks)
+
+  # ---------- self-loop 제거 (줄 단위 출력 대신 요약 1회 출력) ----------
+
+  loop_mask = edges[:, 0] == edges[:, 1]
+
+  if loop_mask.any() :
+    print('[data loader] self-loop {}개 발견 → 제거'.format(int(loop_mask.sum())))
+    edges = edges[~loop_mask]
+
+  labels = ['household{:04d}'.format(i + 1) for i in range(len(id_map))]
+
+  # ---------- CSRGraph 반환 (엣지에 등장하는 노드만 사용, household 번호는 유지) ----------
+
+  if as_csr :
+    used = np.zeros(len(labels), dtype = bool)
+    used[edges.ravel()] = True
+    new_index = np.cumsum(used) - 1
+
+    return CSRGraph.from_edges(int(used.sum()), new_index[edges], [label for label, u in zip(labels, used) if u])
+
+  # ---------- networkx 그래프 일괄 생성 ----------
+
+  G_load = nx.Graph()
+  G_load.add_edges_from((labels[a], labels[b]) for a, b in edges.tolist())
+
+  return G_load
+
+
+
+
+
+# -------------------- 캐시를 사용하여 로드 + 전처리 결과를 반환하는 함수 --------------------
+@profile_stage('loader')
+def load_preprocessed_network(file_path, cache_dir = '.network_cache', max_cache_bytes = 1 << 30, as_csr = False) :
+
+  # 🚨 입력 파일 내용과 전처리 옵션이 같으면 디스크 캐시(memory mapping)에서 바로 로드하여 파싱·전처리를 생략
+  # 🚨 반환값 : (전처리된 네트워크, stub 보정된 degree sequence)
+
+  cache = GraphCache(cache_dir, max_cache_bytes)
+  options = {'loader' : 'load_network_from_file_fast', 'preprocess' : ['preprocess_network_bulk', 'create_degree_sequence', 'preprocess_stub']}
+
+  # 🚨 전처리는 preprocess_network와 결과가 같은 배열 기반 preprocess_network_bulk 사용 (전처리 결과를 networkx 그래프를 거치지 않고 바로 CSRGraph로 생성)
+  # 🚨 노드 순서를 기존 캐시 결과와 같게 유지하기 위해 로드는 networkx 그래프(엣지 등장 순서)로 실행
+  def build() :
+    graph_project, _ = preprocess_network_bulk(load_network_from_file_fast(file_path), as_csr = True)
+    degrees_project = preprocess_stub(create_degree_sequence(graph_project))
+
+    return graph_project, degrees_project
+
+  graph, degrees = cache.get_or_build(file_path, build, options)
+  degrees = [int(d) for d in degrees]
+
+  if as_csr :
+    return graph, degrees
+
+  return graph.to_networkx(), degrees
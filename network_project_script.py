@@ -14,6 +14,7 @@ from network_tool_pkg.utils.plot_utils import plot_degree_hist, average_hist
 # 중심성 및 랜덤 모델 생성 클래스
 from network_tool_pkg.analysis.centrality_generator import CentralityCalculator
 from network_tool_pkg.analysis.random_nets_generator import RandomNetGenerator
+from network_tool_pkg.analysis.ensemble_runner import run_ensemble, run_ensemble_adaptive
 
 # 데이터 로더 (사용 시 주석 해제)
 from data_loader_script import load_network_from_file
@@ -52,6 +53,17 @@ print('----- 1단계 : 데이터 전처리가 완료되었습니다 -----')
 N = G_project.number_of_nodes()
 NUM_SIMULATIONS = 100
 
+# 적응형 앙상블 설정 : True이면 표본을 배치 단위로 추가하며 지표 평균이 수렴하면 중단 (MAX_SIMULATIONS는 상한)
+# 🚨 REL_TOL : 95% 신뢰구간 반폭 / |평균|의 목표값, 수렴 여부와 지표별 신뢰수준은 ensemble_report에 기록됨
+ADAPTIVE_ENSEMBLE = False
+REL_TOL = 0.05
+MAX_SIMULATIONS = 1000
+
+# 앙상블 재현성을 위한 master seed 및 병렬 worker 수
+# 🚨 Windows 등 spawn 방식 환경에서 N_WORKERS > 1을 사용하려면 스크립트를 if __name__ == '__main__' 블록 안에서 실행해야 함
+MASTER_SEED = 2013
+N_WORKERS = 1
+
 # ER_P 값 생성
 avg_degree = sum(dict(G_project.degree()).values()) / N
 ER_P = avg_degree / (N - 1)
@@ -81,69 +93,45 @@ print('----- 2단계 : 랜덤 모델 생성기의 설정이 완료되었습니
 original_btw = original_calc.calculate_betweenness_centrality()
 original_cls = original_calc.calculate_closeness_centrality()
 
-# ---------- 앙상블 시뮬레이션 초기화 ----------
+# ---------- 앙상블 시뮬레이션 시작 ----------
 
 # 🚨 해당 분석에서는 BA 모델을 제외한 나머지 세 개만을 비교
+# 🚨 표본마다 MASTER_SEED에서 파생된 독립 seed를 사용하므로 N_WORKERS 값과 관계없이 결과가 동일함
+
+if ADAPTIVE_ENSEMBLE :
+  print('----- 적응형 앙상블 시뮬레이션 시작 (목표 상대 오차 {}, 최대 {}회) -----'.format(REL_TOL, MAX_SIMULATIONS))
+
+  ensemble, ensemble_report = run_ensemble_adaptive(N, degrees_project, ER_P, rel_tol = REL_TOL, max_simulations = MAX_SIMULATIONS, seed = MASTER_SEED, n_workers = N_WORKERS)
+  NUM_SIMULATIONS = ensemble_report['num_simulations']
+
+  for model, metric_report in ensemble_report['metrics'].items() :
+    for metric, info in metric_report.items() :
+      print('[ensemble] {} / {} : 수렴 {} (최대 상대 오차 {:.4f}, 신뢰수준 {:.3f})'.format(model, metric, info['converged'], info['max_rel_error'], info['confidence']))
+
+else :
+  print('----- {}회 앙상블 시뮬레이션 시작 -----'.format(NUM_SIMULATIONS))
+
+  ensemble = run_ensemble(N, degrees_project, ER_P, NUM_SIMULATIONS, seed = MASTER_SEED, n_workers = N_WORKERS)
+
 # Betweenness Centrality 저장 리스트
-er_btw_list = []
-cf_btw_list = []
-cl_btw_list = []
+er_btw_list = ensemble['ER']['btw']
+cf_btw_list = ensemble['Configuration']['btw']
+cl_btw_list = ensemble['Chung-Lu']['btw']
 
 # Closeness Centrality 저장 리스트
-er_cls_list = []
-cf_cls_list = []
-cl_cls_list = []
+er_cls_list = ensemble['ER']['cls']
+cf_cls_list = ensemble['Configuration']['cls']
+cl_cls_list = ensemble['Chung-Lu']['cls']
 
 # 네트워크 특징 비교를 위한 전역 지표 저장 리스트
-er_global_list = []
-cf_global_list = []
-cl_global_list = []
+er_global_list = ensemble['ER']['global']
+cf_global_list = ensemble['Configuration']['global']
+cl_global_list = ensemble['Chung-Lu']['global']
 
 # 네트워크 시각화를 위한 degree 저장 리스트
-er_degree_list = []
-cf_degree_list = []
-cl_degree_list = []
-
-# ---------- 앙상블 시뮬레이션 시작 ----------
-
-print('----- {}회 앙상블 시뮬레이션 시작 -----'.format(NUM_SIMULATIONS))
-
-for i in range(NUM_SIMULATIONS) :
-  
-  # 🚨 DEBUG
-  # print(f'DEBUG P-CHECK : 현재 ER_P 값 = {ER_P}')
-  
-  # 모델 생성
-  G_er = generator.create_er_net(ER_P)
-  G_cf = generator.create_configuration_net()
-  G_cl = generator.create_chunglu_net()
-
-  # 각 모델의 계산기 인스턴스
-  calc_er = CentralityCalculator(G_er)
-  calc_cf = CentralityCalculator(G_cf)
-  calc_cl = CentralityCalculator(G_cl)
-
-  # Betweenness Centrality 계산 및 저장
-  er_btw_list.append(calc_er.calculate_betweenness_centrality())
-  cf_btw_list.append(calc_cf.calculate_betweenness_centrality())
-  cl_btw_list.append(calc_cl.calculate_betweenness_centrality())
-
-  # Closeness Centrality 계산 및 저장
-  er_cls_list.append(calc_er.calculate_closeness_centrality())
-  cf_cls_list.append(calc_cf.calculate_closeness_centrality())
-  cl_cls_list.append(calc_cl.calculate_closeness_centrality())
-
-  # degree 저장
-  er_degree_list.append([d for _, d in G_er.degree()])
-  cf_degree_list.append([d for _, d in G_cf.degree()])
-  cl_degree_list.append([d for _, d in G_cl.degree()])
-
-  # 전역 지표 저장
-  er_global_list.append(calculate_global(G_er))
-  cf_global_list.append(calculate_global(G_cf))
-  cl_global_list.append(calculate_global(G_cl))
-
-  print('[ensemble] {}/{} 완료'.format(i+1, NUM_SIMULATIONS))
+er_degree_list = ensemble['ER']['degree']
+cf_degree_list = ensemble['Configuration']['degree']
+cl_degree_list = ensemble['Chung-Lu']['degree']
 
 print('----- {}회 앙상블 시뮬레이션 완료 -----'.format(NUM_SIMULATIONS))
 print('----- 3단계 : 원본 분포 계산 및 무작위 앙상블 생성이 완료되었습니다 -----')
@@ -273,7 +261,8 @@ print('----- Closeness Centrality 시각화가 완료되었습니다 -----')
 
 fig, ax = plt.subplots(1, 3, figsize = (9, 5))
 
-metric_names = list(original_global_metrics.keys())
+# approx 모드 결과의 APL 신뢰구간 key는 제외하고 세 지표만 비교
+metric_names = ['CC', 'APL', 'DIAM']
 
 original_vals = [original_global_metrics[m] for m in metric_names]
 er_vals = er_global_metrics
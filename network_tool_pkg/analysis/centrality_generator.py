@@ -1,9 +1,14 @@
 import networkx as nx
 import numpy as np
+import random
+from collections import deque
 
-# 🚨 Closeness Centrality 구현 시 지속적인 문제 발생으로 연결되지 않은 그래프에서 LCC 사용하여 내장함수를 바로 사용하는 것으로 변경
-# 🚨 Harmonic Centrality 구현 시 지속적인 문제 발생으로 연결되지 않은 그래프에서 LCC 사용하는 것으로 변경
-from network_tool_pkg.utils.global_utils import get_largest_connected_component
+# 🚨 Closeness / Harmonic Centrality는 연결되지 않은 그래프에서 LCC를 사용하며, 단일 BFS 거리 커널로 함께 계산
+# 🚨 인접 행렬, LCC, 거리 커널 결과는 AnalysisContext에서 한 번만 계산하여 공유
+from network_tool_pkg.utils.context_utils import AnalysisContext
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.profiling_utils import profile_stage
+from network_tool_pkg.utils.spectral_utils import eigenvector_solve, pagerank_solve, katz_solve
 
 # -------------------- 네트워크에 대해 직접 구현된 다양한 중심성 지표를 계산하는 클래스 --------------------
 
@@ -11,38 +16,51 @@ class CentralityCalculator :
 
   # ---------- 클래스 속성 설정 ----------
 
-  def __init__(self, G) :
+  def __init__(self, G, context = None) :
 
-    if not isinstance(G, nx.Graph) :
-      raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 형태로 입력하십시오.')
+    # 🚨 networkx.Graph와 CSRGraph 모두 입력 가능 (모든 계산은 노드 인덱스 기반 인접 배열로 수행)
+    if not isinstance(G, (nx.Graph, CSRGraph)) :
+      raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
 
-    if len(G.nodes()) == 0 :
+    if G.number_of_nodes() == 0 :
       raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
 
-    if len(G.edges()) == 0 :
+    if G.number_of_edges() == 0 :
       raise ValueError('입력한 네트워크는 엣지가 존재하지 않습니다. 중심성 지표를 계산할 수 없습니다.')
     
+    if context is None :
+      context = AnalysisContext(G)
+
+    elif context.G is not G :
+      raise ValueError('입력한 AnalysisContext가 입력한 네트워크에 대한 컨텍스트가 아닙니다.')
+
     self.G = G
-    self.N = len(G.nodes())
-    self.nodes = list(G.nodes())
+    self.context = context
+    self.N = G.number_of_nodes()
+    self.nodes = context.nodes
 
   # ---------- 보조 메서드 (인접 행렬) ----------
 
   def get_adjacency_matrix(self) :
 
-    N = self.N
-    A = np.zeros((N,N))
-    node_to_index = {node: i for i, node in enumerate(self.nodes)}
+    # dense 행렬이 필요한 경우에도 이중 루프 대신 희소 행렬을 변환하여 사용
+    return self.get_sparse_adjacency_matrix().toarray()
+
+  # ---------- 보조 메서드 (희소 인접 행렬, CSR) ----------
+
+  def get_sparse_adjacency_matrix(self) :
+
+    return self.context.adjacency
+
+  # ---------- 보조 메서드 (노드 인덱스 기반 인접 리스트) ----------
 
-    for i, n in enumerate(self.nodes) :
-      for nhb in self.G.neighbors(n) :
-        j = node_to_index[nhb]
-        A[i][j] = 1
+  def get_index_adjacency(self) :
 
-    return A
+    return self.context.index_adjacency
 
   # ---------- Degree Centrality ----------
 
+  @profile_stage('centrality')
   def calculate_degree_centrality(self) :
     
     N = self.N
@@ -51,135 +69,150 @@ class CentralityCalculator :
     if N <= 1 :
       raise ValueError('degree centrality를 계산할 수 없습니다. 네트워크의 노드가 2개 이상이어야 합니다. 현재 노드 수 = {}'.format(N))
 
-    for n in self.G.nodes() :
-      d = len(self.G[n])
+    for n, d in zip(self.nodes, self.context.degrees.tolist()) :
       d_cen[n] = (d/(N-1))
 
     return d_cen
 
   # ---------- Closeness Centrality ----------
 
+  @profile_stage('centrality')
   def calculate_closeness_centrality(self) :
 
-    if nx.is_connected(self.G) :
-      G_use = self.G
-    else : 
-      G_use = get_largest_connected_component(self.G)
-
-    return nx.closeness_centrality(G_use)
+    # 비연결 네트워크는 거리 커널 내부에서 LCC 기준으로 계산됨 (nx.closeness_centrality와 동일한 값)
+    return self.context.distance_metrics()['closeness']
     
   # ---------- Harmonic Centrality ----------
 
+  @profile_stage('centrality')
   def calculate_harmonic_centrality(self) :
 
-    if nx.is_connected(self.G) :
-      G_use = self.G
-    else :
-      G_use = get_largest_connected_component(self.G)
-
-    N = len(G_use.nodes())
-    h_cen = {}
+    metrics = self.context.distance_metrics()
+    N = len(metrics['nodes'])
 
     if N <= 1 :
       raise ValueError('harmonic centrality를 계산할 수 없습니다. 네트워크의 노드가 2개 이상이어야 합니다. 현재 노드 수 = {}'.format(N))
 
-    try : 
-      shortdic = dict(nx.shortest_path(G_use))
-      
-    except Exception :
-      # shortest_path 내장 함수 사용에 있어 disconnected network 발생 시 networkx 내장 함수 사용으로 안전하게 처리
-      return nx.harmonic_centrality(G_use)
+    return metrics['harmonic']
+
+  # ---------- 보조 메서드 (Brandes 단일 source 누적, Betweenness) ----------
+
+  def _single_source_dependency(self, source, adj) :
+
+    # BFS로 source 기준 최단경로 개수(sigma)와 선행 노드(pred)를 구한 뒤 역순으로 의존도(delta)를 누적
+    N = len(adj)
+    sigma = [0] * N
+    dist = [-1] * N
+    pred = [[] for _ in range(N)]
+    order = []
 
-    for n in G_use.nodes() :
-      
-      h_sum = 0
+    sigma[source] = 1
+    dist[source] = 0
+    queue = deque([source])
 
-      for m in G_use.nodes() :
-        if n == m :
-          continue
+    while queue :
+      v = queue.popleft()
+      order.append(v)
+      d_next = dist[v] + 1
 
-        try :
-          dist = len(shortdic[n][m]) - 1
-          
-        except KeyError :
-          # connected한 네트워크나 LCC만 받아서 거의 발생하지 않음
-          continue
+      for w in adj[v] :
+        if dist[w] < 0 :
+          dist[w] = d_next
+          queue.append(w)
 
-        if dist > 0 :
-          h_sum += 1 / dist
+        if dist[w] == d_next :
+          sigma[w] += sigma[v]
+          pred[w].append(v)
 
-      h_cen[n] = h_sum / (N-1)
+    delta = [0.0] * N
 
-    return h_cen
+    while order :
+      w = order.pop()
+      coeff = (1 + delta[w]) / sigma[w]
+
+      for v in pred[w] :
+        delta[v] += sigma[v] * coeff
+
+    delta[source] = 0.0
+
+    return delta
 
   # ---------- Betweenness Centrality ----------
 
-  def calculate_betweenness_centrality(self) :
+  @profile_stage('centrality')
+  def calculate_betweenness_centrality(self, k = None, seed = None) :
+
+    # 🚨 Brandes 알고리즘 : source마다 BFS 1회 + 역순 누적으로 O(N·M)에 계산 (모든 최단경로를 저장하지 않음)
+    # 🚨 k를 지정하면 k개의 pivot source만 무작위로 뽑아 N/k 배율로 보정한 비편향 근사값을 반환
 
     N = self.N
     nodes = self.nodes
-    normalizer = 1/((N-1)*(N-2))
-    b_cen = {n : 0 for n in nodes}    
 
     if N <= 2 :
       raise ValueError('betweenness centrality를 계산할 수 없습니다. 네트워크의 노드가 3개 이상이어야 합니다. 현재 노드 수 = {}'.format(N))
 
-    try :
-      for source in nodes :
-        for target in nodes :
-          if source == target :
-            continue
+    # ---------- pivot 선택 ----------
 
-          try :
-            paths = list(nx.all_shortest_paths(self.G, source, target))
-          
-          except nx.NetworkXNoPath :
-            # 경로가 존재하지 않는 경우는 skip
-            continue
+    if k is not None and (not isinstance(k, int) or k < 1) :
+      raise ValueError('pivot 수 k는 1 이상의 정수여야 합니다. 현재 k 값 = {}'.format(k))
+
+    if k is None or k >= N :
+      sources = range(N)
+      scale = 1.0
+
+    else :
+      sources = random.Random(seed).sample(range(N), k)
+      scale = N / k
 
-          if not paths :
-            continue
+    # ---------- 인덱스 기반 인접 리스트 생성 ----------
 
-          for path in paths :
-            for n in path[1:-1]:
-              b_cen[n] += 1/len(paths)
+    adj = self.get_index_adjacency()
 
-      for node in nodes :
-        b_cen[node] *= normalizer
+    # ---------- source별 의존도 누적 ----------
 
-      return b_cen
+    b_values = [0.0] * N
 
-    except Exception :
-      # 실제 에러가 발생할 경우에는 내장함수를 사용하여 안전하게 처리
-      return nx.betweenness_centrality(self.G, normalized = True)
+    for source in sources :
+      delta = self._single_source_dependency(source, adj)
+
+      for i in range(N) :
+        b_values[i] += delta[i]
+
+    # ---------- 정규화 (순서쌍 기준 1/((N-1)(N-2)), 기존 구현과 동일) ----------
+
+    normalizer = scale / ((N-1)*(N-2))
+
+    return {n : b_values[i] * normalizer for i, n in enumerate(nodes)}
 
   # ---------- Eigenvector Centrality ----------
 
+  @profile_stage('centrality')
   def calculate_eigenvector_centrality(self, max_iter = 100, tol = 1e-6) :
 
     nodes = self.nodes
+    adj = self.get_index_adjacency()
     iter_count = 0
-    old_cen = {n : 1 for n in nodes}
+    old_cen = [1] * self.N
 
     while iter_count < max_iter :
-      new_cen = {}
+      new_cen = []
 
-      for n in nodes :
+      for nhbs in adj :
         s = 0
         
-        for nhb in self.G.neighbors(n) :
-          s += old_cen[nhb]
+        for j in nhbs :
+          s += old_cen[j]
 
-        new_cen[n] = s
+        new_cen.append(s)
 
-      norm = sum(v**2 for v in new_cen.values()) ** 0.5
+      norm = sum(v**2 for v in new_cen) ** 0.5
 
       if norm == 0 :
         return {n : 0 for n in nodes}
 
-      new_cen = {n : (val/norm) for n, val in new_cen.items()}
+      new_cen = [val/norm for val in new_cen]
 
-      threshold = max(abs(new_cen[n] - old_cen[n]) for n in nodes)
+      threshold = max(abs(new - old) for new, old in zip(new_cen, old_cen))
 
       if threshold < tol :
         break
@@ -187,10 +220,11 @@ class CentralityCalculator :
       old_cen = new_cen
       iter_count += 1
 
-    return new_cen
+    return {n : new_cen[i] for i, n in enumerate(nodes)}
 
   # ---------- Eigenvector Centrality (matrix) ----------
 
+  @profile_stage('centrality')
   def calculate_eigenvector_centrality_matrix(self, max_iter = 100, tol = 1e-6) :
 
     N = self.N
@@ -219,3 +253,69 @@ class CentralityCalculator :
       iter_count += 1
 
     return new_cen
+
+  # ---------- Eigenvector Centrality (sparse) ----------
+
+  @profile_stage('centrality')
+  def calculate_eigenvector_centrality_sparse(self, max_iter = 100, tol = 1e-6, method = 'power', x0 = None, shift = 0.0, return_info = False) :
+
+    # 🚨 CSR 인접 행렬을 사용하여 메모리 O(N+M)으로 계산, 결과는 순수 Python 구현과 동일하게 노드 key의 dict로 반환
+    # 🚨 method = 'power' : (shifted) power iteration / 'lanczos' 또는 'arpack' : scipy eigsh(Lanczos) 사용
+    # 🚨 shift > 0이면 (A + shift·I)로 반복하여 bipartite에 가까운 네트워크의 진동을 제거 (shift = 0이면 기존 matrix 구현과 동일)
+    # 🚨 x0 : 시작 벡터 (이전 결과 dict 또는 노드 순서 배열), return_info = True이면 (결과, 수렴 진단 info) 반환
+
+    if method not in ('power', 'arpack', 'lanczos') :
+      raise ValueError("method는 'power', 'lanczos' 또는 'arpack' 이어야 합니다. 현재 method = {}".format(method))
+
+    nodes = self.nodes
+    A = self.get_sparse_adjacency_matrix()
+
+    solver = 'power' if method == 'power' else 'lanczos'
+    vec, info = eigenvector_solve(A, solver, x0 = self._start_vector(x0), shift = shift, max_iter = max_iter, tol = tol)
+
+    result = {n : float(vec[i]) for i, n in enumerate(nodes)}
+
+    return (result, info) if return_info else result
+
+  # ---------- PageRank ----------
+
+  @profile_stage('centrality')
+  def calculate_pagerank(self, alpha = 0.85, max_iter = 100, tol = 1e-6, x0 = None, return_info = False) :
+
+    # 🚨 eigenvector 중심성과 같은 CSR 인접 행렬 / 반복 solver 사용, 결과는 networkx.pagerank와 동일
+
+    vec, info = pagerank_solve(self.get_sparse_adjacency_matrix(), alpha = alpha, x0 = self._start_vector(x0), max_iter = max_iter, tol = tol)
+    result = {n : float(vec[i]) for i, n in enumerate(self.nodes)}
+
+    return (result, info) if return_info else result
+
+  # ---------- Katz Centrality ----------
+
+  @profile_stage('centrality')
+  def calculate_katz_centrality(self, alpha = 0.1, beta = 1.0, max_iter = 1000, tol = 1e-6, normalized = True, x0 = None, return_info = False) :
+
+    # 🚨 alpha는 1/λ₁(인접 행렬의 최대 고유값)보다 작아야 함 (eigenvector 중심성 info['eigenvalue']로 확인 가능), 결과는 networkx.katz_centrality와 동일
+
+    vec, info = katz_solve(self.get_sparse_adjacency_matrix(), alpha = alpha, beta = beta, x0 = self._start_vector(x0),
+                           max_iter = max_iter, tol = tol, normalized = normalized)
+    result = {n : float(vec[i]) for i, n in enumerate(self.nodes)}
+
+    return (result, info) if return_info else result
+
+  # ---------- 보조 메서드 (warm start 시작 벡터 : dict → 노드 순서 배열) ----------
+
+  def _start_vector(self, x0) :
+
+    # 이전 표본의 결과 dict를 그대로 넣을 수 있도록 노드 key로 정렬, 없는 노드는 나머지 값의 평균으로 채움
+    if not isinstance(x0, dict) :
+      return x0
+
+    values = [x0.get(n) for n in self.nodes]
+    known = [v for v in values if v is not None]
+
+    if not known :
+      return None
+
+    fill = float(np.mean(known))
+
+    return np.array([fill if v is None else v for v in values], dtype = np.float64)
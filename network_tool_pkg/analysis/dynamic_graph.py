@@ -0,0 +1,406 @@
+import networkx as nx
+import numpy as np
+from collections import deque
+from scipy.sparse.csgraph import shortest_path
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.matrix_utils import to_csr_adjacency
+from network_tool_pkg.utils.triangle_utils import triangles_from_adjacency
+
+# -------------------- 동적 네트워크 클래스 : 엣지 추가/삭제 시 지표를 처음부터 다시 계산하지 않고 변경분만 갱신하는 클래스 --------------------
+class DynamicGraph :
+
+  # 🚨 degree, 노드별 삼각형 수, local / average clustering : 엣지 변경 1회당 O(deg)로 갱신
+  # 🚨 연결 구성요소 : 엣지 추가는 union-find로 즉시 갱신, 엣지 삭제는 다음 조회 시 한 번만 재구성 (lazy)
+  # 🚨 closeness, harmonic, APL, DIAM : 변경 전 u, v에서의 BFS 2회로 거리가 바뀔 수 있는 source만 골라 다시 BFS
+  #    - 추가 (u, v) : |d(s,u) - d(s,v)| >= 2 (한쪽만 도달 가능한 경우 포함)인 source만 거리 변화
+  #    - 삭제 (u, v) : |d(s,u) - d(s,v)| == 1 (엣지가 s의 최단경로 트리에 포함될 수 있음)인 source만 거리 변화 가능
+  # 🚨 지표의 정의는 calculate_global / CentralityCalculator와 동일 (CC는 전체 노드 평균, 거리 지표는 LCC 기준)
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, G, chunk_size = 256) :
+
+    if not isinstance(G, (nx.Graph, CSRGraph)) :
+      raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+    if isinstance(G, nx.Graph) and (G.is_directed() or G.is_multigraph()) :
+      raise TypeError('동적 네트워크는 무방향 simple 네트워크(networkx.Graph)만 지원합니다.')
+
+    if not isinstance(chunk_size, int) or chunk_size < 1 :
+      raise ValueError('chunk_size는 1 이상의 정수여야 합니다. 현재 chunk_size = {}'.format(chunk_size))
+
+    nodes = G.nodes() if isinstance(G, CSRGraph) else list(G.nodes())
+    A = to_csr_adjacency(G, nodes)
+
+    self.nodes = list(nodes)
+    self.index = {node : i for i, node in enumerate(self.nodes)}
+
+    # 노드 인덱스 기반 인접 집합 (self-loop 제외)
+    indptr = A.indptr.tolist()
+    indices = A.indices.tolist()
+    self.adj = [set(indices[indptr[i]:indptr[i+1]]) - {i} for i in range(len(self.nodes))]
+    self.num_edges = sum(len(nbrs) for nbrs in self.adj) // 2
+
+    self._init_triangles(A)
+    self._rebuild_components()
+    self._init_distance_stats(A, chunk_size)
+
+  # ---------- 기본 조회 ----------
+
+  def number_of_nodes(self) :
+
+    return len(self.nodes)
+
+  def number_of_edges(self) :
+
+    return self.num_edges
+
+  def has_edge(self, u, v) :
+
+    if u not in self.index or v not in self.index :
+      return False
+
+    return self.index[v] in self.adj[self.index[u]]
+
+  def degree(self, node) :
+
+    return len(self.adj[self._node_index(node)])
+
+  def to_networkx(self) :
+
+    G = nx.Graph()
+    G.add_nodes_from(self.nodes)
+    G.add_edges_from((self.nodes[i], self.nodes[j]) for i, nbrs in enumerate(self.adj) for j in nbrs if i < j)
+
+    return G
+
+  def _node_index(self, node) :
+
+    if node not in self.index :
+      raise ValueError('네트워크에 존재하지 않는 노드입니다. 현재 노드 = {}'.format(node))
+
+    return self.index[node]
+
+  # ---------- 노드 / 엣지 변경 ----------
+
+  def add_node(self, node) :
+
+    if node in self.index :
+      return self.index[node]
+
+    i = len(self.nodes)
+    self.nodes.append(node)
+    self.index[node] = i
+    self.adj.append(set())
+
+    # 고립 노드 : 삼각형 0, 자기 자신만 포함한 구성요소, 거리 합 0
+    self.triangles.append(0)
+    self.local_cc.append(0.0)
+    self.parent.append(i)
+    self.comp_size.append(1)
+    self.comp_min.append(i)
+    self._num_components += 1
+
+    self.dist_sum.append(0)
+    self.ecc.append(0)
+    self.harmonic_sum.append(0.0)
+
+    return i
+
+  def add_edge(self, u, v) :
+
+    if u == v :
+      raise ValueError('self-loop는 추가할 수 없습니다. 현재 노드 = {}'.format(u))
+
+    i = self.add_node(u)
+    j = self.add_node(v)
+
+    if j in self.adj[i] :
+      return False
+
+    # 거리 변화 source 판별은 변경 전 거리 기준
+    d_i = self._bfs(i)
+    d_j = self._bfs(j)
+
+    affected = [s for s in range(len(self.nodes)) if self._insert_affects(d_i.get(s), d_j.get(s))]
+
+    self.adj[i].add(j)
+    self.adj[j].add(i)
+    self.num_edges += 1
+    self._update_triangles(i, j, +1)
+
+    self._union(i, j)
+    self._update_distance_stats(affected)
+
+    return True
+
+  def remove_edge(self, u, v) :
+
+    i = self._node_index(u)
+    j = self._node_index(v)
+
+    if j not in self.adj[i] :
+      raise ValueError('네트워크에 존재하지 않는 엣지입니다. 현재 엣지 = ({}, {})'.format(u, v))
+
+    d_i = self._bfs(i)
+    d_j = self._bfs(j)
+
+    affected = [s for s in d_i if abs(d_i[s] - d_j[s]) == 1]
+
+    self.adj[i].discard(j)
+    self.adj[j].discard(i)
+    self.num_edges -= 1
+    self._update_triangles(i, j, -1)
+
+    # 삭제로 구성요소가 나뉠 수 있으므로 다음 조회 시 재구성
+    self._components_dirty = True
+    self._update_distance_stats(affected)
+
+    return True
+
+  @staticmethod
+  def _insert_affects(du, dv) :
+
+    if du is None and dv is None :
+      return False
+
+    if du is None or dv is None :
+      return True
+
+    return abs(du - dv) >= 2
+
+  # ---------- 삼각형 및 클러스터링 계수 ----------
+
+  def _init_triangles(self, A) :
+
+    # 초기 삼각형 수는 degree 순서 기반 행렬 곱 커널로 한 번에 계산
+    self.triangles = triangles_from_adjacency(A).tolist()
+    self.local_cc = [self._local_clustering(i) for i in range(len(self.nodes))]
+    self.clustering_sum = sum(self.local_cc)
+
+  def _local_clustering(self, i) :
+
+    d = len(self.adj[i])
+
+    if d < 2 :
+      return 0.0
+
+    return 2 * self.triangles[i] / (d * (d - 1))
+
+  def _update_triangles(self, i, j, sign) :
+
+    # 엣지 (i, j) 양 끝의 공통 이웃 w마다 삼각형 (i, j, w)가 생성 / 삭제됨 : O(min(deg i, deg j))
+    # 인접 집합을 변경한 이후에 호출 (공통 이웃은 엣지 (i, j) 유무와 관계없이 동일, local clustering은 변경 후 degree 기준)
+    small, large = (self.adj[i], self.adj[j]) if len(self.adj[i]) <= len(self.adj[j]) else (self.adj[j], self.adj[i])
+    common = [w for w in small if w in large]
+
+    self.triangles[i] += sign * len(common)
+    self.triangles[j] += sign * len(common)
+
+    for w in common :
+      self.triangles[w] += sign
+
+    for x in [i, j] + common :
+      new_cc = self._local_clustering(x)
+      self.clustering_sum += new_cc - self.local_cc[x]
+      self.local_cc[x] = new_cc
+
+  def triangle_count(self, node) :
+
+    return self.triangles[self._node_index(node)]
+
+  def clustering(self, node = None) :
+
+    if node is None :
+      return {n : self.local_cc[i] for i, n in enumerate(self.nodes)}
+
+    return self.local_cc[self._node_index(node)]
+
+  def average_clustering(self) :
+
+    if len(self.nodes) == 0 :
+      raise ZeroDivisionError('빈 그래프는 평균 클러스터링 계수를 계산할 수 없습니다.')
+
+    return self.clustering_sum / len(self.nodes)
+
+  # ---------- 연결 구성요소 (union-find) ----------
+
+  def _find(self, i) :
+
+    parent = self.parent
+
+    while parent[i] != i :
+      parent[i] = parent[parent[i]]
+      i = parent[i]
+
+    return i
+
+  def _union(self, i, j) :
+
+    if self._components_dirty :
+      return
+
+    ri = self._find(i)
+    rj = self._find(j)
+
+    if ri == rj :
+      return
+
+    if self.comp_size[ri] < self.comp_size[rj] :
+      ri, rj = rj, ri
+
+    self.parent[rj] = ri
+    self.comp_size[ri] += self.comp_size[rj]
+    self.comp_min[ri] = min(self.comp_min[ri], self.comp_min[rj])
+    self._num_components -= 1
+
+    # 합쳐진 구성요소가 기존 LCC보다 크면 LCC 갱신 (크기가 같으면 먼저 등장한 노드의 구성요소)
+    lcc = self._find(self._lcc_root)
+
+    if (self.comp_size[ri], -self.comp_min[ri]) > (self.comp_size[lcc], -self.comp_min[lcc]) :
+      self._lcc_root = ri
+    else :
+      self._lcc_root = lcc
+
+  def _rebuild_components(self) :
+
+    n = len(self.nodes)
+    self.parent = list(range(n))
+    self.comp_size = [1] * n
+    self.comp_min = list(range(n))
+    self._num_components = n
+    self._lcc_root = 0
+    self._components_dirty = False
+
+    for i, nbrs in enumerate(self.adj) :
+      for j in nbrs :
+        if i < j :
+          self._union(i, j)
+
+  def _ensure_components(self) :
+
+    if self._components_dirty :
+      self._rebuild_components()
+
+  def num_components(self) :
+
+    self._ensure_components()
+
+    return self._num_components
+
+  def lcc_size(self) :
+
+    if len(self.nodes) == 0 :
+      return 0
+
+    self._ensure_components()
+
+    return self.comp_size[self._find(self._lcc_root)]
+
+  def lcc_index(self) :
+
+    if len(self.nodes) == 0 :
+      return []
+
+    self._ensure_components()
+    root = self._find(self._lcc_root)
+
+    return [i for i in range(len(self.nodes)) if self._find(i) == root]
+
+  # ---------- source별 거리 통계 (거리 합, eccentricity, harmonic 합) ----------
+
+  def _init_distance_stats(self, A, chunk_size) :
+
+    n = len(self.nodes)
+    self.dist_sum = [0] * n
+    self.ecc = [0] * n
+    self.harmonic_sum = [0.0] * n
+
+    for start in range(0, n, chunk_size) :
+      sources = np.arange(start, min(start + chunk_size, n))
+      D = shortest_path(A, method = 'D', directed = False, unweighted = True, indices = sources)
+
+      finite = np.isfinite(D)
+      D_finite = np.where(finite, D, 0.0)
+
+      with np.errstate(divide = 'ignore') :
+        inv = np.where(D_finite > 0, 1.0 / D_finite, 0.0)
+
+      for k, s in enumerate(sources.tolist()) :
+        self.dist_sum[s] = int(D_finite[k].sum())
+        self.ecc[s] = int(D_finite[k].max())
+        self.harmonic_sum[s] = float(inv[k].sum())
+
+  def _bfs(self, source) :
+
+    dist = {source : 0}
+    queue = deque([source])
+
+    while queue :
+      v = queue.popleft()
+      d_next = dist[v] + 1
+
+      for w in self.adj[v] :
+        if w not in dist :
+          dist[w] = d_next
+          queue.append(w)
+
+    return dist
+
+  def _update_distance_stats(self, sources) :
+
+    for s in sources :
+      dist = self._bfs(s)
+      values = list(dist.values())
+
+      self.dist_sum[s] = sum(values)
+      self.ecc[s] = max(values)
+      self.harmonic_sum[s] = sum(1.0 / d for d in values if d > 0)
+
+  # ---------- LCC 기반 거리 지표 ----------
+
+  def distance_metrics(self) :
+
+    # calculate_distance_metrics와 같은 형태로 반환 (source별 통계는 이미 최신 상태이므로 O(N))
+    lcc_idx = self.lcc_index()
+    lcc_nodes = [self.nodes[i] for i in lcc_idx]
+    n = len(lcc_idx)
+
+    if n <= 1 :
+      return {'nodes' : lcc_nodes,
+              'closeness' : {node : 0.0 for node in lcc_nodes},
+              'harmonic' : {node : 0.0 for node in lcc_nodes},
+              'eccentricity' : {node : 0 for node in lcc_nodes},
+              'APL' : np.nan, 'DIAM' : np.nan}
+
+    return {'nodes' : lcc_nodes,
+            'closeness' : {self.nodes[i] : (n - 1) / self.dist_sum[i] for i in lcc_idx},
+            'harmonic' : {self.nodes[i] : self.harmonic_sum[i] / (n - 1) for i in lcc_idx},
+            'eccentricity' : {self.nodes[i] : self.ecc[i] for i in lcc_idx},
+            'APL' : sum(self.dist_sum[i] for i in lcc_idx) / (n * (n - 1)),
+            'DIAM' : max(self.ecc[i] for i in lcc_idx)}
+
+  def closeness_centrality(self) :
+
+    return self.distance_metrics()['closeness']
+
+  def harmonic_centrality(self) :
+
+    return self.distance_metrics()['harmonic']
+
+  # ---------- 전역 지표 (calculate_global과 동일한 형태) ----------
+
+  def global_metrics(self) :
+
+    if len(self.nodes) == 0 :
+      return {'CC' : np.nan, 'APL' : np.nan, 'DIAM' : np.nan}
+
+    cc = self.average_clustering()
+
+    if len(self.nodes) == 1 :
+      return {'CC' : cc, 'APL' : 0.0, 'DIAM' : 0}
+
+    metrics = self.distance_metrics()
+
+    return {'CC' : cc, 'APL' : metrics['APL'], 'DIAM' : metrics['DIAM']}
@@ -0,0 +1,247 @@
+import numpy as np
+from scipy.stats import norm
+from concurrent.futures import ProcessPoolExecutor
+
+from network_tool_pkg.analysis.centrality_generator import CentralityCalculator
+from network_tool_pkg.analysis.random_nets_generator import RandomNetGenerator
+from network_tool_pkg.utils.global_utils import calculate_global
+from network_tool_pkg.utils.context_utils import AnalysisContext
+from network_tool_pkg.utils.average_utils import EnsembleAccumulator
+from network_tool_pkg.utils.profiling_utils import profile_block, count
+
+# 앙상블에서 비교하는 랜덤 모델 (BA 모델은 본 분석에서 제외)
+ENSEMBLE_MODELS = ['ER', 'Configuration', 'Chung-Lu']
+
+# 적응형 앙상블에서 수렴 여부를 추적하는 지표 (degree는 모델 입력에 가까워 제외)
+ADAPTIVE_METRICS = ['btw', 'cls', 'global']
+
+# -------------------- 보조 함수 : SeedSequence로부터 random.Random에 사용할 정수 seed 생성 --------------------
+def _seed_from_sequence(seed_seq) :
+
+  state = seed_seq.generate_state(2, dtype = np.uint64)
+
+  return (int(state[0]) << 64) | int(state[1])
+
+
+
+
+
+# -------------------- 보조 함수 : 표본 하나에 대해 세 모델 생성 및 지표 계산 (프로세스 풀에서 실행) --------------------
+def _run_single_sample(args) :
+
+  N_nodes, degrees, er_p, seed_seq = args
+
+  # 모델마다 독립된 하위 스트림을 사용하여 모델 간 난수 사용량이 서로 영향을 주지 않도록 함
+  model_seeds = seed_seq.spawn(len(ENSEMBLE_MODELS))
+  sample = {}
+
+  for model, model_seed in zip(ENSEMBLE_MODELS, model_seeds) :
+    # 계측이 켜져 있으면 모델 label이 안쪽 생성기 / 중심성 / 전역 지표 단계에 함께 기록됨
+    with profile_block('ensemble_sample', category = 'ensemble', model = model) :
+      generator = RandomNetGenerator(N_nodes = N_nodes, initial_degrees = degrees, seed = _seed_from_sequence(model_seed))
+
+      if model == 'ER' :
+        G = generator.create_er_net(er_p)
+      elif model == 'Configuration' :
+        G = generator.create_configuration_net()
+      else :
+        G = generator.create_chunglu_net()
+
+      # 표본 하나의 구성요소 / 거리 커널 결과를 centrality와 전역 지표 계산에서 공유
+      context = AnalysisContext(G)
+      calc = CentralityCalculator(G, context = context)
+
+      # 큰 표본에서 APL을 추정(approx)하는 경우에도 표본 seed stream에서 seed를 받아 결과가 항상 동일하도록 함
+      sample[model] = {'btw' : calc.calculate_betweenness_centrality(),
+                       'cls' : calc.calculate_closeness_centrality(),
+                       'degree' : context.degrees.tolist(),
+                       'global' : calculate_global(G, context = context, seed = _seed_from_sequence(model_seed.spawn(1)[0]))}
+
+  return sample
+
+
+
+
+
+# -------------------- 앙상블 실행 함수 : 프로세스 풀로 표본을 병렬 생성하고 모델별 결과 리스트를 반환 --------------------
+def run_ensemble(N_nodes, degrees, er_p, num_simulations, seed = None, n_workers = 1, verbose = True) :
+
+  # 🚨 master seed 하나에서 표본별 독립 seed stream을 spawn하므로 n_workers와 관계없이 결과가 항상 동일함
+  # 🚨 반환값 : {'ER' : {'btw' : [...], 'cls' : [...], 'degree' : [...], 'global' : [...]}, 'Configuration' : ..., 'Chung-Lu' : ...}
+  #           각 리스트는 ensemble_average / average_hist에 그대로 입력 가능
+
+  # ---------- 입력 검증 (예외 처리) ----------
+
+  if not isinstance(num_simulations, int) or num_simulations < 1 :
+    raise ValueError('앙상블 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(num_simulations))
+
+  if not isinstance(n_workers, int) or n_workers < 1 :
+    raise ValueError('worker 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(n_workers))
+
+  # ---------- 표본별 seed stream 생성 ----------
+
+  # seed에는 정수 또는 상위 작업(배치 실행 등)에서 spawn된 SeedSequence를 그대로 전달 가능
+  root_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+  sample_seeds = root_seed.spawn(num_simulations)
+  tasks = [(N_nodes, degrees, er_p, s) for s in sample_seeds]
+
+  results = {model : {'btw' : [], 'cls' : [], 'degree' : [], 'global' : []} for model in ENSEMBLE_MODELS}
+
+  def collect(i, sample) :
+    count('ensemble_samples')
+
+    for model in ENSEMBLE_MODELS :
+      for key, value in sample[model].items() :
+        results[model][key].append(value)
+
+    if verbose :
+      print('[ensemble] {}/{} 완료'.format(i+1, num_simulations))
+
+  # ---------- 표본 실행 (순서 보존) ----------
+
+  if n_workers == 1 :
+    for i, task in enumerate(tasks) :
+      collect(i, _run_single_sample(task))
+
+  else :
+    chunksize = max(1, num_simulations // (4 * n_workers))
+
+    with ProcessPoolExecutor(max_workers = n_workers) as executor :
+      for i, sample in enumerate(executor.map(_run_single_sample, tasks, chunksize = chunksize)) :
+        collect(i, sample)
+
+  return results
+
+
+
+
+
+# -------------------- 보조 함수 : 지표 하나의 누적 결과로 수렴 정도 계산 --------------------
+def _convergence_of(accumulator, z, rel_tol, abs_tol) :
+
+  # 🚨 key(노드 또는 CC / APL / DIAM)별 신뢰구간 반폭 h = z · stderr를 |mean|으로 나눈 상대 오차 중 최댓값으로 판단
+  # 🚨 h <= max(rel_tol · |mean|, abs_tol)이면 수렴 (평균이 0에 가까운 말단 노드는 abs_tol 기준)
+  # 🚨 confidence : 모든 key가 rel_tol 이내일 때 보장되는 최소 신뢰수준 (가장 느린 key 기준)
+
+  stats = accumulator.finalize_stats()
+  mean = np.abs(stats['mean'])
+  stderr = stats['stderr']
+  half_width = z * stderr
+  tolerance = np.maximum(rel_tol * mean, abs_tol)
+
+  with np.errstate(invalid = 'ignore', divide = 'ignore') :
+    rel_error = np.where(half_width > 0, half_width / mean, 0.0)
+    key_confidence = np.where(stderr > 0, 2 * norm.cdf(tolerance / stderr) - 1, 1.0)
+
+  # 표본이 1개뿐인 key는 분산을 알 수 없으므로 미수렴
+  undefined = np.isnan(stderr)
+  rel_error = np.where(undefined, np.inf, rel_error)
+  key_confidence = np.where(undefined, 0.0, key_confidence)
+
+  worst = int(np.argmax(np.where(undefined, np.inf, half_width - tolerance)))
+
+  return {'converged' : bool(not undefined.any() and (half_width <= tolerance).all()),
+          'num_keys' : len(stats['keys']),
+          'num_converged_keys' : int(((half_width <= tolerance) & ~undefined).sum()),
+          'max_rel_error' : float(np.max(rel_error)),
+          'confidence' : float(np.min(key_confidence)),
+          'worst_key' : stats['keys'][worst]}
+
+
+
+
+
+# -------------------- 적응형 앙상블 실행 함수 : 배치 단위로 표본을 추가하며 지표 평균의 표준오차가 충분히 작아지면 중단 --------------------
+def run_ensemble_adaptive(N_nodes, degrees, er_p, rel_tol = 0.05, max_simulations = 1000, min_simulations = 20, batch_size = 10,
+                          confidence = 0.95, abs_tol = 1e-4, metrics = ADAPTIVE_METRICS, seed = None, n_workers = 1, verbose = True) :
+
+  # 🚨 모델별 / 지표별(노드별 betweenness·closeness 평균, CC / APL / DIAM)로 EnsembleAccumulator에 표준오차를 누적하고
+  #    배치가 끝날 때마다 모든 모델의 모든 지표가 수렴했는지 확인 → 수렴 또는 max_simulations 도달 시 중단
+  # 🚨 표본 seed는 같은 root SeedSequence에서 배치마다 이어서 spawn하므로 표본 k개의 결과는 run_ensemble(..., k, seed)와 동일함
+  # 🚨 반환값 : (run_ensemble과 같은 형태의 결과, report)
+  #           report = {'num_simulations', 'converged', 'stop_reason', 'confidence', 'rel_tol', 'metrics' : {model : {metric : 수렴 정보}}}
+
+  # ---------- 입력 검증 (예외 처리) ----------
+
+  if not isinstance(max_simulations, int) or max_simulations < 1 :
+    raise ValueError('최대 앙상블 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(max_simulations))
+
+  if not isinstance(min_simulations, int) or min_simulations < 2 :
+    raise ValueError('최소 앙상블 수는 2 이상의 정수여야 합니다. 현재 값 = {}'.format(min_simulations))
+
+  if not isinstance(batch_size, int) or batch_size < 1 :
+    raise ValueError('배치 크기는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(batch_size))
+
+  if not isinstance(n_workers, int) or n_workers < 1 :
+    raise ValueError('worker 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(n_workers))
+
+  if not rel_tol > 0 or abs_tol < 0 :
+    raise ValueError('rel_tol은 0보다 크고 abs_tol은 0 이상이어야 합니다. 현재 값 = {}, {}'.format(rel_tol, abs_tol))
+
+  if not 0 < confidence < 1 :
+    raise ValueError('신뢰수준은 0과 1 사이여야 합니다. 현재 값 = {}'.format(confidence))
+
+  unknown = [metric for metric in metrics if metric not in ADAPTIVE_METRICS]
+
+  if unknown or not metrics :
+    raise ValueError('추적할 지표는 {} 중에서 선택하십시오. 현재 값 = {}'.format(ADAPTIVE_METRICS, list(metrics)))
+
+  # ---------- 배치 실행 준비 ----------
+
+  root_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+  z = float(norm.ppf(0.5 + confidence / 2))
+
+  results = {model : {'btw' : [], 'cls' : [], 'degree' : [], 'global' : []} for model in ENSEMBLE_MODELS}
+  accumulators = {model : {metric : EnsembleAccumulator() for metric in metrics} for model in ENSEMBLE_MODELS}
+
+  num_done = 0
+  report = None
+  executor = ProcessPoolExecutor(max_workers = n_workers) if n_workers > 1 else None
+
+  try :
+    while True :
+      size = min(batch_size, max_simulations - num_done)
+      tasks = [(N_nodes, degrees, er_p, s) for s in root_seed.spawn(size)]
+
+      if executor is None :
+        samples = map(_run_single_sample, tasks)
+      else :
+        samples = executor.map(_run_single_sample, tasks, chunksize = max(1, size // (4 * n_workers)))
+
+      for sample in samples :
+        count('ensemble_samples')
+
+        for model in ENSEMBLE_MODELS :
+          for key, value in sample[model].items() :
+            results[model][key].append(value)
+
+          for metric in metrics :
+            accumulators[model][metric].update(sample[model][metric])
+
+      num_done += size
+
+      # ---------- 수렴 확인 (배치마다) ----------
+
+      convergence = {model : {metric : _convergence_of(accumulators[model][metric], z, rel_tol, abs_tol) for metric in metrics}
+                     for model in ENSEMBLE_MODELS}
+      flags = [info['converged'] for model in convergence.values() for info in model.values()]
+      converged = all(flags)
+
+      if verbose :
+        print('[ensemble] {}개 표본 완료 (수렴한 모델·지표 {}/{}, 목표 상대 오차 {})'.format(num_done, sum(flags), len(flags), rel_tol))
+
+      if (converged and num_done >= min_simulations) or num_done >= max_simulations :
+        report = {'num_simulations' : num_done,
+                  'converged' : converged,
+                  'stop_reason' : 'converged' if converged and num_done >= min_simulations else 'max_simulations',
+                  'confidence' : confidence,
+                  'rel_tol' : rel_tol,
+                  'abs_tol' : abs_tol,
+                  'metrics' : convergence}
+        break
+
+  finally :
+    if executor is not None :
+      executor.shutdown()
+
+  return results, report
@@ -2,6 +2,51 @@ import networkx as nx
 import numpy as np
 import random
 import itertools
+import math
+
+from network_tool_pkg.utils.csr_graph import CSRGraph, EnsembleEdges
+from network_tool_pkg.utils.degree_utils import create_degree_sequence
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
+# -------------------- 보조 함수 : 노드쌍 선형 인덱스 t를 (i, j) (i < j) 노드쌍으로 변환 --------------------
+def _linear_index_to_pairs(t) :
+
+  # 노드쌍 (i, j)를 j 행 순서로 나열 : t = j(j-1)/2 + i
+  t = np.asarray(t, dtype = np.int64)
+  j = np.floor((1 + np.sqrt(1 + 8 * t.astype(np.float64))) / 2).astype(np.int64)
+
+  # 부동소수점 오차 보정
+  j -= (j * (j - 1) // 2 > t)
+  j += ((j + 1) * j // 2 <= t)
+
+  i = t - j * (j - 1) // 2
+
+  return i, j
+
+# -------------------- 보조 함수 : 길이 total인 Bernoulli(p) 수열에서 성공 위치를 기하분포 skip으로 생성 --------------------
+def _geometric_skip_positions(np_rng, p, total) :
+
+  if p == 0 or total == 0 :
+    return np.empty(0, dtype = np.int64)
+
+  if p == 1 :
+    return np.arange(total, dtype = np.int64)
+
+  chunks = []
+  last = -1
+  expected = total * p
+
+  while True :
+    batch = int(expected + 5 * np.sqrt(expected) + 16)
+    positions = last + np.cumsum(np_rng.geometric(p, size = batch))
+    chunks.append(positions[positions < total])
+
+    if positions[-1] >= total :
+      break
+
+    last = positions[-1]
+
+  return np.concatenate(chunks)
 
 # -------------------- 네트워크에 대해 다양한 랜덤 모델을 생성하는 클래스 --------------------
 
@@ -9,12 +54,34 @@ class RandomNetGenerator:
 
   # ---------- 클래스 속성 설정 ----------
 
-  def __init__(self, N_nodes, initial_degrees):
+  def __init__(self, N_nodes, initial_degrees, seed = None):
     
     self.N = N_nodes
     self.degrees = initial_degrees # Configuration/Chung-Lu에 필요
     self.total_degree = sum(initial_degrees) if initial_degrees else 0
 
+    # 🚨 seed를 지정하면 인스턴스 전용 난수 스트림을 사용 (재현 가능), 미지정 시 기존처럼 전역 random 모듈 사용
+    self.rng = random.Random(seed) if seed is not None else random
+
+    # 벡터화된 고속 생성기(*_fast)에서 사용하는 NumPy 난수 생성기
+    self.np_rng = np.random.default_rng(seed)
+
+    # edge swap chain 상태 (create_edge_swap_net 호출 사이에 유지)
+    self._swap_u = None
+    self._swap_v = None
+    self._swap_keys = None
+    self.swap_stats = None
+
+  # ---------- 생성 메서드 (네트워크로부터 생성기 설정) ----------
+
+  @classmethod
+  def from_graph(cls, G, seed = None) :
+
+    # networkx.Graph와 CSRGraph 모두 입력 가능 (노드 수와 degree sequence를 추출)
+    degrees = create_degree_sequence(G)
+
+    return cls(N_nodes = len(degrees), initial_degrees = degrees, seed = seed)
+
   # ---------- 보조 메서드 (선호적 연결 대상 선택, BA 모델) ----------
 
   def choose_target_node(self, existing_nodes, graph) :
@@ -23,7 +90,7 @@ class RandomNetGenerator:
     total_degree = sum(degrees)
 
     if total_degree == 0 :
-      return random.choice(existing_nodes)
+      return self.rng.choice(existing_nodes)
 
     probs = [d / total_degree for d in degrees]
     
@@ -35,7 +102,7 @@ class RandomNetGenerator:
       cumulative_weights.append(cum_sum)
 
     total = sum(probs)
-    r = random.uniform(0, total)
+    r = self.rng.uniform(0, total)
     
     for i, cw in enumerate(cumulative_weights) :
 
@@ -48,6 +115,7 @@ class RandomNetGenerator:
   # 1. ER Model (G(N, p)) 구현
   # ====================================================================
     
+  @profile_stage('generator')
   def create_er_net(self, p) :
 
     # ---------- 확률 p 검증 (예외 처리)  ----------
@@ -61,15 +129,51 @@ class RandomNetGenerator:
     # ---------- itertools.combinations를 사용하여 모든 가능한 노드쌍을 효율적으로 탐색 ---------
         
     for i, j in itertools.combinations(G_er.nodes, 2):
-      if random.random() < p:
+      if self.rng.random() < p:
         G_er.add_edge(i, j)
                 
     return G_er
 
+  # ====================================================================
+  # 1-1. ER Model 고속 구현 (geometric skip sampling)
+  # ====================================================================
+
+  @profile_stage('generator')
+  def create_er_net_fast(self, p, as_csr = False) :
+
+    # 🚨 모든 노드쌍을 검사하지 않고 선택된 노드쌍 사이의 간격을 기하분포로 뽑아 건너뜀 → O(N+M)
+    # 🚨 각 노드쌍이 독립적으로 확률 p로 선택되므로 create_er_net과 동일한 G(N, p) 분포
+
+    # ---------- 확률 p 검증 (예외 처리)  ----------
+
+    if not (0 <= p <= 1) :
+      raise ValueError(f"Error: {p}가 0과 1 사이 값이 아닙니다.")
+
+    N = self.N
+    total_pairs = N * (N - 1) // 2
+
+    # ---------- 선택된 노드쌍의 선형 인덱스 생성 ----------
+
+    selected = _geometric_skip_positions(self.np_rng, p, total_pairs)
+
+    # ---------- ER 그래프 생성 (엣지 일괄 추가) ----------
+
+    i, j = _linear_index_to_pairs(selected)
+
+    if as_csr :
+      return CSRGraph.from_edges(N, np.stack([i, j], axis = 1))
+
+    G_er = nx.Graph()
+    G_er.add_nodes_from(range(N))
+    G_er.add_edges_from(zip(i.tolist(), j.tolist()))
+
+    return G_er
+
   # ====================================================================
   # 2. Configuration Model 구현
   # ====================================================================
       
+  @profile_stage('generator')
   def create_configuration_net(self) :
 
     degree_sequence = self.degrees
@@ -102,7 +206,7 @@ class RandomNetGenerator:
 
     # ---------- stub list 무작위화 ----------
 
-    random.shuffle(stub_list)
+    self.rng.shuffle(stub_list)
 
     # ---------- Configuration 그래프 생성 및 노드 추가 ----------
 
@@ -122,10 +226,200 @@ class RandomNetGenerator:
 
     return nx.Graph(G_config)
     
+  # ====================================================================
+  # 2-1. Configuration Model 고속 구현 (벡터화 stub matching)
+  # ====================================================================
+
+  def _stub_array(self) :
+
+    ERR_MENT = 'network_pkg.utils.degree_utils.create_degree_sequence()로 전처리를 먼저 실행하십시오.'
+
+    # ---------- degree sequence 검증 (벡터화 예외 처리)  ----------
+
+    if not isinstance(self.degrees, (list, np.ndarray)) :
+      raise TypeError('입력한 degree sequence의 형태가 올바르지 않습니다. ' + ERR_MENT)
+
+    degree_sequence = np.asarray(self.degrees)
+
+    if degree_sequence.size == 0 :
+      raise ValueError('입력한 degree sequence는 빈 list 입니다. ' + ERR_MENT)
+
+    if degree_sequence.ndim != 1 or not np.issubdtype(degree_sequence.dtype, np.integer) :
+      raise ValueError('입력한 degree sequence에는 정수 형태만 포함되어야합니다. ' + ERR_MENT)
+
+    if (degree_sequence < 0).any() :
+      raise ValueError('입력한 degree sequence에 음수 degree가 포함되어 있습니다. ' + ERR_MENT)
+
+    # ---------- stub 배열 생성 ----------
+
+    stubs = np.repeat(np.arange(len(degree_sequence), dtype = np.int64), degree_sequence)
+
+    if len(stubs) % 2 == 1 :
+      raise ValueError('stub의 합({})이 홀수입니다. '.format(len(stubs)) + ERR_MENT)
+
+    return stubs
+
+  @profile_stage('generator')
+  def create_configuration_net_fast(self, return_edges = False, as_csr = False) :
+
+    # 🚨 stub 생성(np.repeat) → 1회 순열 → self-loop 및 multi-edge 제거(packed key unique)를 모두 NumPy로 처리
+    # 🚨 return_edges = True 이면 networkx 그래프 대신 (M, 2) 엣지 배열을, as_csr = True 이면 CSRGraph를 반환
+
+    # ---------- degree sequence 검증 및 stub 배열 생성 ----------
+
+    stubs = self._stub_array()
+    n = len(self.degrees)
+
+    # ---------- stub 배열 무작위화 ----------
+
+    pairs = self.np_rng.permutation(stubs).reshape(-1, 2)
+
+    # ---------- self-loop 제거 및 multi-edge 중복 제거 ----------
+
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    u = pairs.min(axis = 1)
+    v = pairs.max(axis = 1)
+
+    keys = np.unique(u * n + v)
+    edges = np.stack([keys // n, keys % n], axis = 1)
+
+    if return_edges :
+      return edges
+
+    if as_csr :
+      return CSRGraph.from_edges(self.N, edges)
+
+    # ---------- Configuration 그래프 생성 (엣지 일괄 추가) ----------
+
+    G_config = nx.Graph()
+    G_config.add_nodes_from(range(self.N))
+    G_config.add_edges_from(edges.tolist())
+
+    return G_config
+
+  # ====================================================================
+  # 2-2. Degree 보존 Edge Swap Model (double edge swap MCMC)
+  # ====================================================================
+
+  def _init_edge_swap_chain(self, G) :
+
+    # ---------- 시작 네트워크 → 노드 인덱스 엣지 리스트 + hash set ----------
+
+    if G is None :
+      # 시작 네트워크가 없으면 degree sequence를 정확히 갖는 Havel-Hakimi 네트워크에서 시작 (구조가 치우쳐 있으므로 swap으로 충분히 섞어야 함)
+      if not nx.is_graphical(list(self.degrees)) :
+        raise ValueError('degree sequence를 정확히 갖는 simple network가 존재하지 않습니다. 시작 네트워크 G를 입력하십시오.')
+
+      G = nx.havel_hakimi_graph(list(self.degrees))
+
+    degrees = create_degree_sequence(G)
+
+    if len(degrees) != self.N or list(degrees) != list(self.degrees) :
+      raise ValueError('시작 네트워크의 degree sequence가 생성기의 degree sequence와 다릅니다. RandomNetGenerator.from_graph(G)로 생성기를 설정하십시오.')
+
+    if isinstance(G, CSRGraph) :
+      edges = G.edges()
+    else :
+      node_to_index = {node : i for i, node in enumerate(G.nodes())}
+      edges = np.array([(node_to_index[u], node_to_index[v]) for u, v in G.edges()], dtype = np.int64).reshape(-1, 2)
+
+    if len(edges) < 2 :
+      raise ValueError('edge swap에는 엣지가 2개 이상 필요합니다. 현재 엣지 수 = {}'.format(len(edges)))
+
+    u = edges.min(axis = 1).tolist()
+    v = edges.max(axis = 1).tolist()
+
+    self._swap_u = u
+    self._swap_v = v
+    self._swap_keys = {a * self.N + b for a, b in zip(u, v)}
+
+  @profile_stage('generator')
+  def create_edge_swap_net(self, G = None, swaps_per_edge = 10, as_csr = False) :
+
+    # 🚨 엣지 두 개 (u, v), (x, y)를 골라 (u, x), (v, y) 또는 (u, y), (v, x)로 교체 → 모든 노드의 degree가 정확히 보존됨
+    #    - self-loop 또는 이미 있는 엣지가 생기는 교체는 거부 (표본은 항상 simple network)
+    #    - 엣지 존재 확인은 hash set(u·N + v)으로 O(1), 시도 1회는 O(1)
+    # 🚨 G를 입력하면 G에서 chain을 새로 시작하고, 생략하면 직전 표본에서 이어서 swap (표본마다 처음부터 만들지 않음)
+    #    → 처음 호출할 때 G도 없으면 Havel-Hakimi 네트워크에서 시작
+    # 🚨 swaps_per_edge · M 번 swap을 시도한 뒤의 상태를 표본으로 반환 (거부된 시도도 chain의 한 단계로 셈)
+    #    → 연속 표본 사이의 상관을 줄이려면 swaps_per_edge를 충분히 크게 설정 (기본 10)
+    # 🚨 시도 / 성공 횟수는 self.swap_stats에 기록
+
+    if not isinstance(swaps_per_edge, (int, float)) or swaps_per_edge <= 0 :
+      raise ValueError('swaps_per_edge는 0보다 커야 합니다. 현재 값 = {}'.format(swaps_per_edge))
+
+    if G is not None or self._swap_keys is None :
+      self._init_edge_swap_chain(G)
+
+    N = self.N
+    u_list = self._swap_u
+    v_list = self._swap_v
+    keys = self._swap_keys
+    M = len(u_list)
+
+    n_attempts = int(round(swaps_per_edge * M))
+    accepted = 0
+    batch_size = 1 << 16
+
+    # ---------- swap 시도 (난수는 batch 단위로 미리 생성) ----------
+
+    for start in range(0, n_attempts, batch_size) :
+      size = min(batch_size, n_attempts - start)
+      picks = self.np_rng.integers(0, M, size = (size, 2)).tolist()
+      flips = (self.np_rng.random(size) < 0.5).tolist()
+
+      for (i, j), flip in zip(picks, flips) :
+        if i == j :
+          continue
+
+        u, v = u_list[i], v_list[i]
+
+        if flip :
+          y, x = u_list[j], v_list[j]
+        else :
+          x, y = u_list[j], v_list[j]
+
+        # 교체 후 엣지 : (u, x), (v, y)
+        if u == x or v == y :
+          continue
+
+        a, b = (u, x) if u < x else (x, u)
+        c, d = (v, y) if v < y else (y, v)
+        key_ab = a * N + b
+        key_cd = c * N + d
+
+        if key_ab in keys or key_cd in keys :
+          continue
+
+        keys.discard(u * N + v)
+        keys.discard(u_list[j] * N + v_list[j])
+        keys.add(key_ab)
+        keys.add(key_cd)
+
+        u_list[i], v_list[i] = a, b
+        u_list[j], v_list[j] = c, d
+        accepted += 1
+
+    self.swap_stats = {'attempted' : n_attempts, 'accepted' : accepted}
+
+    # ---------- 표본 네트워크 생성 (chain 상태는 다음 호출을 위해 유지) ----------
+
+    edges = np.stack([np.asarray(u_list, dtype = np.int64), np.asarray(v_list, dtype = np.int64)], axis = 1)
+
+    if as_csr :
+      return CSRGraph.from_edges(N, edges)
+
+    G_swap = nx.Graph()
+    G_swap.add_nodes_from(range(N))
+    G_swap.add_edges_from(edges.tolist())
+
+    return G_swap
+
   # ====================================================================
   # 3. Chung-Lu Model 구현
   # ====================================================================
   
+  @profile_stage('generator')
   def create_chunglu_net(self) :
 
     degree_sequence = self.degrees
@@ -148,18 +442,106 @@ class RandomNetGenerator:
 
         p_ij = max(0, min(1, p_ij))
 
-        if random.random() < p_ij :
+        if self.rng.random() < p_ij :
           G_chu.add_edge(i, j)
 
     return G_chu
   
+  # ====================================================================
+  # 3-1. Chung-Lu Model 고속 구현 (weight 정렬 + geometric skip sampling)
+  # ====================================================================
+
+  def _skip_sample_range(self, u, lo, hi, weights, scale, edges) :
+
+    # weights가 내림차순이므로 구간 [lo, hi)에서 p_uv = w_u·w_v / scale은 단조 감소
+    # 현재 확률 p로 기하분포 skip 후 q/p 확률로 채택 (Miller-Hagberg 방식)
+    w_u = weights[u]
+    v = lo
+    p = min(1.0, w_u * weights[v] / scale) if v < hi else 0.0
+
+    while v < hi and p > 0 :
+      if p < 1 :
+        r = 1.0 - self.rng.random()
+        v += int(math.log(r) / math.log(1.0 - p))
+
+      if v < hi :
+        q = min(1.0, w_u * weights[v] / scale)
+
+        if self.rng.random() < q / p :
+          edges.append((u, v))
+
+        p = q
+        v += 1
+
+  @profile_stage('generator')
+  def create_chunglu_net_fast(self, clip = 'max_degree', as_csr = False) :
+
+    # 🚨 노드를 weight(기대 차수) 내림차순으로 정렬한 뒤 행마다 기하분포로 건너뛰며 엣지를 선택 → O(N+M)
+    # 🚨 clip = 'max_degree' : create_chunglu_net과 동일하게 p_ij > 1인 경우 k_i·k_j / max(k)² 사용
+    #    clip = 'one' : p_ij = min(1, k_i·k_j / 2m)
+
+    if clip not in ('max_degree', 'one') :
+      raise ValueError("clip은 'max_degree' 또는 'one' 이어야 합니다. 현재 clip = {}".format(clip))
+
+    degree_sequence = self.degrees
+    n = len(degree_sequence)
+    total_degree = sum(degree_sequence)
+
+    if total_degree == 0 :
+      raise ValueError('데이터 오류입니다. 올바른 네트워크를 사용하세요.')
+
+    # ---------- weight 내림차순 정렬 ----------
+
+    order = np.argsort(-np.asarray(degree_sequence), kind = 'stable')
+    weights = [degree_sequence[i] for i in order]
+    max_sq = weights[0] ** 2
+
+    # ---------- 행 단위 skip sampling ----------
+
+    edges = []
+
+    for u in range(n - 1) :
+      w_u = weights[u]
+
+      if w_u == 0 :
+        break
+
+      boundary = u + 1
+
+      if clip == 'max_degree' :
+        # w_u·w_v > 2m 인 앞쪽 구간은 max(k)² 기준 확률 사용 (각 구간 내에서는 단조 감소)
+        while boundary < n and w_u * weights[boundary] > total_degree :
+          boundary += 1
+
+        self._skip_sample_range(u, u + 1, boundary, weights, max_sq, edges)
+
+      self._skip_sample_range(u, boundary, n, weights, total_degree, edges)
+
+    # ---------- Chung-Lu 그래프 생성 (원래 노드 번호로 복원 후 일괄 추가) ----------
+
+    if as_csr :
+      edge_array = order[np.asarray(edges, dtype = np.int64).reshape(-1, 2)]
+      return CSRGraph.from_edges(n, edge_array)
+
+    G_chu = nx.Graph()
+    G_chu.add_nodes_from(range(n))
+    G_chu.add_edges_from((int(order[u]), int(order[v])) for u, v in edges)
+
+    return G_chu
+
   # ====================================================================
   # 4. BA Model 구현
   # ====================================================================
     
-  def create_ba_net(self, m) :
+  def _validate_ba_params(self, m, m0) :
 
-    m0 = 5
+    # ---------- m0 값 검증 (예외 처리) ----------
+
+    if not isinstance(m0, int) :
+      raise TypeError('BA 모델의 초기 노드 수 m0는 정수 형태여야 합니다.')
+
+    if m0 < 1 :
+      raise ValueError('BA 모델의 초기 노드 수 m0는 1 이상의 정수여야 합니다. 현재 m0 값 = {}'.format(m0))
 
     # ---------- m 값 검증 (예외 처리) ----------
 
@@ -170,7 +552,12 @@ class RandomNetGenerator:
       raise ValueError('BA 모델의 새로운 엣지 수 m은 1 이상의 정수여야 합니다. 현재 m 값 = {}'.format(m))
     
     if m > m0 :
-      raise ValueError('BA 모델의 새로운 엣지 수 m은 초기 노드 수로 설정된 5보다 클 수 없습니다. 현재 m 값 = {}'.format(m))
+      raise ValueError('BA 모델의 새로운 엣지 수 m은 초기 노드 수로 설정된 {}보다 클 수 없습니다. 현재 m 값 = {}'.format(m0, m))
+
+  @profile_stage('generator')
+  def create_ba_net(self, m, m0 = 5) :
+
+    self._validate_ba_params(m, m0)
 
     # ---------- 초기 그래프 및 노드 설정 ----------
 
@@ -197,3 +584,244 @@ class RandomNetGenerator:
       next_node += 1
 
     return G_ba
+
+  # ====================================================================
+  # 4-1. BA Model 고속 구현 (degree 비례 endpoint pool)
+  # ====================================================================
+
+  @profile_stage('generator')
+  def create_ba_net_fast(self, m, m0 = 5, as_csr = False) :
+
+    # 🚨 모든 엣지의 양 끝 노드를 pool에 저장하면 pool에서 균일하게 하나를 뽑는 것이 degree 비례 선택과 같음
+    # 🚨 선택 1회가 O(1)이므로 전체 성장은 O(N·m) (중복 대상은 create_ba_net과 동일하게 다시 선택)
+
+    self._validate_ba_params(m, m0)
+
+    # ---------- 초기 그래프 및 endpoint pool 설정 ----------
+
+    G_ba = nx.complete_graph(m0)
+    pool = [n for edge in G_ba.edges() for n in edge]
+    n_total = self.N
+    rand = self.rng.random
+    edges = []
+
+    # ---------- 성장 + 선호적 연결 루프 ----------
+
+    for next_node in range(m0, n_total) :
+      targets = set()
+
+      while len(targets) < m :
+        # 전체 degree가 0인 경우(m0 = 1)에는 기존 노드 중 균일 선택
+        if pool :
+          targets.add(pool[int(rand() * len(pool))])
+        else :
+          targets.add(int(rand() * next_node))
+
+      for target in targets :
+        edges.append((next_node, target))
+        pool.append(next_node)
+        pool.append(target)
+
+    if as_csr :
+      all_edges = list(G_ba.edges()) + edges
+      return CSRGraph.from_edges(max(m0, n_total), np.asarray(all_edges, dtype = np.int64).reshape(-1, 2))
+
+    G_ba.add_edges_from(edges)
+
+    return G_ba
+
+  # ====================================================================
+  # 5. 앙상블 일괄 생성 (ER / Configuration / Chung-Lu)
+  # ====================================================================
+
+  @profile_stage('generator')
+  def generate_ensemble(self, model, n_samples, seed = None, p = None, clip = 'max_degree', chunk_size = 1 << 22) :
+
+    # 🚨 n_samples개 표본의 엣지를 모델별 NumPy 연산 한 번으로 생성하여 EnsembleEdges(엣지 + 표본별 offsets)로 반환
+    # 🚨 ER : 전체 (표본, 노드쌍) 공간에서 geometric skip / Configuration : 표본별 stub 순열을 한 번에 생성
+    # 🚨 Chung-Lu : weight 정렬 + 전체 (표본, block) 공간에서 skip sampling 후 채택 (O(표본 수 · (N log k_max + M)), chunk_size 단위로 메모리 제한)
+
+    if model not in ('ER', 'Configuration', 'Chung-Lu') :
+      raise ValueError("model은 'ER', 'Configuration', 'Chung-Lu' 중 하나여야 합니다. 현재 model = {}".format(model))
+
+    if not isinstance(n_samples, int) or n_samples < 1 :
+      raise ValueError('표본 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(n_samples))
+
+    np_rng = np.random.default_rng(seed) if seed is not None else self.np_rng
+
+    if model == 'ER' :
+      n, sample, edges = self._ensemble_er(np_rng, n_samples, p)
+    elif model == 'Configuration' :
+      n, sample, edges = self._ensemble_configuration(np_rng, n_samples)
+    else :
+      n, sample, edges = self._ensemble_chunglu(np_rng, n_samples, clip, chunk_size)
+
+    # ---------- 표본별 offsets 계산 (엣지는 표본 순서로 정렬되어 있음) ----------
+
+    offsets = np.zeros(n_samples + 1, dtype = np.int64)
+    np.cumsum(np.bincount(sample, minlength = n_samples), out = offsets[1:])
+
+    return EnsembleEdges(n, edges, offsets)
+
+  def _ensemble_er(self, np_rng, n_samples, p) :
+
+    if p is None or not (0 <= p <= 1) :
+      raise ValueError(f"Error: {p}가 0과 1 사이 값이 아닙니다.")
+
+    N = self.N
+    total_pairs = N * (N - 1) // 2
+
+    # 모든 표본의 노드쌍을 이어 붙인 선형 공간에서 한 번에 skip sampling
+    selected = _geometric_skip_positions(np_rng, p, n_samples * total_pairs)
+
+    if total_pairs == 0 :
+      return N, selected, np.empty((0, 2), dtype = np.int64)
+
+    i, j = _linear_index_to_pairs(selected % total_pairs)
+
+    return N, selected // total_pairs, np.stack([i, j], axis = 1)
+
+  def _ensemble_configuration(self, np_rng, n_samples) :
+
+    stubs = self._stub_array()
+    n = len(self.degrees)
+
+    # ---------- 표본별 stub 순열 (단일 연산) ----------
+
+    pairs = np_rng.permuted(np.tile(stubs, (n_samples, 1)), axis = 1).reshape(n_samples, -1, 2)
+    sample = np.repeat(np.arange(n_samples, dtype = np.int64), pairs.shape[1])
+    pairs = pairs.reshape(-1, 2)
+
+    # ---------- self-loop 제거 및 표본 내 multi-edge 중복 제거 ----------
+
+    mask = pairs[:, 0] != pairs[:, 1]
+    pairs, sample = pairs[mask], sample[mask]
+
+    keys = np.unique((sample * n + pairs.min(axis = 1)) * n + pairs.max(axis = 1))
+    sample, rest = keys // (n * n), keys % (n * n)
+
+    return self.N, sample, np.stack([rest // n, rest % n], axis = 1)
+
+  def _ensemble_chunglu(self, np_rng, n_samples, clip, chunk_size) :
+
+    # 🚨 create_chunglu_net_fast와 같이 weight 내림차순 정렬 후 skip sampling → 기대 비용 O(표본 수 · (N log k_max + M))
+    # 🚨 행 u의 열 구간을 block(weight가 2배 이내인 구간, clip 경계에서 분리)으로 나누면 block 안의 p_uv는 최댓값 p_b의 절반 이상
+    #    → (block, 표본, 열) 선형 공간에서 p_b Bernoulli 후보를 한 번에 뽑고 p_uv / p_b 확률로 채택 (_ensemble_er와 같은 일괄 처리)
+    #    → p_b < 0.5 block은 후보 위치를 Poisson 점(점 수 ~ Poisson(크기 · -log(1-p_b)), 위치 균등)으로 생성, p_b >= 0.5 block은 모든 칸을 후보로 사용
+    # 🚨 chunk_size : 한 번에 생성하는 후보 수(기댓값)의 상한
+
+    if clip not in ('max_degree', 'one') :
+      raise ValueError("clip은 'max_degree' 또는 'one' 이어야 합니다. 현재 clip = {}".format(clip))
+
+    degree_sequence = np.asarray(self.degrees, dtype = np.float64)
+    n = len(degree_sequence)
+    total_degree = degree_sequence.sum()
+
+    if total_degree == 0 :
+      raise ValueError('데이터 오류입니다. 올바른 네트워크를 사용하세요.')
+
+    total_pairs = n * (n - 1) // 2
+
+    # ---------- weight 내림차순 정렬 (weight 0인 노드는 엣지가 없으므로 제외) ----------
+
+    node_order = np.argsort(-degree_sequence, kind = 'stable')
+    weights = degree_sequence[node_order]
+    n_pos = int(np.count_nonzero(weights))
+    max_sq = weights[0] ** 2
+
+    def edge_prob(w) :
+      p_ij = w / total_degree
+
+      if clip == 'max_degree' :
+        p_ij = np.where(p_ij > 1, w / max_sq, p_ij)
+
+      return np.clip(p_ij, 0, 1)
+
+    # ---------- 행별 열 구간 block 분할 : [u+1, n_pos)를 log2(weight) 등급 경계 + clip 경계에서 자름 ----------
+
+    rows = np.arange(max(n_pos - 1, 0), dtype = np.int64)
+    level = np.floor(np.log2(weights[:n_pos]))
+    level_starts = np.flatnonzero(np.diff(level)) + 1
+
+    if clip == 'max_degree' :
+      # boundary[u] = w_u·w_v > 2m 인 열의 개수 (부동소수점 오차는 곱으로 다시 비교하여 보정)
+      w_rows = weights[rows]
+      boundary = np.searchsorted(-weights[:n_pos], -total_degree / w_rows, side = 'left')
+      boundary -= (boundary > 0) & (w_rows * weights[np.maximum(boundary - 1, 0)] <= total_degree)
+      boundary += (boundary < n_pos) & (w_rows * weights[np.minimum(boundary, n_pos - 1)] > total_degree)
+    else :
+      boundary = np.full(len(rows), n_pos, dtype = np.int64)
+
+    cuts = np.concatenate([(rows + 1)[:, None],
+                           np.broadcast_to(level_starts, (len(rows), len(level_starts))),
+                           boundary[:, None],
+                           np.full((len(rows), 1), n_pos)], axis = 1)
+    cuts = np.sort(np.clip(cuts, (rows + 1)[:, None], n_pos), axis = 1)
+
+    block_u = np.repeat(rows, cuts.shape[1] - 1)
+    block_lo = cuts[:, :-1].ravel()
+    block_len = cuts[:, 1:].ravel() - block_lo
+    keep = block_len > 0
+    block_u, block_lo, block_len = block_u[keep], block_lo[keep], block_len[keep]
+
+    # ---------- block별 후보 확률 p_b (block 안의 최댓값) 및 후보 공간 ----------
+
+    p_block = edge_prob(weights[block_u] * weights[block_lo])
+    dense = p_block >= 0.5
+    hazard = -np.log1p(-np.where(dense, 0.0, p_block))
+
+    block_size = n_samples * block_len
+    block_offset = np.zeros(len(block_size) + 1, dtype = np.int64)
+    np.cumsum(block_size, out = block_offset[1:])
+
+    work = np.where(dense, block_size, block_size * hazard)
+    cumulative_work = np.cumsum(work)
+    splits = np.searchsorted(cumulative_work, np.arange(chunk_size, cumulative_work[-1], chunk_size)) if len(work) > 0 else []
+
+    samples = []
+    pairs = []
+
+    # ---------- block 묶음 단위로 후보 생성 + 채택 ----------
+
+    for blocks in np.split(np.arange(len(work)), splits) :
+      if len(blocks) == 0 :
+        continue
+
+      # p_b < 0.5 block : Poisson 점 위치 (같은 칸에 여러 점이면 하나의 후보)
+      sparse = blocks[~dense[blocks]]
+      counts = np_rng.poisson(block_size[sparse] * hazard[sparse])
+      point_block = np.repeat(sparse, counts)
+      keys = [block_offset[point_block] + np_rng.integers(0, block_size[point_block])]
+
+      # p_b >= 0.5 block : 모든 칸
+      full = blocks[dense[blocks]]
+
+      if len(full) > 0 :
+        sizes = block_size[full]
+        starts = np.repeat(block_offset[full] - np.cumsum(sizes) + sizes, sizes)
+        keys.append(starts + np.arange(sizes.sum(), dtype = np.int64))
+
+      keys = np.unique(np.concatenate(keys))
+
+      # 후보 위치 → (block, 표본, 열)
+      b = np.searchsorted(block_offset, keys, side = 'right') - 1
+      local = keys - block_offset[b]
+      s = local // block_len[b]
+      u = block_u[b]
+      v = block_lo[b] + local % block_len[b]
+
+      # p_uv / p_b 확률로 채택 (모든 칸을 후보로 쓴 block은 p_uv)
+      q = edge_prob(weights[u] * weights[v])
+      accept = np_rng.random(len(keys)) * np.where(dense[b], 1.0, p_block[b]) < q
+
+      samples.append(s[accept])
+      pairs.append(np.stack([node_order[u[accept]], node_order[v[accept]]], axis = 1))
+
+    sample = np.concatenate(samples) if samples else np.empty(0, dtype = np.int64)
+    edges = np.concatenate(pairs) if pairs else np.empty((0, 2), dtype = np.int64)
+
+    # 원래 노드 번호 (i < j)로 복원 후 표본 · 노드쌍 순서로 정렬
+    i, j = edges.min(axis = 1), edges.max(axis = 1)
+    order = np.argsort(sample * max(total_pairs, 1) + j * (j - 1) // 2 + i, kind = 'stable')
+
+    return n, sample[order], np.stack([i[order], j[order]], axis = 1)
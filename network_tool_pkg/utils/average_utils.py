@@ -62,3 +62,155 @@ def ensemble_average(results_list) :
       averaged_values.append(float(np.mean(valid_vals)))
 
   return averaged_values
+
+
+
+
+
+# -------------------- 스트리밍 앙상블 누적 클래스 : 표본 결과를 저장하지 않고 평균/분산을 온라인으로 누적하는 클래스 --------------------
+class EnsembleAccumulator :
+
+  # 🚨 ensemble_average와 동일한 key 처리 규칙(None, NaN, list/dict 값 제외)을 따르며 메모리는 O(key 수)
+  # 🚨 평균과 분산은 Welford 방식으로 누적하고, 병렬 worker의 부분 누적 결과는 merge()로 합침
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, keys = None) :
+
+    self.keys = []
+    self.key_index = {}
+    self.count = np.zeros(0, dtype = np.int64)
+    self.mean = np.zeros(0)
+    self.m2 = np.zeros(0)
+    self.num_results = 0
+
+    if keys is not None :
+      self._register_keys(keys)
+
+  # ---------- 보조 메서드 (새로운 key 등록 및 배열 확장) ----------
+
+  def _register_keys(self, keys) :
+
+    new_keys = [key for key in keys if key not in self.key_index]
+
+    if not new_keys :
+      return
+
+    for key in new_keys :
+      self.key_index[key] = len(self.keys)
+      self.keys.append(key)
+
+    grow = len(new_keys)
+    self.count = np.concatenate([self.count, np.zeros(grow, dtype = np.int64)])
+    self.mean = np.concatenate([self.mean, np.zeros(grow)])
+    self.m2 = np.concatenate([self.m2, np.zeros(grow)])
+
+  # ---------- 표본 결과 하나 누적 ----------
+
+  def update(self, result) :
+
+    self.num_results += 1
+
+    if not isinstance(result, dict) :
+      return
+
+    self._register_keys(result.keys())
+
+    idx = []
+    vals = []
+
+    for key, value in result.items() :
+      if value is None :
+        continue
+      if isinstance(value, (list, dict)) :
+        continue
+
+      if isinstance(value, (int, float, np.number)) :
+        if not np.isnan(value) :
+          idx.append(self.key_index[key])
+          vals.append(value)
+
+    if not idx :
+      return
+
+    # ---------- Welford 온라인 평균/분산 갱신 (벡터화) ----------
+
+    idx = np.asarray(idx, dtype = np.int64)
+    vals = np.asarray(vals, dtype = np.float64)
+
+    self.count[idx] += 1
+    delta = vals - self.mean[idx]
+    self.mean[idx] += delta / self.count[idx]
+    self.m2[idx] += delta * (vals - self.mean[idx])
+
+  # ---------- 부분 누적 결과 병합 (Chan 방식) ----------
+
+  def merge(self, other) :
+
+    if not isinstance(other, EnsembleAccumulator) :
+      raise TypeError('[EnsembleAccumulator] EnsembleAccumulator끼리만 병합할 수 있습니다.')
+
+    self._register_keys(other.keys)
+    self.num_results += other.num_results
+
+    if not other.keys :
+      return self
+
+    idx = np.asarray([self.key_index[key] for key in other.keys], dtype = np.int64)
+
+    n_a = self.count[idx].astype(np.float64)
+    n_b = other.count.astype(np.float64)
+    n = n_a + n_b
+
+    with np.errstate(invalid = 'ignore', divide = 'ignore') :
+      delta = other.mean - self.mean[idx]
+      new_mean = np.where(n > 0, self.mean[idx] + delta * n_b / n, 0.0)
+      new_m2 = np.where(n > 0, self.m2[idx] + other.m2 + delta**2 * n_a * n_b / n, 0.0)
+
+    self.count[idx] += other.count
+    self.mean[idx] = new_mean
+    self.m2[idx] = new_m2
+
+    return self
+
+  # ---------- 보조 메서드 (ensemble_average와 같은 key 순서) ----------
+
+  def _sorted_keys(self) :
+
+    if self.num_results == 0 :
+      raise ValueError('[EnsembleAccumulator] 누적된 결과가 없습니다. 시뮬레이션 결과가 없습니다.')
+
+    if not self.keys :
+      raise ValueError('[EnsembleAccumulator] 유효한 key가 없습니다. 모든 결과가 비어있습니다.')
+
+    global_keys = ['CC', 'APL', 'DIAM']
+
+    # 전역 지표면 순서 강제, 중심성은 key를 정렬 (노드 번호 순)
+    if set(global_keys).issubset(self.key_index) :
+      return global_keys
+
+    return sorted(self.keys)
+
+  # ---------- 평균 반환 (ensemble_average와 동일한 형태) ----------
+
+  def finalize(self) :
+
+    stats = self.finalize_stats()
+
+    return [float(v) for v in stats['mean']]
+
+  # ---------- 평균, 분산, 표준오차, 표본 수 반환 ----------
+
+  def finalize_stats(self) :
+
+    keys = self._sorted_keys()
+    idx = np.asarray([self.key_index[key] for key in keys], dtype = np.int64)
+
+    count = self.count[idx]
+    mean = np.where(count > 0, self.mean[idx], np.nan)
+
+    with np.errstate(invalid = 'ignore', divide = 'ignore') :
+      variance = np.where(count > 1, self.m2[idx] / (count - 1), np.nan)
+      stderr = np.sqrt(variance / count)
+
+    return {'keys' : keys, 'mean' : mean, 'variance' : variance, 'stderr' : stderr, 'count' : count}
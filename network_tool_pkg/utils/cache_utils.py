@@ -0,0 +1,160 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+
+# 캐시 저장 형식이 바뀌면 값을 올려 이전 캐시가 자동으로 무효화되도록 함
+# (2 : 정수 label을 문자열로 바꾸지 않고 int64로 저장)
+CACHE_VERSION = 2
+
+# 캐시 항목 하나를 구성하는 배열 파일
+CACHE_ARRAYS = ('indptr', 'indices', 'labels', 'degrees')
+
+# -------------------- 전처리 그래프 캐시 클래스 : 입력 파일 내용과 전처리 옵션의 hash를 key로 CSR 배열을 디스크에 저장하는 클래스 --------------------
+class GraphCache :
+
+  # 🚨 항목마다 indptr / indices / labels / degrees를 .npy 파일로 저장하고 memory mapping으로 로드 (cache hit 시 파싱·전처리 생략)
+  # 🚨 .npz(zip)는 memory mapping이 불가능하므로 항목별 폴더에 개별 .npy 파일로 저장
+  # 🚨 전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, cache_dir, max_bytes = 1 << 30) :
+
+    if not isinstance(max_bytes, int) or max_bytes < 0 :
+      raise ValueError('캐시 최대 용량은 0 이상의 정수(byte)여야 합니다. 현재 값 = {}'.format(max_bytes))
+
+    self.cache_dir = cache_dir
+    self.max_bytes = max_bytes
+
+    os.makedirs(cache_dir, exist_ok = True)
+
+  # ---------- key 생성 (파일 내용 + 전처리 옵션) ----------
+
+  def make_key(self, file_path, options = None) :
+
+    digest = hashlib.sha256()
+    digest.update('v{}'.format(CACHE_VERSION).encode())
+    digest.update(json.dumps(options or {}, sort_keys = True, default = str).encode())
+
+    try :
+      with open(file_path, 'rb') as f :
+        for block in iter(lambda : f.read(1 << 20), b'') :
+          digest.update(block)
+
+    except FileNotFoundError :
+      raise FileNotFoundError('입력한 파일 경로가 잘못되었습니다. 파일 경로를 확인하십시오. 현재 경로 : {}'.format(file_path))
+
+    return digest.hexdigest()
+
+  # ---------- cache 조회 ----------
+
+  def load(self, key) :
+
+    entry_dir = os.path.join(self.cache_dir, key)
+
+    if not all(os.path.exists(os.path.join(entry_dir, name + '.npy')) for name in CACHE_ARRAYS) :
+      return None
+
+    arrays = {name : np.load(os.path.join(entry_dir, name + '.npy'), mmap_mode = 'r') for name in CACHE_ARRAYS}
+
+    # LRU 정책을 위해 사용 시각 갱신
+    os.utime(entry_dir)
+
+    labels = arrays['labels'].tolist() if len(arrays['labels']) > 0 else None
+    graph = CSRGraph(arrays['indptr'], arrays['indices'], labels)
+
+    return graph, arrays['degrees']
+
+  # ---------- cache 저장 ----------
+
+  def store(self, key, graph, degrees) :
+
+    if not isinstance(graph, CSRGraph) :
+      raise TypeError('캐시에는 CSRGraph 형태만 저장할 수 있습니다.')
+
+    entry_dir = os.path.join(self.cache_dir, key)
+
+    if os.path.exists(entry_dir) :
+      return
+
+    # 🚨 label은 str 또는 정수만 저장 (.npy dtype으로 구분하여 load 시 원래 타입으로 복원 → cache hit / miss 결과가 같음)
+    labels = graph.labels if graph.labels is not None else ()
+
+    if all(isinstance(label, str) for label in labels) :
+      labels = np.array(labels, dtype = str)
+    elif all(isinstance(label, (int, np.integer)) and not isinstance(label, (bool, np.bool_)) for label in labels) :
+      labels = np.array(labels, dtype = np.int64)
+    else :
+      raise TypeError('캐시에는 노드 label이 모두 str 또는 모두 정수인 CSRGraph만 저장할 수 있습니다.')
+
+    # 임시 폴더에 모두 저장한 뒤 이름을 바꿔 반쯤 쓰인 항목이 보이지 않도록 함
+    tmp_dir = tempfile.mkdtemp(dir = self.cache_dir, prefix = '.tmp-')
+
+    try :
+      np.save(os.path.join(tmp_dir, 'indptr.npy'), np.asarray(graph.indptr))
+      np.save(os.path.join(tmp_dir, 'indices.npy'), np.asarray(graph.indices))
+      np.save(os.path.join(tmp_dir, 'labels.npy'), labels)
+      np.save(os.path.join(tmp_dir, 'degrees.npy'), np.asarray(degrees, dtype = np.int64))
+      os.replace(tmp_dir, entry_dir)
+
+    except OSError :
+      shutil.rmtree(tmp_dir, ignore_errors = True)
+
+      # 다른 프로세스가 같은 항목을 먼저 저장한 경우는 무시
+      if not os.path.exists(entry_dir) :
+        raise
+
+    self.evict()
+
+  # ---------- 용량 기반 삭제 (LRU) ----------
+
+  def evict(self) :
+
+    entries = []
+
+    for name in os.listdir(self.cache_dir) :
+      entry_dir = os.path.join(self.cache_dir, name)
+
+      if name.startswith('.') or not os.path.isdir(entry_dir) :
+        continue
+
+      size = sum(os.path.getsize(os.path.join(entry_dir, f)) for f in os.listdir(entry_dir))
+      entries.append((os.path.getmtime(entry_dir), size, entry_dir))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, entry_dir in sorted(entries) :
+      if total <= self.max_bytes :
+        break
+
+      shutil.rmtree(entry_dir, ignore_errors = True)
+      total -= size
+
+    return total
+
+  # ---------- cache 조회 후 없으면 생성 ----------
+
+  def get_or_build(self, file_path, build_fn, options = None) :
+
+    # build_fn() → (CSRGraph, degree sequence)
+    key = self.make_key(file_path, options)
+    cached = self.load(key)
+
+    if cached is not None :
+      return cached
+
+    graph, degrees = build_fn()
+    self.store(key, graph, degrees)
+
+    cached = self.load(key)
+
+    # 용량 제한으로 바로 삭제된 경우에는 생성 결과를 그대로 반환
+    if cached is None :
+      return graph, np.asarray(degrees, dtype = np.int64)
+
+    return cached
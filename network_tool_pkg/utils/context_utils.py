@@ -0,0 +1,177 @@
+import networkx as nx
+import numpy as np
+from functools import cached_property
+from scipy.sparse.csgraph import connected_components
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.matrix_utils import to_csr_adjacency
+from network_tool_pkg.utils.distance_utils import distance_metrics_from_adjacency, diameter_from_adjacency, apl_sample_from_adjacency
+from network_tool_pkg.utils.triangle_utils import triangle_stats_from_adjacency
+
+# -------------------- 분석 컨텍스트 클래스 : 네트워크 하나에 대해 공통 구조 정보를 한 번만 계산하여 공유하는 클래스 --------------------
+class AnalysisContext :
+
+  # 🚨 연결 구성요소, LCC 인덱스, degree 배열, 연결 여부, 거리 커널 결과 등을 처음 요청될 때 한 번만 계산하고 저장
+  # 🚨 CentralityCalculator, calculate_global, basic_network_stats, diagnose_lcc_size에 같은 컨텍스트를 넘기면 중복 계산이 없음
+  # 🚨 컨텍스트를 만든 이후 네트워크를 수정하면 안 됨 (저장된 결과가 갱신되지 않음)
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, G) :
+
+    if not isinstance(G, (nx.Graph, CSRGraph)) :
+      raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+    self.G = G
+    self._distance_result = None
+    self._diameter = None
+
+  # ---------- 노드 및 인접 구조 ----------
+
+  @cached_property
+  def nodes(self) :
+
+    return list(self.G.nodes())
+
+  @cached_property
+  def adjacency(self) :
+
+    # 노드 순서(self.nodes)를 따르는 CSR 인접 행렬
+    return to_csr_adjacency(self.G, self.nodes)
+
+  @cached_property
+  def index_adjacency(self) :
+
+    indptr = self.adjacency.indptr.tolist()
+    indices = self.adjacency.indices.tolist()
+
+    return [indices[indptr[i]:indptr[i+1]] for i in range(len(self.nodes))]
+
+  @cached_property
+  def degrees(self) :
+
+    return np.diff(self.adjacency.indptr)
+
+  # ---------- 연결 구성요소 ----------
+
+  @cached_property
+  def component_labels(self) :
+
+    if len(self.nodes) == 0 :
+      return np.empty(0, dtype = np.int32)
+
+    _, labels = connected_components(self.adjacency, directed = False)
+
+    return labels
+
+  @cached_property
+  def component_sizes(self) :
+
+    return np.bincount(self.component_labels)
+
+  @property
+  def num_components(self) :
+
+    return len(self.component_sizes)
+
+  @property
+  def is_connected(self) :
+
+    if len(self.nodes) == 0 :
+      raise nx.NetworkXPointlessConcept('빈 그래프는 연결 여부를 판단할 수 없습니다.')
+
+    return self.num_components == 1
+
+  # ---------- LCC ----------
+
+  @cached_property
+  def lcc_index(self) :
+
+    # 크기가 같은 구성요소가 여러 개이면 먼저 등장한 노드의 구성요소를 사용 (nx.connected_components와 동일)
+    if len(self.nodes) == 0 :
+      return np.empty(0, dtype = np.int64)
+
+    return np.flatnonzero(self.component_labels == np.argmax(self.component_sizes))
+
+  @property
+  def lcc_size(self) :
+
+    return len(self.lcc_index)
+
+  @cached_property
+  def lcc_nodes(self) :
+
+    return [self.nodes[i] for i in self.lcc_index]
+
+  @cached_property
+  def lcc_view(self) :
+
+    # networkx 입력은 복사 없는 subgraph view, CSRGraph 입력은 LCC만 포함한 CSRGraph 반환
+    if isinstance(self.G, CSRGraph) :
+      if self.lcc_size == len(self.nodes) :
+        return self.G
+
+      sub = self.adjacency[self.lcc_index][:, self.lcc_index]
+      return CSRGraph(sub.indptr, sub.indices, self.lcc_nodes if self.G.labels is not None else None)
+
+    return self.G.subgraph(self.lcc_nodes)
+
+  @cached_property
+  def lcc_adjacency(self) :
+
+    if self.lcc_size == len(self.nodes) :
+      return self.adjacency
+
+    return self.adjacency[self.lcc_index][:, self.lcc_index]
+
+  # ---------- 거리 커널 결과 (closeness, harmonic, eccentricity, APL, DIAM) ----------
+
+  def distance_metrics(self, chunk_size = 256) :
+
+    if not isinstance(chunk_size, int) or chunk_size < 1 :
+      raise ValueError('chunk_size는 1 이상의 정수여야 합니다. 현재 chunk_size = {}'.format(chunk_size))
+
+    # chunk_size는 메모리 사용량만 바꾸므로 결과는 한 번만 계산
+    if self._distance_result is None :
+      if len(self.nodes) == 0 :
+        self._distance_result = {'nodes' : [], 'closeness' : {}, 'harmonic' : {}, 'eccentricity' : {}, 'APL' : np.nan, 'DIAM' : np.nan}
+      else :
+        self._distance_result = distance_metrics_from_adjacency(self.adjacency, self.nodes, self.lcc_index, chunk_size)
+
+    return self._distance_result
+
+  # ---------- 대규모 네트워크용 거리 지표 (정확한 지름, 표본 APL) ----------
+
+  def diameter(self) :
+
+    # 거리 커널을 이미 계산한 경우에는 그 결과를 그대로 사용
+    if self._distance_result is not None :
+      return self._distance_result['DIAM']
+
+    if self._diameter is None :
+      self._diameter = np.nan if self.lcc_size <= 1 else diameter_from_adjacency(self.lcc_adjacency)
+
+    return self._diameter
+
+  def estimate_apl(self, n_sources = 256, seed = None, confidence = 0.95) :
+
+    if len(self.nodes) == 0 :
+      return {'APL' : np.nan, 'stderr' : np.nan, 'ci_low' : np.nan, 'ci_high' : np.nan, 'n_sources' : 0}
+
+    return apl_sample_from_adjacency(self.lcc_adjacency, n_sources, seed, confidence)
+
+  # ---------- 클러스터링 계수 ----------
+
+  @cached_property
+  def triangle_stats(self) :
+
+    # 노드별 삼각형 수, local / average clustering, transitivity를 행렬 곱 한 번으로 계산
+    if len(self.nodes) == 0 :
+      raise ZeroDivisionError('빈 그래프는 클러스터링 계수를 계산할 수 없습니다.')
+
+    return triangle_stats_from_adjacency(self.adjacency, self.nodes)
+
+  @property
+  def average_clustering(self) :
+
+    return self.triangle_stats['average_clustering']
@@ -0,0 +1,266 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+# -------------------- CSR 기반 불변 그래프 클래스 : networkx.Graph 대신 배열만으로 무방향 simple 네트워크를 저장하는 클래스 --------------------
+class CSRGraph :
+
+  # 🚨 노드는 0 ~ N-1 정수 인덱스로 저장하고 원래 노드 이름(household0001 등)은 labels 테이블로 따로 보관
+  # 🚨 indptr(int64) / indices(int32) 두 배열만 사용하므로 메모리는 O(N+M), 생성 이후에는 수정 불가
+
+  __slots__ = ('indptr', 'indices', 'labels', '_label_index')
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, indptr, indices, labels = None) :
+
+    indptr = np.asarray(indptr)
+    indices = np.asarray(indices)
+
+    if indptr.ndim != 1 or indices.ndim != 1 or len(indptr) == 0 :
+      raise ValueError('CSR 배열의 형태가 올바르지 않습니다. indptr, indices는 1차원 배열이어야 합니다.')
+
+    if indptr[0] != 0 or indptr[-1] != len(indices) :
+      raise ValueError('CSR 배열의 형태가 올바르지 않습니다. indptr[0] = 0, indptr[-1] = len(indices) 이어야 합니다.')
+
+    if indptr.dtype != np.int64 :
+      indptr = indptr.astype(np.int64)
+
+    if indices.dtype != np.int32 :
+      indices = indices.astype(np.int32)
+
+    n = len(indptr) - 1
+
+    if labels is not None :
+      labels = tuple(labels)
+
+      if len(labels) != n :
+        raise ValueError('labels의 길이({})가 노드 수({})와 다릅니다.'.format(len(labels), n))
+
+    # 불변 객체로 사용하기 위해 읽기 전용 view로 보관 (입력 배열은 복사하지 않고 호출한 쪽 배열의 flag도 바꾸지 않음)
+    indptr = indptr.view()
+    indptr.flags.writeable = False
+
+    indices = indices.view()
+    indices.flags.writeable = False
+
+    object.__setattr__(self, 'indptr', indptr)
+    object.__setattr__(self, 'indices', indices)
+    object.__setattr__(self, 'labels', labels)
+    object.__setattr__(self, '_label_index', None)
+
+  def __setattr__(self, name, value) :
+
+    raise AttributeError('CSRGraph는 수정할 수 없는 객체입니다.')
+
+  def __reduce__(self) :
+
+    # __setattr__을 막았으므로 pickle / copy는 생성자로 다시 만들도록 지정 (ProcessPool 작업 전달용)
+    return (self.__class__, (self.indptr, self.indices, self.labels))
+
+  def __len__(self) :
+
+    return len(self.indptr) - 1
+
+  def __repr__(self) :
+
+    return 'CSRGraph(N = {}, M = {})'.format(self.number_of_nodes(), self.number_of_edges())
+
+  # ---------- 생성 메서드 (엣지 배열) ----------
+
+  @classmethod
+  def from_edges(cls, n, edges, labels = None) :
+
+    # self-loop 제거, (min, max) 정규화 후 중복 제거, 대칭화하여 행별로 정렬된 CSR 생성
+    edges = np.asarray(edges, dtype = np.int64).reshape(-1, 2)
+
+    if len(edges) > 0 and (edges.min() < 0 or edges.max() >= n) :
+      raise ValueError('엣지에 존재하지 않는 노드 인덱스가 포함되어 있습니다. 노드 수 = {}'.format(n))
+
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    keys = np.unique(edges.min(axis = 1) * n + edges.max(axis = 1))
+    u = keys // n
+    v = keys % n
+
+    rows = np.concatenate([u, v])
+    cols = np.concatenate([v, u])
+    order = np.argsort(rows * n + cols, kind = 'stable')
+
+    indptr = np.zeros(n + 1, dtype = np.int64)
+    np.cumsum(np.bincount(rows, minlength = n), out = indptr[1:])
+
+    return cls(indptr, cols[order], labels)
+
+  # ---------- 변환 메서드 (networkx → CSRGraph) ----------
+
+  @classmethod
+  def from_networkx(cls, G, nodes = None) :
+
+    if not isinstance(G, nx.Graph) :
+      raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 형태로 입력하십시오.')
+
+    if nodes is None :
+      nodes = list(G.nodes())
+
+    node_to_index = {node : i for i, node in enumerate(nodes)}
+    M = G.number_of_edges()
+    flat = np.fromiter((node_to_index[n] for edge in G.edges() for n in edge), dtype = np.int64, count = 2 * M)
+
+    return cls.from_edges(len(nodes), flat.reshape(-1, 2), nodes)
+
+  # ---------- 변환 메서드 (CSRGraph → networkx / scipy) ----------
+
+  def to_networkx(self) :
+
+    nodes = self.nodes()
+    u, v = self.edges().T
+
+    G = nx.Graph()
+    G.add_nodes_from(nodes)
+
+    if self.labels is None :
+      G.add_edges_from(zip(u.tolist(), v.tolist()))
+    else :
+      G.add_edges_from((nodes[a], nodes[b]) for a, b in zip(u.tolist(), v.tolist()))
+
+    return G
+
+  def to_scipy(self) :
+
+    # 🚨 scipy CSR 인접 행렬 : indices(int32, O(M))는 복사 없이 공유
+    #    scipy는 인덱스 값이 int32 범위면 indptr(int64)를 int32로 변환하므로 indptr(O(N))만 복사됨
+    #    (엣지 항목 수가 int32 범위를 넘으면 두 배열 모두 int64로 맞추므로 indices도 복사됨)
+    n = len(self)
+    data = np.ones(len(self.indices), dtype = np.float64)
+
+    return sp.csr_matrix((data, self.indices, self.indptr), shape = (n, n), copy = False)
+
+  # ---------- 조회 메서드 ----------
+
+  def number_of_nodes(self) :
+
+    return len(self)
+
+  def number_of_edges(self) :
+
+    return len(self.indices) // 2
+
+  def nodes(self) :
+
+    if self.labels is None :
+      return list(range(len(self)))
+
+    return list(self.labels)
+
+  def degree(self) :
+
+    return np.diff(self.indptr)
+
+  def neighbors(self, i) :
+
+    return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+  def edges(self) :
+
+    rows = np.repeat(np.arange(len(self), dtype = np.int64), self.degree())
+    mask = rows < self.indices
+
+    return np.stack([rows[mask], self.indices[mask].astype(np.int64)], axis = 1)
+
+  def index_of(self, label) :
+
+    if self.labels is None :
+      return int(label)
+
+    if self._label_index is None :
+      object.__setattr__(self, '_label_index', {node : i for i, node in enumerate(self.labels)})
+
+    return self._label_index[label]
+
+
+
+
+
+# -------------------- 앙상블 엣지 배열 클래스 : 여러 표본의 엣지를 하나의 배열에 쌓아 보관하는 클래스 --------------------
+class EnsembleEdges :
+
+  # 🚨 edges : 모든 표본의 (u, v) 엣지를 표본 순서대로 이어 붙인 (E, 2) 배열
+  # 🚨 offsets : 표본 s의 엣지는 edges[offsets[s]:offsets[s+1]] (복사 없는 view로 접근)
+
+  __slots__ = ('n_nodes', 'edges', 'offsets')
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, n_nodes, edges, offsets) :
+
+    edges = np.asarray(edges, dtype = np.int64).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype = np.int64)
+
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(edges) :
+      raise ValueError('offsets의 형태가 올바르지 않습니다. offsets[0] = 0, offsets[-1] = 엣지 수 이어야 합니다.')
+
+    # CSRGraph와 같이 읽기 전용 view로 보관 (입력 배열의 flag는 유지)
+    edges = edges.view()
+    edges.flags.writeable = False
+
+    offsets = offsets.view()
+    offsets.flags.writeable = False
+
+    object.__setattr__(self, 'n_nodes', n_nodes)
+    object.__setattr__(self, 'edges', edges)
+    object.__setattr__(self, 'offsets', offsets)
+
+  def __setattr__(self, name, value) :
+
+    raise AttributeError('EnsembleEdges는 수정할 수 없는 객체입니다.')
+
+  def __reduce__(self) :
+
+    # CSRGraph와 같이 pickle / copy는 생성자로 다시 만들도록 지정
+    return (self.__class__, (self.n_nodes, self.edges, self.offsets))
+
+  def __len__(self) :
+
+    return len(self.offsets) - 1
+
+  def __repr__(self) :
+
+    return 'EnsembleEdges(samples = {}, N = {}, E = {})'.format(len(self), self.n_nodes, len(self.edges))
+
+  # ---------- 표본별 lazy view ----------
+
+  def __getitem__(self, s) :
+
+    if not -len(self) <= s < len(self) :
+      raise IndexError('표본 인덱스가 범위를 벗어났습니다. 표본 수 = {}'.format(len(self)))
+
+    s = s % len(self)
+
+    return self.edges[self.offsets[s]:self.offsets[s + 1]]
+
+  def __iter__(self) :
+
+    for s in range(len(self)) :
+      yield self[s]
+
+  def sample_ids(self) :
+
+    return np.repeat(np.arange(len(self), dtype = np.int64), np.diff(self.offsets))
+
+  def number_of_edges(self) :
+
+    return np.diff(self.offsets)
+
+  # ---------- 표본별 그래프 변환 ----------
+
+  def to_csr(self, s) :
+
+    return CSRGraph.from_edges(self.n_nodes, self[s])
+
+  def to_networkx(self, s) :
+
+    G = nx.Graph()
+    G.add_nodes_from(range(self.n_nodes))
+    G.add_edges_from(self[s].tolist())
+
+    return G
@@ -1,8 +1,27 @@
 import networkx as nx
+import numpy as np
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
 
 # -------------------- degree sequence 생성 함수 : 랜덤 모델 생성 시 필요한 degree sequence를 생성하는 함수 --------------------
 def create_degree_sequence(G) :
 
+  # ---------- CSRGraph 입력 (self-loop 및 multi-edge가 없는 형태로만 생성됨) ----------
+
+  if isinstance(G, CSRGraph) :
+    if G.number_of_nodes() == 0 :
+      raise ValueError('입력한 네트워크는 빈 그래프입니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
+
+    if G.number_of_edges() == 0 :
+      raise ValueError('입력한 네트워크는 엣지가 존재하지 않습니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
+
+    degree_array = G.degree()
+
+    if (degree_array == 0).any() :
+      raise ValueError('입력한 네트워크는 isolated node가 존재합니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
+
+    return degree_array.tolist()
+
   # ---------- 네트워크 타입 확인 (예외 처리) ----------
 
   if not isinstance(G, nx.Graph) :
@@ -17,34 +36,29 @@ def create_degree_sequence(G) :
   if len(G.edges()) == 0 :
     raise ValueError('입력한 네트워크는 엣지가 존재하지 않습니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
   
-  self_loop_count = 0
-
-  for node1, node2 in G.edges() :
-
-    if node1 == node2 :
-      self_loop_count += 1
-      break
-
-  if self_loop_count > 0 :
+  # self-loop는 노드별 인접 dict에 자기 자신이 있는지만 확인 (엣지 전체 순회 없이 O(N))
+  if any(node in nbrs for node, nbrs in G.adjacency()) :
     raise ValueError('입력한 네트워크는 self-loop가 존재합니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
 
   # ---------- degree sequence 생성 ----------
 
-  degree_sequence = [d for _, d in G.degree()]
+  degree_array = np.fromiter((d for _, d in G.degree()), dtype = np.int64, count = G.number_of_nodes())
 
   # ---------- 유효한 degree 값 확인 (예외 처리) ----------
 
-  if 0 in degree_sequence :
+  if (degree_array == 0).any() :
     raise ValueError('입력한 네트워크는 isolated node가 존재합니다. network_pkg.utils.preprocessing.preprocess_network()로 전처리를 먼저 실행하십시오.')
 
-  return degree_sequence
+  return degree_array.tolist()
 
 
 
 
 
 # -------------------- stub 전처리 함수 : 랜덤 모델 생성 시 degree sequence의 영향을 최소화하여 stub의 합을 올바른 형태로 변경해주는 함수 --------------------
-def preprocess_stub(degree_sequence) :
+def preprocess_stub(degree_sequence, verbose = True) :
+
+  # 🚨 verbose = False이면 진행 상황을 출력하지 않음 (대용량 / 배치 전처리용)
 
   # ---------- degree sequence 타입 확인 (예외 처리) ----------
 
@@ -54,33 +68,46 @@ def preprocess_stub(degree_sequence) :
   if len(degree_sequence) == 0 :
     raise ValueError('입력한 degree sequence는 빈 list 입니다. network_pkg.utils.degree_utils.create_degree_sequence()로 전처리를 먼저 실행하십시오.')
 
-  for degree in degree_sequence :
+  # 원소 하나씩 확인하지 않고 배열 변환 한 번으로 정수 여부 / 음수 여부 확인
+  # 🚨 int64 범위를 넘는 정수 등으로 object 배열이 되는 경우에만 원소별 확인
+  try :
+    degree_array = np.asarray(degree_sequence)
+
+  except (ValueError, OverflowError) :
+    degree_array = np.asarray(degree_sequence, dtype = object)
 
-    if not isinstance(degree, int) :
+  if degree_array.dtype.kind == 'O' :
+    if not all(isinstance(degree, int) for degree in degree_sequence) :
       raise TypeError('입력한 degree sequence에는 정수 형태만 포함되어야합니다. 올바른 네트워크를 network_pkg.utils.preprocessing.preprocess_network()로 전처리하십시오.')
+
+  elif degree_array.dtype.kind not in 'biu' :
+    raise TypeError('입력한 degree sequence에는 정수 형태만 포함되어야합니다. 올바른 네트워크를 network_pkg.utils.preprocessing.preprocess_network()로 전처리하십시오.')
     
-    if degree < 0 :
-      raise ValueError('입력한 degree sequence에 음수 degree가 포함되어 있습니다. 올바른 네트워크를 network_pkg.utils.preprocessing.preprocess_network()로 전처리하십시오.')
+  if (degree_array < 0).any() :
+    raise ValueError('입력한 degree sequence에 음수 degree가 포함되어 있습니다. 올바른 네트워크를 network_pkg.utils.preprocessing.preprocess_network()로 전처리하십시오.')
     
   # ---------- stub 총합이 짝수인 경우  ----------
 
-  degree_sum = sum(degree_sequence)
+  degree_sum = int(degree_array.sum())
 
   if degree_sum % 2 == 0 :
-    print('[stub prepocessing] stub의 총합이 짝수입니다. 수정이 불필요합니다.')
+    if verbose :
+      print('[stub prepocessing] stub의 총합이 짝수입니다. 수정이 불필요합니다.')
 
     return degree_sequence
 
   # ---------- stub 총합이 홀수인 경우  ----------
   
-  print('[stub prepocessing] stub의 총합이 홀수입니다. degree sequence의 최소한의 수정을 실행합니다.')
+  if verbose :
+    print('[stub prepocessing] stub의 총합이 홀수입니다. degree sequence의 최소한의 수정을 실행합니다.')
   
   try :
-    min_degree = min(degree_sequence)
-    min_idx = degree_sequence.index(min_degree)
+    min_idx = int(degree_array.argmin())
+    min_degree = degree_sequence[min_idx]
 
     degree_sequence[min_idx] += 1
-    print('[stub prepocessing] 보정 완료 : 최소 차수({})를 1 증가시켜 {}로 수정하였습니다. 보정된 차수 합 : {}'.format(min_degree, min_degree+1, sum(degree_sequence)))
+    if verbose :
+      print('[stub prepocessing] 보정 완료 : 최소 차수({})를 1 증가시켜 {}로 수정하였습니다. 보정된 차수 합 : {}'.format(min_degree, min_degree+1, sum(degree_sequence)))
 
   except ValueError :
     raise ValueError('입력한 degree sequence가 잘못된 형태입니다. 올바른 네트워크를 network_pkg.utils.preprocessing.preprocess_network()로 전처리하십시오.')
@@ -0,0 +1,430 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+from scipy.stats import norm
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.edge_file_utils import iter_edge_chunks
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
+# 🚨 메모리보다 큰 네트워크를 위한 디스크 그래프 형식 : 폴더 하나에 CSR 배열을 .npy로 저장하고 memory mapping으로 열어 CSRGraph로 사용
+#    - indptr.npy (int64, N+1) / indices.npy (int32, 2M) / labels.npy (노드 이름) / meta.json (노드 수, 엣지 수, 전처리 내역)
+# 🚨 생성은 외부 정렬(external distribution sort) : 엣지 파일을 chunk 단위로 읽어 행 범위별 bucket 파일로 나눈 뒤 bucket마다 정렬 / 중복 제거
+#    → 메모리는 O(N) 배열 + bucket 하나 크기(bucket_edges)만 사용
+# 🚨 이 모듈의 BFS / 연결 구성요소 / degree 통계 함수는 memory mapping 배열을 직접 읽으며 O(N) 작업 배열만 사용
+#    (AnalysisContext, calculate_global 등 scipy 인접 행렬을 만드는 함수는 O(M) 메모리를 사용하므로 큰 디스크 그래프에는 사용하지 않음)
+
+DISK_GRAPH_VERSION = 1
+
+# -------------------- 디스크 그래프 생성 함수 : 엣지 리스트 파일 → memory mapping CSR 폴더 (외부 정렬) --------------------
+@profile_stage('loader')
+def build_disk_graph(file_path, output_dir, chunk_size = 1 << 24, bucket_edges = 1 << 24) :
+
+  # 🚨 전처리 규칙은 load_network_from_file_fast(as_csr = True) + preprocess_network와 동일
+  #    - self-loop 제거, multi-edge 중복 제거, self-loop에만 등장한 노드 제외, 노드 이름은 household0001 형태 (등장 순서)
+  #    - 파싱은 load_network_from_file_fast와 같은 iter_edge_chunks 사용 (쉼표가 정확히 1개가 아닌 줄은 줄 번호와 함께 ValueError, 디스크에 기록하지 않음)
+  # 🚨 단계
+  #    1. 파일을 chunk_size 바이트씩 읽어 정수 엣지를 임시 파일에 기록하고 노드별 (중복 포함) degree 누적
+  #    2. 임시 엣지를 양방향으로 펼쳐 행 범위별 bucket 파일에 분배 (bucket 하나가 약 bucket_edges개가 되도록 degree 누적합으로 범위 결정)
+  #    3. bucket마다 (행, 열) 정렬 + 중복 제거 → 정확한 degree 계산 → indptr / indices .npy에 순서대로 기록
+  # 🚨 반환값 : output_dir (open_disk_graph로 열기)
+
+  if not isinstance(chunk_size, int) or chunk_size < 1 :
+    raise ValueError('chunk_size는 1 이상의 정수여야 합니다. 현재 chunk_size = {}'.format(chunk_size))
+
+  if not isinstance(bucket_edges, int) or bucket_edges < 1 :
+    raise ValueError('bucket_edges는 1 이상의 정수여야 합니다. 현재 bucket_edges = {}'.format(bucket_edges))
+
+  os.makedirs(output_dir, exist_ok = True)
+  work_dir = tempfile.mkdtemp(prefix = '.build_', dir = output_dir)
+
+  try :
+    # ---------- 1단계 : 파싱 + 임시 엣지 파일 + degree 상한 ----------
+
+    id_map = {}
+    raw_degree = np.zeros(0, dtype = np.int64)
+    num_raw_edges = 0
+    self_loops = 0
+    edge_path = os.path.join(work_dir, 'edges.bin')
+
+    with open(edge_path, 'wb') as edge_file :
+      for edges in iter_edge_chunks(file_path, id_map, chunk_size) :
+        loop_mask = edges[:, 0] == edges[:, 1]
+        self_loops += int(loop_mask.sum())
+        edges = edges[~loop_mask]
+
+        if len(raw_degree) < len(id_map) :
+          raw_degree = np.concatenate([raw_degree, np.zeros(len(id_map) - len(raw_degree), dtype = np.int64)])
+
+        raw_degree += np.bincount(edges.ravel(), minlength = len(raw_degree))
+        num_raw_edges += len(edges)
+        edge_file.write(np.ascontiguousarray(edges, dtype = np.int32).tobytes())
+
+    if num_raw_edges == 0 :
+      raise ValueError('입력한 파일에 self-loop가 아닌 엣지가 없습니다. 파일을 확인하십시오. 현재 경로 : {}'.format(file_path))
+
+    # self-loop에만 등장한 노드 제외 (household 번호는 원래 등장 순서 유지)
+    used = raw_degree > 0
+    new_index = (np.cumsum(used) - 1).astype(np.int32)
+    raw_degree = raw_degree[used]
+    n = len(raw_degree)
+
+    labels = np.array(['household{:04d}'.format(i + 1) for i in np.flatnonzero(used)])
+    del id_map
+
+    # ---------- 2단계 : 행 범위별 bucket 분배 ----------
+
+    # bounds[b] ~ bounds[b+1] 행이 bucket b (degree 상한 누적합 기준으로 bucket_edges개씩)
+    cumulative = np.cumsum(raw_degree)
+    bounds = np.unique(np.concatenate([[0], np.searchsorted(cumulative, np.arange(bucket_edges, cumulative[-1], bucket_edges), side = 'right'), [n]]))
+    num_buckets = len(bounds) - 1
+    bucket_paths = [os.path.join(work_dir, 'bucket{}.bin'.format(b)) for b in range(num_buckets)]
+    bucket_files = [open(path, 'wb') for path in bucket_paths]
+
+    try :
+      edge_chunk = max(1, bucket_edges // 2)
+
+      for start in range(0, num_raw_edges, edge_chunk) :
+        edges = np.fromfile(edge_path, dtype = np.int32, count = 2 * min(edge_chunk, num_raw_edges - start), offset = 8 * start).reshape(-1, 2)
+        edges = new_index[edges]
+
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        bucket = np.searchsorted(bounds, rows, side = 'right') - 1
+        order = np.argsort(bucket, kind = 'stable')
+        splits = np.searchsorted(bucket[order], np.arange(1, num_buckets))
+
+        for b, part in enumerate(np.split(order, splits)) :
+          if len(part) > 0 :
+            bucket_files[b].write(np.stack([rows[part], cols[part]], axis = 1).astype(np.int32).tobytes())
+
+    finally :
+      for bucket_file in bucket_files :
+        bucket_file.close()
+
+    os.remove(edge_path)
+
+    # ---------- 3단계 : bucket별 정렬 + 중복 제거 → 정확한 degree ----------
+
+    degree = np.zeros(n, dtype = np.int64)
+
+    for b, path in enumerate(bucket_paths) :
+      pairs = np.fromfile(path, dtype = np.int32).reshape(-1, 2)
+      keys = np.unique(pairs[:, 0].astype(np.int64) * n + pairs[:, 1])
+      rows = keys // n
+
+      degree[bounds[b]:bounds[b + 1]] = np.bincount(rows - bounds[b], minlength = bounds[b + 1] - bounds[b])
+      (keys % n).astype(np.int32).tofile(path)
+
+    # ---------- indptr / indices 기록 ----------
+
+    indptr = np.zeros(n + 1, dtype = np.int64)
+    np.cumsum(degree, out = indptr[1:])
+    num_entries = int(indptr[-1])
+
+    np.save(os.path.join(output_dir, 'indptr.npy'), indptr)
+    np.save(os.path.join(output_dir, 'labels.npy'), labels)
+
+    indices = np.lib.format.open_memmap(os.path.join(output_dir, 'indices.npy'), mode = 'w+', dtype = np.int32, shape = (num_entries,))
+
+    for b, path in enumerate(bucket_paths) :
+      indices[indptr[bounds[b]]:indptr[bounds[b + 1]]] = np.fromfile(path, dtype = np.int32)
+      os.remove(path)
+
+    indices.flush()
+    del indices
+
+    meta = {'version' : DISK_GRAPH_VERSION,
+            'source' : os.path.abspath(file_path),
+            'num_nodes' : n,
+            'num_edges' : num_entries // 2,
+            'self_loops' : self_loops,
+            'multi_edges' : num_raw_edges - num_entries // 2,
+            'num_buckets' : num_buckets}
+
+    with open(os.path.join(output_dir, 'meta.json'), 'w') as f :
+      json.dump(meta, f, indent = 2)
+
+  finally :
+    shutil.rmtree(work_dir, ignore_errors = True)
+
+  return output_dir
+
+
+
+
+
+# -------------------- 디스크 그래프 열기 함수 : memory mapping 배열을 공유하는 CSRGraph 반환 --------------------
+def open_disk_graph(path, with_labels = True) :
+
+  # 🚨 indptr / indices는 읽기 전용 memory mapping (필요한 부분만 OS가 디스크에서 읽음)
+  # 🚨 with_labels = False이면 노드 이름 테이블을 읽지 않고 0 ~ N-1 인덱스를 노드로 사용
+
+  meta_path = os.path.join(path, 'meta.json')
+
+  if not os.path.exists(meta_path) :
+    raise FileNotFoundError('디스크 그래프 폴더가 아닙니다. build_disk_graph()로 먼저 생성하십시오. 현재 경로 : {}'.format(path))
+
+  with open(meta_path) as f :
+    meta = json.load(f)
+
+  if meta.get('version') != DISK_GRAPH_VERSION :
+    raise ValueError('디스크 그래프 형식 버전이 다릅니다. build_disk_graph()로 다시 생성하십시오. 현재 버전 = {}'.format(meta.get('version')))
+
+  indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode = 'r')
+  indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode = 'r')
+  labels = np.load(os.path.join(path, 'labels.npy')).tolist() if with_labels else None
+
+  return CSRGraph(indptr, indices, labels)
+
+
+
+
+
+# -------------------- degree 통계 함수 : indptr만 읽어 계산 --------------------
+def degree_stats(graph) :
+
+  if not isinstance(graph, CSRGraph) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. CSRGraph 형태로 입력하십시오.')
+
+  degree = graph.degree()
+
+  if len(degree) == 0 :
+    raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
+
+  return {'N' : len(degree),
+          'M' : graph.number_of_edges(),
+          'mean' : float(degree.mean()),
+          'std' : float(degree.std()),
+          'min' : int(degree.min()),
+          'max' : int(degree.max()),
+          'num_isolated' : int((degree == 0).sum()),
+          'histogram' : np.bincount(degree)}
+
+
+
+
+
+# -------------------- BFS 보조 함수 : numpy frontier 확장 (dist 배열에 거리 기록, 도달한 노드를 층별로 반환) --------------------
+def _bfs_levels(indptr, indices, source, dist, max_edges) :
+
+  # 🚨 frontier 노드들의 이웃을 한 번에 모으되, 모으는 이웃 수가 max_edges를 넘지 않도록 frontier를 나누어 처리 (작업 배열 O(N))
+  # 🚨 dist는 미방문 = -1로 초기화된 int32 배열
+
+  dist[source] = 0
+  frontier = np.array([source], dtype = np.int64)
+  levels = [frontier]
+  level = 0
+
+  while len(frontier) > 0 :
+    level += 1
+    starts = np.asarray(indptr[frontier])
+    counts = np.asarray(indptr[frontier + 1]) - starts
+    cumulative = np.cumsum(counts)
+    next_parts = []
+    pos = 0
+
+    while pos < len(frontier) :
+      done = cumulative[pos - 1] if pos > 0 else 0
+      stop = max(pos + 1, int(np.searchsorted(cumulative, done + max_edges, side = 'right')))
+      part_counts = counts[pos:stop]
+      total = int(part_counts.sum())
+
+      if total > 0 :
+        offsets = np.repeat(starts[pos:stop] - (np.cumsum(part_counts) - part_counts), part_counts)
+        neighbors = np.asarray(indices[offsets + np.arange(total)])
+        neighbors = np.unique(neighbors[dist[neighbors] < 0])
+        dist[neighbors] = level
+        next_parts.append(neighbors.astype(np.int64))
+
+      pos = stop
+
+    frontier = np.concatenate(next_parts) if next_parts else np.zeros(0, dtype = np.int64)
+
+    if len(frontier) > 0 :
+      levels.append(frontier)
+
+  return levels
+
+
+
+
+
+# -------------------- BFS 거리 함수 : source 하나에서 모든 노드까지의 거리 (도달 불가 = -1) --------------------
+@profile_stage('kernel')
+def bfs_distances(graph, source, max_edges = 1 << 22) :
+
+  if not isinstance(graph, CSRGraph) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. CSRGraph 형태로 입력하십시오.')
+
+  n = len(graph)
+
+  if not 0 <= source < n :
+    raise ValueError('source 인덱스가 올바르지 않습니다. 노드 수 = {}, 현재 source = {}'.format(n, source))
+
+  dist = np.full(n, -1, dtype = np.int32)
+  _bfs_levels(graph.indptr, graph.indices, int(source), dist, max_edges)
+
+  return dist
+
+
+
+
+
+# -------------------- 연결 구성요소 함수 : BFS 반복으로 노드별 구성요소 번호와 크기 계산 --------------------
+@profile_stage('kernel')
+def connected_components_disk(graph, max_edges = 1 << 22) :
+
+  # 🚨 구성요소 번호는 가장 작은 노드 인덱스 순서 (같은 크기의 LCC가 여러 개이면 먼저 등장한 노드의 구성요소가 LCC, nx와 동일)
+  # 🚨 반환값 : (labels (N,), sizes (구성요소 수,))
+
+  if not isinstance(graph, CSRGraph) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. CSRGraph 형태로 입력하십시오.')
+
+  n = len(graph)
+  dist = np.full(n, -1, dtype = np.int32)
+  labels = np.full(n, -1, dtype = np.int32)
+  sizes = []
+  pos = 0
+
+  while pos < n :
+    # 아직 방문하지 않은 가장 작은 노드를 block 단위로 탐색 (pos는 앞으로만 이동하므로 전체 탐색은 O(N))
+    unvisited = np.flatnonzero(labels[pos:pos + (1 << 16)] < 0)
+
+    if len(unvisited) == 0 :
+      pos += 1 << 16
+      continue
+
+    source = pos + int(unvisited[0])
+    reached = np.concatenate(_bfs_levels(graph.indptr, graph.indices, source, dist, max_edges))
+    labels[reached] = len(sizes)
+    sizes.append(len(reached))
+    pos = source + 1
+
+  return labels, np.asarray(sizes, dtype = np.int64)
+
+
+
+
+
+# -------------------- 전역 지표 함수 : LCC 크기, 표본 APL (신뢰구간), 지름 (BFS만 사용, O(N) 메모리) --------------------
+@profile_stage('global')
+def disk_global_metrics(graph, n_sources = 64, seed = None, confidence = 0.95, exact_diameter = False, max_edges = 1 << 22) :
+
+  # 🚨 APL : LCC에서 비복원 추출한 n_sources개 source의 BFS 평균 거리 (distance_utils.estimate_apl과 같은 추출 / 신뢰구간, 같은 seed면 같은 source)
+  # 🚨 DIAM : exact_diameter = False이면 double sweep + 표본 source eccentricity의 최댓값 (하한), True이면 iFUB로 정확한 지름
+  # 🚨 반환값 : {'N', 'M', 'num_components', 'lcc_size', 'APL', 'stderr', 'ci_low', 'ci_high', 'n_sources', 'DIAM', 'DIAM_exact'}
+
+  if not isinstance(n_sources, int) or n_sources < 1 :
+    raise ValueError('source 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(n_sources))
+
+  if not 0 < confidence < 1 :
+    raise ValueError('신뢰수준은 0과 1 사이의 값이어야 합니다. 현재 값 = {}'.format(confidence))
+
+  labels, sizes = connected_components_disk(graph, max_edges)
+
+  if len(sizes) == 0 :
+    raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
+
+  lcc_idx = np.flatnonzero(labels == int(np.argmax(sizes)))
+  del labels
+
+  n = len(lcc_idx)
+  result = {'N' : len(graph), 'M' : graph.number_of_edges(), 'num_components' : len(sizes), 'lcc_size' : n}
+
+  if n <= 1 :
+    result.update({'APL' : np.nan, 'stderr' : np.nan, 'ci_low' : np.nan, 'ci_high' : np.nan, 'n_sources' : 0, 'DIAM' : 0, 'DIAM_exact' : True})
+    return result
+
+  # ---------- 표본 source BFS : APL 추정 + eccentricity ----------
+
+  k = min(n_sources, n)
+  sources = lcc_idx[np.sort(np.random.default_rng(seed).choice(n, size = k, replace = False))]
+  mean_dist = np.empty(k)
+  lb = 0
+
+  for i, source in enumerate(sources) :
+    dist = bfs_distances(graph, int(source), max_edges)
+    mean_dist[i] = dist[dist > 0].sum() / (n - 1)
+    lb = max(lb, int(dist.max()))
+
+  apl = float(mean_dist.mean())
+
+  if k == n :
+    stderr = 0.0
+  elif k == 1 :
+    stderr = np.inf
+  else :
+    stderr = float(mean_dist.std(ddof = 1) / np.sqrt(k) * np.sqrt(1 - k / n))
+
+  z = norm.ppf(0.5 + confidence / 2)
+  result.update({'APL' : apl, 'stderr' : stderr, 'ci_low' : float(apl - z * stderr), 'ci_high' : float(apl + z * stderr), 'n_sources' : k})
+
+  # ---------- 지름 ----------
+
+  if exact_diameter :
+    result.update({'DIAM' : disk_diameter(graph, lcc_idx, max_edges), 'DIAM_exact' : True})
+  else :
+    result.update({'DIAM' : max(lb, _double_sweep(graph, lcc_idx, max_edges)[0]), 'DIAM_exact' : k == n})
+
+  return result
+
+
+
+
+
+# -------------------- 보조 함수 : LCC에서 degree 최대 노드로부터 double sweep (지름 하한, 양 끝 노드와 거리 배열) --------------------
+def _double_sweep(graph, lcc_idx, max_edges) :
+
+  degree = graph.degree()
+  r = int(lcc_idx[np.argmax(degree[lcc_idx])])
+  d_r = bfs_distances(graph, r, max_edges)
+  a = int(np.argmax(d_r))
+  d_a = bfs_distances(graph, a, max_edges)
+
+  return int(d_a.max()), r, a, d_a
+
+
+
+
+
+# -------------------- 정확한 지름 계산 함수 (iFUB) : distance_utils.diameter_from_adjacency와 같은 방식을 디스크 BFS로 실행 --------------------
+@profile_stage('kernel')
+def disk_diameter(graph, lcc_idx = None, max_edges = 1 << 22) :
+
+  if lcc_idx is None :
+    labels, sizes = connected_components_disk(graph, max_edges)
+    lcc_idx = np.flatnonzero(labels == int(np.argmax(sizes)))
+
+  if len(lcc_idx) <= 1 :
+    return 0
+
+  lb, r, a, d_a = _double_sweep(graph, lcc_idx, max_edges)
+
+  # a - b 최단경로의 중간 노드를 u로 사용 (eccentricity가 작을 가능성이 높음)
+  b = int(np.argmax(d_a))
+  d_b = bfs_distances(graph, b, max_edges)
+  lb = max(lb, int(d_b.max()))
+  middle = np.flatnonzero((d_a + d_b == d_a[b]) & (d_a == d_a[b] // 2))
+  u = int(middle[0]) if len(middle) > 0 else r
+  del d_a, d_b
+
+  d_u = bfs_distances(graph, u, max_edges)
+  ecc_u = int(d_u.max())
+  lb = max(lb, ecc_u)
+
+  # ---------- 바깥 층부터 fringe eccentricity 계산 ----------
+
+  for i in range(ecc_u, 0, -1) :
+    if lb >= 2 * i :
+      break
+
+    for v in np.flatnonzero(d_u == i) :
+      lb = max(lb, int(bfs_distances(graph, int(v), max_edges).max()))
+
+      if lb >= 2 * i :
+        break
+
+  return lb
@@ -0,0 +1,229 @@
+import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components, shortest_path
+from scipy.stats import norm
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.matrix_utils import to_csr_adjacency
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
+# -------------------- 거리 커널 함수 : LCC에서 source별 BFS 1회로 거리 기반 지표를 한 번에 계산하는 함수 --------------------
+def calculate_distance_metrics(G, chunk_size = 256) :
+
+  # 🚨 closeness, harmonic, eccentricity, APL, DIAM을 하나의 all-pairs BFS로 동시에 계산
+  # 🚨 경로 자체는 저장하지 않고 chunk_size개의 source에 대한 거리 행만 유지 (source당 O(N) 메모리)
+
+  if not isinstance(G, (nx.Graph, CSRGraph)) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+  if not isinstance(chunk_size, int) or chunk_size < 1 :
+    raise ValueError('chunk_size는 1 이상의 정수여야 합니다. 현재 chunk_size = {}'.format(chunk_size))
+
+  nodes = G.nodes() if isinstance(G, CSRGraph) else list(G.nodes())
+
+  if len(nodes) == 0 :
+    return {'nodes' : [], 'closeness' : {}, 'harmonic' : {}, 'eccentricity' : {}, 'APL' : np.nan, 'DIAM' : np.nan}
+
+  # ---------- 연결 구성요소 및 LCC 추출 (1회) ----------
+
+  A = to_csr_adjacency(G, nodes)
+  _, labels = connected_components(A, directed = False)
+
+  # 크기가 같은 구성요소가 여러 개이면 먼저 등장한 노드의 구성요소를 사용 (nx.connected_components와 동일)
+  lcc_idx = np.flatnonzero(labels == np.argmax(np.bincount(labels)))
+
+  return distance_metrics_from_adjacency(A, nodes, lcc_idx, chunk_size)
+
+
+
+
+
+# -------------------- 거리 커널 본체 : 인접 행렬과 LCC 인덱스가 이미 주어진 경우 (AnalysisContext에서 재사용) --------------------
+@profile_stage('kernel')
+def distance_metrics_from_adjacency(A, nodes, lcc_idx, chunk_size = 256) :
+
+  lcc_nodes = [nodes[i] for i in lcc_idx]
+  n = len(lcc_idx)
+
+  if n <= 1 :
+    return {'nodes' : lcc_nodes,
+            'closeness' : {node : 0.0 for node in lcc_nodes},
+            'harmonic' : {node : 0.0 for node in lcc_nodes},
+            'eccentricity' : {node : 0 for node in lcc_nodes},
+            'APL' : np.nan, 'DIAM' : np.nan}
+
+  A_lcc = A if n == A.shape[0] else A[lcc_idx][:, lcc_idx]
+
+  # ---------- source chunk 단위 BFS 및 지표 누적 ----------
+
+  dist_sum = np.empty(n)
+  harmonic_sum = np.empty(n)
+  ecc = np.empty(n, dtype = np.int64)
+
+  for start in range(0, n, chunk_size) :
+    sources = np.arange(start, min(start + chunk_size, n))
+    D = shortest_path(A_lcc, method = 'D', directed = False, unweighted = True, indices = sources)
+
+    dist_sum[sources] = D.sum(axis = 1)
+    ecc[sources] = D.max(axis = 1)
+
+    with np.errstate(divide = 'ignore') :
+      inv = 1.0 / D
+    inv[D == 0] = 0.0
+    harmonic_sum[sources] = inv.sum(axis = 1)
+
+  # ---------- 지표 정리 ----------
+
+  closeness = (n - 1) / dist_sum
+  harmonic = harmonic_sum / (n - 1)
+
+  return {'nodes' : lcc_nodes,
+          'closeness' : {node : float(closeness[i]) for i, node in enumerate(lcc_nodes)},
+          'harmonic' : {node : float(harmonic[i]) for i, node in enumerate(lcc_nodes)},
+          'eccentricity' : {node : int(ecc[i]) for i, node in enumerate(lcc_nodes)},
+          'APL' : float(dist_sum.sum() / (n * (n - 1))),
+          'DIAM' : int(ecc.max())}
+
+
+
+
+
+# -------------------- 보조 함수 : 네트워크에서 LCC 인접 행렬 추출 --------------------
+def _lcc_adjacency(G) :
+
+  if not isinstance(G, (nx.Graph, CSRGraph)) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+  nodes = G.nodes() if isinstance(G, CSRGraph) else list(G.nodes())
+
+  if len(nodes) == 0 :
+    raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
+
+  A = to_csr_adjacency(G, nodes)
+  _, labels = connected_components(A, directed = False)
+  lcc_idx = np.flatnonzero(labels == np.argmax(np.bincount(labels)))
+
+  return A if len(lcc_idx) == A.shape[0] else A[lcc_idx][:, lcc_idx]
+
+
+
+
+
+# -------------------- 정확한 지름 계산 함수 (iFUB) : 대부분의 네트워크에서 BFS 몇 번만으로 LCC의 지름을 계산 --------------------
+@profile_stage('kernel')
+def diameter_from_adjacency(A_lcc, chunk_size = 64) :
+
+  # 🚨 iFUB (iterative Fringe Upper Bound) : 중심 노드 u의 BFS 층을 바깥부터 처리
+  #    - 층 i의 노드들의 eccentricity 최대값으로 하한(lb) 갱신
+  #    - 아직 처리하지 않은 노드는 모두 층 i 이내이고 그 사이 거리는 2i 이하이므로, lb >= 2i이면 남은 층을 볼 필요가 없음
+  # 🚨 연결된 인접 행렬(LCC)을 입력해야 함
+
+  n = A_lcc.shape[0]
+
+  if n <= 1 :
+    return 0
+
+  def bfs(sources) :
+    return shortest_path(A_lcc, method = 'D', directed = False, unweighted = True, indices = sources)
+
+  # ---------- 중심 노드 선택 : degree 최대 노드에서 double sweep ----------
+
+  degrees = np.diff(A_lcc.indptr)
+  r = int(np.argmax(degrees))
+
+  d_r = bfs([r])[0]
+  a = int(np.argmax(d_r))
+  d_a = bfs([a])[0]
+  lb = int(d_a.max())
+
+  # a - b 최단경로의 중간 노드를 u로 사용 (eccentricity가 작을 가능성이 높음)
+  b = int(np.argmax(d_a))
+  d_b = bfs([b])[0]
+  lb = max(lb, int(d_b.max()))
+  middle = np.flatnonzero((d_a + d_b == d_a[b]) & (d_a == d_a[b] // 2))
+  u = int(middle[0]) if len(middle) > 0 else r
+
+  d_u = bfs([u])[0].astype(np.int64)
+  ecc_u = int(d_u.max())
+  lb = max(lb, ecc_u)
+
+  # ---------- 바깥 층부터 fringe eccentricity 계산 ----------
+
+  for i in range(ecc_u, 0, -1) :
+    if lb >= 2 * i :
+      break
+
+    fringe = np.flatnonzero(d_u == i)
+
+    for start in range(0, len(fringe), chunk_size) :
+      lb = max(lb, int(bfs(fringe[start:start + chunk_size]).max()))
+
+      if lb >= 2 * i :
+        break
+
+  return lb
+
+
+
+
+
+# -------------------- 정확한 지름 계산 함수 : 네트워크 입력 --------------------
+def calculate_diameter(G, chunk_size = 64) :
+
+  if not isinstance(chunk_size, int) or chunk_size < 1 :
+    raise ValueError('chunk_size는 1 이상의 정수여야 합니다. 현재 chunk_size = {}'.format(chunk_size))
+
+  return diameter_from_adjacency(_lcc_adjacency(G), chunk_size)
+
+
+
+
+
+# -------------------- 표본 APL 추정 함수 : 일부 source의 BFS로 LCC의 APL과 신뢰구간을 추정 --------------------
+@profile_stage('kernel')
+def apl_sample_from_adjacency(A_lcc, n_sources, seed = None, confidence = 0.95, chunk_size = 256) :
+
+  # 🚨 source를 비복원 추출하여 source별 평균 거리의 표본 평균으로 APL을 추정 (모든 source를 쓰면 정확한 APL과 같음)
+  # 🚨 신뢰구간은 정규 근사 + 유한 모집단 보정 sqrt(1 - k/n)
+
+  if not isinstance(n_sources, int) or n_sources < 1 :
+    raise ValueError('source 수는 1 이상의 정수여야 합니다. 현재 값 = {}'.format(n_sources))
+
+  if not 0 < confidence < 1 :
+    raise ValueError('신뢰수준은 0과 1 사이의 값이어야 합니다. 현재 값 = {}'.format(confidence))
+
+  n = A_lcc.shape[0]
+
+  if n <= 1 :
+    return {'APL' : np.nan, 'stderr' : np.nan, 'ci_low' : np.nan, 'ci_high' : np.nan, 'n_sources' : 0}
+
+  k = min(n_sources, n)
+  sources = np.sort(np.random.default_rng(seed).choice(n, size = k, replace = False))
+
+  mean_dist = np.empty(k)
+
+  for start in range(0, k, chunk_size) :
+    D = shortest_path(A_lcc, method = 'D', directed = False, unweighted = True, indices = sources[start:start + chunk_size])
+    mean_dist[start:start + chunk_size] = D.sum(axis = 1) / (n - 1)
+
+  apl = float(mean_dist.mean())
+
+  if k == n :
+    stderr = 0.0
+  elif k == 1 :
+    stderr = np.inf
+  else :
+    stderr = float(mean_dist.std(ddof = 1) / np.sqrt(k) * np.sqrt(1 - k / n))
+
+  z = norm.ppf(0.5 + confidence / 2)
+
+  return {'APL' : apl, 'stderr' : stderr, 'ci_low' : float(apl - z * stderr), 'ci_high' : float(apl + z * stderr), 'n_sources' : k}
+
+
+
+
+
+# -------------------- 표본 APL 추정 함수 : 네트워크 입력 --------------------
+def estimate_apl(G, n_sources = 256, seed = None, confidence = 0.95) :
+
+  return apl_sample_from_adjacency(_lcc_adjacency(G), n_sources, seed, confidence)
@@ -0,0 +1,63 @@
+import numpy as np
+
+# 🚨 'nodeA,nodeB' 엣지 리스트 파일을 chunk 단위로 읽는 공용 파서 (load_network_from_file_fast, build_disk_graph에서 사용)
+
+# -------------------- 엣지 파일을 chunk 단위로 읽어 정수 인덱스 엣지 배열을 생성하는 함수 --------------------
+def iter_edge_chunks(file_path, id_map, chunk_size = 1 << 24) :
+
+  # 🚨 chunk_size 바이트 단위로 읽어 문자열 분리 → 원본 ID를 정수 인덱스로 일괄 변환(unique/inverse) → (엣지 수, 2) int32 배열을 chunk마다 반환
+  # 🚨 id_map(원본 ID → 정수 인덱스)은 호출한 쪽에서 넘긴 dict를 파일 전체에서 갱신 (정수 인덱스는 파일 전체에서 처음 등장한 순서)
+  # 🚨 모든 줄의 쉼표가 정확히 1개인지 매번 검사 → 형식이 잘못된 줄은 숨기지 않고 줄 번호와 함께 ValueError 발생
+  #    (전체 토큰 수만 비교하면 'a' / 'b,c,d' 처럼 쉼표 수가 상쇄되는 줄이 잘못된 엣지로 다시 짝지어짐)
+
+  line_offset = 0
+
+  try :
+    f = open(file_path, 'r')
+
+  except FileNotFoundError :
+    raise FileNotFoundError('입력한 파일 경로가 잘못되었습니다. 파일 경로를 확인하십시오. 현재 경로 : {}'.format(file_path))
+
+  with f :
+    while True :
+      lines = f.readlines(chunk_size)
+
+      if not lines :
+        break
+
+      lines = [line.rstrip('\r\n') for line in lines]
+      chunk_start = line_offset
+      line_offset += len(lines)
+
+      # 빈 줄은 건너뜀 (파일 끝의 개행 등)
+      if not all(lines) :
+        line_numbers = [chunk_start + i + 1 for i, line in enumerate(lines) if line]
+        lines = [line for line in lines if line]
+      else :
+        line_numbers = None
+
+      if not lines :
+        continue
+
+      # ---------- 줄 단위 형식 검사 ----------
+
+      for i, line in enumerate(lines) :
+        if line.count(',') != 1 :
+          line_number = line_numbers[i] if line_numbers else chunk_start + i + 1
+          raise ValueError('입력한 파일의 형식이 올바르지 않습니다. 각 줄은 \'nodeA,nodeB\' 형식이어야 합니다. {}번째 줄 : {}'.format(line_number, line))
+
+      # ---------- 문자열 일괄 분리 ----------
+
+      tokens = ','.join(lines).split(',')
+
+      # ---------- 원본 ID → 정수 인덱스 (등장 순서 유지) ----------
+
+      uniq, first_idx, inverse = np.unique(np.array(tokens), return_index = True, return_inverse = True)
+
+      for token in uniq[np.argsort(first_idx, kind = 'stable')].tolist() :
+        if token not in id_map :
+          id_map[token] = len(id_map)
+
+      codes = np.fromiter((id_map[token] for token in uniq.tolist()), dtype = np.int32, count = len(uniq))
+
+      yield codes[inverse].reshape(-1, 2)
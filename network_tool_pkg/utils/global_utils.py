@@ -4,8 +4,15 @@ import numpy as np
 # LCC 상태 진단을 위해 해당 모듈을 불러옴
 from network_tool_pkg.analysis.random_nets_generator import RandomNetGenerator
 
+# 연결 구성요소, LCC, APL/DIAM 거리 커널 결과를 네트워크별로 한 번만 계산하여 공유하는 컨텍스트
+from network_tool_pkg.utils.context_utils import AnalysisContext
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
 # -------------------- 주어진 그래프에서 가장 큰 연결 구성요소 (LCC) 추출하여 반환 ---------------
-def get_largest_connected_component(G):
+def get_largest_connected_component(G, copy = True):
+
+  # 🚨 copy = False 이면 복사 없이 subgraph view를 반환 (읽기 전용으로만 사용)
 
   if G.number_of_nodes() == 0 :
     return G
@@ -16,6 +23,9 @@ def get_largest_connected_component(G):
   
   components = nx.connected_components(G)
   largest_component_nodes = max(components, key=len)
+
+  if not copy :
+    return G.subgraph(largest_component_nodes)
   
   return G.subgraph(largest_component_nodes).copy()
   
@@ -23,43 +33,75 @@ def get_largest_connected_component(G):
 
 
 
+# -------------------- 보조 함수 : 입력한 컨텍스트 확인 (없으면 새로 생성) --------------------
+def _check_context(G, context) :
+
+  if context is None :
+    return AnalysisContext(G)
+
+  if context.G is not G :
+    raise ValueError('입력한 AnalysisContext가 입력한 네트워크에 대한 컨텍스트가 아닙니다.')
+
+  return context
+
+
+
+
+
+# approx 모드에서 seed를 입력하지 않았을 때 사용하는 고정 seed (같은 네트워크는 항상 같은 APL 추정값)
+DEFAULT_APL_SEED = 0
+
 # -------------------- 전역 지표 계산 함수 : CC(클러스터링 계수), APL(평균 경로 길이), DIAM(지름) --------------------
-def calculate_global(G) :
+@profile_stage('global')
+def calculate_global(G, context = None, mode = 'auto', exact_threshold = 5000, n_sources = 256, seed = None) :
+
+  # 🚨 mode = 'exact' : 모든 source BFS로 정확한 APL, DIAM 계산 (O(N·M))
+  # 🚨 mode = 'approx' : n_sources개 표본 source로 APL 추정 + iFUB로 정확한 DIAM 계산 (신뢰구간은 estimate_apl 참고)
+  # 🚨 mode = 'auto' : LCC 노드 수가 exact_threshold 이하이면 'exact', 초과하면 'approx'
+  # 🚨 approx 결과에는 'APL_exact' = False와 'APL_ci'(신뢰구간, 표준오차, source 수, seed)를 추가 (exact 결과는 기존과 같은 CC / APL / DIAM)
+  #    seed = None이면 DEFAULT_APL_SEED를 사용하여 같은 네트워크의 결과가 실행마다 달라지지 않도록 함
 
   # ---------- 네트워크 유효성 검사 ----------
   
-  if not isinstance(G, nx.Graph) :
-    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 형태로 입력하십시오.')
+  if not isinstance(G, (nx.Graph, CSRGraph)) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+  if mode not in ('auto', 'exact', 'approx') :
+    raise ValueError("mode는 'auto', 'exact', 'approx' 중 하나여야 합니다. 현재 mode = {}".format(mode))
 
   if G.number_of_nodes() == 0:
     return {'CC' : np.nan, 'APL' : np.nan, 'DIAM' : np.nan}
 
+  context = _check_context(G, context)
+
   # ---------- 전역 지표 생성 : CC ----------
 
   # 클러스터링 계수 ~ connected 상관없이 반환 가능
-  cc = nx.average_clustering(G)
+  cc = context.average_clustering
 
-  # ---------- 네트워크 Connected 여부 판단 ----------
+  # ---------- 전역 지표 생성 : APL, DIAM ----------
 
-  if nx.is_connected(G) :
-    apl = nx.average_shortest_path_length(G)
-    diam = nx.diameter(G)
-    return {'CC' : cc, 'APL' : apl, 'DIAM' : diam}
+  # 노드가 하나뿐인 네트워크는 연결된 네트워크로 취급 (경로 길이 0)
+  if G.number_of_nodes() == 1 :
+    return {'CC' : cc, 'APL' : 0.0, 'DIAM' : 0}
 
-  # ---------- Disonnected 네트워크에서는 LCC 사용 ----------
-  
-  G_lcc = get_largest_connected_component(G)
+  if mode == 'auto' :
+    mode = 'exact' if context.lcc_size <= exact_threshold else 'approx'
+
+  if mode == 'approx' :
+    if seed is None :
+      seed = DEFAULT_APL_SEED
 
-  if G_lcc.number_of_nodes() <= 1 :
-    return {"CC": cc, "APL": np.nan, "DIAM": np.nan}
+    estimate = context.estimate_apl(n_sources, seed)
 
-  if G_lcc.number_of_edges() == 0 :
-    return {"CC": cc, "APL": np.nan, "DIAM": np.nan}
+    return {'CC' : cc, 'APL' : estimate['APL'], 'DIAM' : context.diameter(), 'APL_exact' : False,
+            'APL_ci' : {'ci_low' : estimate['ci_low'], 'ci_high' : estimate['ci_high'], 'stderr' : estimate['stderr'],
+                        'n_sources' : estimate['n_sources'], 'seed' : seed}}
 
-  apl = nx.average_shortest_path_length(G_lcc)
-  diam = nx.diameter(G_lcc)
+  # 연결 여부 판단과 LCC 추출은 거리 커널에서 한 번만 수행 (Disconnected 네트워크는 LCC 사용)
+  metrics = context.distance_metrics()
 
-  return {'CC' : cc, 'APL' : apl, 'DIAM' : diam}
+  return {'CC' : cc, 'APL' : metrics['APL'], 'DIAM' : metrics['DIAM']}
 
 
 
@@ -80,8 +122,7 @@ def diagnose_lcc_size(G_original, generator, ER_P) :
   lcc_sizes = {}
   
   for name, G in nets.items() :
-    LCC = get_largest_connected_component(G)
-    size = LCC.number_of_nodes()
+    size = AnalysisContext(G).lcc_size
     lcc_sizes[name] = size
     
     print('{} LCC 노드 수 : {}'.format(name, size))
@@ -101,9 +142,11 @@ def diagnose_lcc_size(G_original, generator, ER_P) :
 
             
 # -------------------- 네트워크 그래프 기초통계 함수 --------------------
-def basic_network_stats(G) :
+@profile_stage('global')
+def basic_network_stats(G, context = None) :
   
   stats = {}
+  context = _check_context(G, context)
 
   # ---------- 기본 정보 ----------
 
@@ -115,9 +158,9 @@ def basic_network_stats(G) :
 
   # ---------- Degree 정보 ----------
   
-  degrees = [d for n, d in G.degree()]
+  degrees = context.degrees
 
-  if degrees :      
+  if len(degrees) > 0 :      
     stats['degree_average'] = round(np.mean(degrees), 3)
     stats['degree_max'] = int(np.max(degrees))
     stats['degree_min'] = int(np.min(degrees))
@@ -141,19 +184,16 @@ def basic_network_stats(G) :
     stats['average_clustering'] = None
     return stats
 
-  components = list(nx.connected_components(G))
-  stats['num_connected_components'] = len(components)
-
-  largest_cc_nodes = max(components, key = len)
-  stats['largest_cc_size'] = len(largest_cc_nodes)
+  stats['num_connected_components'] = context.num_components
+  stats['largest_cc_size'] = context.lcc_size
 
   # ---------- LCC 기반 경로 길이 및 지름 정보 ----------
-    
-  G_lcc = G.subgraph(largest_cc_nodes).copy()
 
-  if G_lcc.number_of_nodes() > 1 and G_lcc.number_of_edges() > 0 :
-    stats['average_shortest_path_length'] = round(nx.average_shortest_path_length(G_lcc), 3)
-    stats['diameter'] = nx.diameter(G_lcc)
+  metrics = context.distance_metrics()
+
+  if len(metrics['nodes']) > 1 :
+    stats['average_shortest_path_length'] = round(metrics['APL'], 3)
+    stats['diameter'] = metrics['DIAM']
 
   else :
     stats['average_shortest_path_length'] = None
@@ -162,7 +202,7 @@ def basic_network_stats(G) :
   # ---------- 클러스터링 계수 ----------
 
   try :
-    stats['average_clustering'] = round(nx.average_clustering(G), 3)
+    stats['average_clustering'] = round(context.average_clustering, 3)
 
   except Exception :
     stats['average_clustering'] = None
@@ -0,0 +1,22 @@
+import networkx as nx
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+
+# -------------------- 희소 인접 행렬 생성 함수 : 엣지 리스트로부터 CSR 인접 행렬을 한 번에 생성하는 함수 --------------------
+def to_csr_adjacency(G, nodes = None) :
+
+  # 🚨 dense N×N 행렬 대신 O(N+M) 메모리의 CSR 행렬을 사용 (행/열 순서는 nodes 순서를 따름)
+  # 🚨 CSRGraph는 노드 순서가 고정되어 있으므로 기존 배열을 그대로 공유
+
+  if isinstance(G, CSRGraph) :
+    if nodes is not None and list(nodes) != G.nodes() :
+      raise ValueError('CSRGraph는 저장된 노드 순서만 사용할 수 있습니다.')
+
+    return G.to_scipy()
+
+  if not isinstance(G, nx.Graph) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 형태로 입력하십시오.')
+
+  # ---------- 엣지 리스트 → CSR (self-loop 및 중복 제거 후 대칭화, 단일 패스) ----------
+
+  return CSRGraph.from_networkx(G, nodes).to_scipy()
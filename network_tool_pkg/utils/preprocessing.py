@@ -1,6 +1,11 @@
 import networkx as nx
+import numpy as np
+
+from network_tool_pkg.utils.csr_graph import CSRGraph
+from network_tool_pkg.utils.profiling_utils import profile_stage
 
 # -------------------- 네트워크 전처리 함수 : 원본 네트워크를 랜덤 모델 생성 및 분석에 용이하도록 변경해주는 함수 --------------------
+@profile_stage('preprocess')
 def preprocess_network(G) :
 
   # ---------- 전처리 이전 네트워크 타입 확인 (예외 처리) ----------
@@ -54,3 +59,100 @@ def preprocess_network(G) :
     raise ValueError('전처리 이후 네트워크의 노드가 1개 이하입니다. 네트워크 분석 및 랜덤 모델 생성이 불가능합니다.')
 
   return clean_G
+
+
+
+
+
+# -------------------- 대용량 네트워크 전처리 함수 : 엣지 배열 연산 한 번으로 self-loop / multi-edge / 고립 노드를 제거하는 함수 --------------------
+@profile_stage('preprocess')
+def preprocess_network_bulk(G, sample_size = 10, as_csr = False) :
+
+  # 🚨 preprocess_network와 같은 결과 네트워크를 만들지만 엣지별 has_edge 확인 / print / remove_node 호출 없이 O(E)로 처리
+  #    - 노드쌍을 (min, max)로 정규화 → self-loop 제거 → np.unique 한 번으로 중복 엣지 제거 → degree 0 노드 일괄 제거
+  # 🚨 제거 내역은 출력하지 않고 report로 반환 (항목별 최대 sample_size개의 예시 포함)
+  # 🚨 반환값 : (전처리된 네트워크, report), as_csr = True이면 CSRGraph 반환
+
+  # ---------- 전처리 이전 네트워크 타입 확인 (예외 처리) ----------
+
+  if not isinstance(G, (nx.Graph, CSRGraph)) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+  if not isinstance(sample_size, int) or sample_size < 0 :
+    raise ValueError('sample_size는 0 이상의 정수여야 합니다. 현재 sample_size = {}'.format(sample_size))
+
+  if G.number_of_nodes() == 0 :
+    raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
+
+  if G.number_of_edges() == 0 :
+    raise ValueError('입력한 네트워크는 엣지가 존재하지 않습니다. 전처리 및 랜덤 모델 생성이 불가능합니다.')
+
+  # ---------- 노드 인덱스 기반 엣지 배열 생성 ----------
+
+  nodes = G.nodes() if isinstance(G, CSRGraph) else list(G.nodes())
+  n = len(nodes)
+
+  if isinstance(G, CSRGraph) :
+    edges = G.edges()
+  else :
+    node_to_index = {node : i for i, node in enumerate(nodes)}
+    flat = np.fromiter((node_to_index[node] for edge in G.edges() for node in edge[:2]), dtype = np.int64, count = 2 * G.number_of_edges())
+    edges = flat.reshape(-1, 2)
+
+  num_edges_in = len(edges)
+
+  # ---------- self-loop 제거 ----------
+
+  loop_mask = edges[:, 0] == edges[:, 1]
+  loop_nodes = edges[loop_mask, 0]
+  edges = edges[~loop_mask]
+
+  # ---------- (min, max) 정규화 후 multi-edge 중복 삭제 ----------
+
+  keys = np.minimum(edges[:, 0], edges[:, 1]) * n + np.maximum(edges[:, 0], edges[:, 1])
+  unique_keys, counts = np.unique(keys, return_counts = True)
+  multi_keys = unique_keys[counts > 1]
+
+  u = unique_keys // n
+  v = unique_keys % n
+
+  # ---------- 고립 노드 제거 (self-loop만 있던 노드 포함) ----------
+
+  degrees = np.bincount(u, minlength = n) + np.bincount(v, minlength = n)
+  keep = degrees > 0
+  isolated = np.flatnonzero(~keep)
+
+  new_index = np.cumsum(keep) - 1
+  kept_nodes = [nodes[i] for i in np.flatnonzero(keep)]
+
+  # ---------- 전처리 이후 네트워크 타입 확인 (예외 처리) ----------
+
+  if len(kept_nodes) <= 1 :
+    raise ValueError('전처리 이후 네트워크의 노드가 1개 이하입니다. 네트워크 분석 및 랜덤 모델 생성이 불가능합니다.')
+
+  # ---------- 전처리 결과 요약 ----------
+
+  report = {'num_nodes_in' : n,
+            'num_edges_in' : num_edges_in,
+            'self_loops' : int(loop_mask.sum()),
+            'multi_edges' : int(len(keys) - len(unique_keys)),
+            'isolated_nodes' : int(len(isolated)),
+            'num_nodes' : len(kept_nodes),
+            'num_edges' : int(len(unique_keys)),
+            'samples' : {'self_loops' : [nodes[i] for i in np.unique(loop_nodes)[:sample_size]],
+                         'multi_edges' : [(nodes[k // n], nodes[k % n]) for k in multi_keys[:sample_size].tolist()],
+                         'isolated_nodes' : [nodes[i] for i in isolated[:sample_size]]}}
+
+  # ---------- 전처리된 네트워크 생성 ----------
+
+  clean_edges = np.stack([new_index[u], new_index[v]], axis = 1)
+  clean_graph = CSRGraph.from_edges(len(kept_nodes), clean_edges, kept_nodes)
+
+  if as_csr :
+    return clean_graph, report
+
+  clean_G = nx.Graph()
+  clean_G.add_nodes_from(kept_nodes)
+  clean_G.add_edges_from((kept_nodes[a], kept_nodes[b]) for a, b in clean_edges.tolist())
+
+  return clean_G, report
@@ -0,0 +1,335 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+# 🚨 분석 파이프라인의 단계별 실행 시간 / 호출 횟수 / (선택) tracemalloc 최대 메모리를 기록하는 계측 모듈
+# 🚨 켜는 방법
+#    - 환경 변수 : NETWORK_TOOL_PROFILE=1 (시간만) 또는 NETWORK_TOOL_PROFILE=memory (시간 + 메모리)
+#                  NETWORK_TOOL_PROFILE_OUTPUT=trace.json 이면 종료 시 Chrome trace 파일 저장 (chrome://tracing, Perfetto)
+#    - 코드 : with profiling(memory = True) as prof : ... → prof.print_summary(), prof.save_chrome_trace(path)
+# 🚨 꺼져 있으면 계측 함수는 전역 변수 하나만 확인하고 원래 함수를 그대로 호출 (추가 비용 거의 없음)
+# 🚨 프로세스 풀(n_workers > 1)의 worker 프로세스에서 실행된 단계는 기록되지 않음 (n_workers = 1로 실행하여 측정)
+
+PROFILE_ENV = 'NETWORK_TOOL_PROFILE'
+PROFILE_OUTPUT_ENV = 'NETWORK_TOOL_PROFILE_OUTPUT'
+
+# 현재 활성화된 Profiler (None이면 계측 꺼짐)
+_PROFILER = None
+
+# -------------------- 계측 기록 클래스 : 단계별 이벤트와 카운터를 모으고 집계 / 내보내기 --------------------
+class Profiler :
+
+  # ---------- 클래스 속성 설정 ----------
+
+  def __init__(self, memory = False) :
+
+    self.memory = memory
+    self.events = []
+    self.counters = {}
+    self._frames = []
+    self._labels = [{}]
+    self._origin = time.perf_counter_ns()
+    self._started_tracemalloc = False
+
+  # ---------- tracemalloc 시작 / 종료 ----------
+
+  def start(self) :
+
+    if self.memory and not tracemalloc.is_tracing() :
+      tracemalloc.start()
+      self._started_tracemalloc = True
+
+  def stop(self) :
+
+    if self._started_tracemalloc :
+      tracemalloc.stop()
+      self._started_tracemalloc = False
+
+  # ---------- 단계 기록 ----------
+
+  def push(self, name, category, labels) :
+
+    merged = dict(self._labels[-1])
+    merged.update(labels)
+    self._labels.append(merged)
+
+    frame = {'name' : name, 'category' : category, 'labels' : merged, 'start' : time.perf_counter_ns()}
+
+    # 바깥 단계의 최대 메모리를 보존한 뒤 peak를 초기화하여 이 단계만의 peak를 측정
+    if self.memory and tracemalloc.is_tracing() :
+      current, peak = tracemalloc.get_traced_memory()
+
+      if self._frames :
+        self._frames[-1]['peak_seen'] = max(self._frames[-1]['peak_seen'], peak)
+
+      tracemalloc.reset_peak()
+      frame['mem_start'] = current
+      frame['peak_seen'] = current
+
+    self._frames.append(frame)
+
+  def pop(self) :
+
+    end = time.perf_counter_ns()
+    frame = self._frames.pop()
+    self._labels.pop()
+
+    event = {'name' : frame['name'],
+             'category' : frame['category'],
+             'labels' : frame['labels'],
+             'start_ns' : frame['start'] - self._origin,
+             'duration_ns' : end - frame['start'],
+             'pid' : os.getpid(),
+             'tid' : threading.get_ident()}
+
+    if 'mem_start' in frame and tracemalloc.is_tracing() :
+      _, peak = tracemalloc.get_traced_memory()
+      peak = max(peak, frame['peak_seen'])
+      event['peak_bytes'] = peak - frame['mem_start']
+
+      # 안쪽 단계의 peak는 바깥 단계의 peak에도 포함
+      if self._frames :
+        self._frames[-1]['peak_seen'] = max(self._frames[-1]['peak_seen'], peak)
+
+    self.events.append(event)
+
+  def count(self, name, value = 1) :
+
+    self.counters[name] = self.counters.get(name, 0) + value
+
+  # ---------- 집계 (단계별 / 모델별) ----------
+
+  def summary(self, by = ('name', 'model')) :
+
+    table = {}
+
+    for event in self.events :
+      key = tuple(event['name'] if field == 'name' else event['category'] if field == 'category' else event['labels'].get(field) for field in by)
+
+      row = table.setdefault(key, {'count' : 0, 'total_s' : 0.0, 'max_s' : 0.0, 'peak_bytes' : None})
+      seconds = event['duration_ns'] / 1e9
+
+      row['count'] += 1
+      row['total_s'] += seconds
+      row['max_s'] = max(row['max_s'], seconds)
+
+      if 'peak_bytes' in event :
+        row['peak_bytes'] = max(row['peak_bytes'] or 0, event['peak_bytes'])
+
+    rows = []
+
+    for key, row in table.items() :
+      row = dict(zip(by, key), **row)
+      row['mean_s'] = row['total_s'] / row['count']
+      rows.append(row)
+
+    rows.sort(key = lambda row : row['total_s'], reverse = True)
+
+    return rows
+
+  def print_summary(self, by = ('name', 'model'), file = None) :
+
+    file = file or sys.stdout
+    rows = self.summary(by)
+
+    print('\n--- ⏱️ 단계별 실행 시간 (총 {}개 이벤트) ---'.format(len(self.events)), file = file)
+    print('{:<72} {:>7} {:>10} {:>10} {:>12}'.format(' / '.join(by), 'count', 'total(s)', 'mean(s)', 'peak(MB)'), file = file)
+
+    for row in rows :
+      label = ' / '.join(str(row[field]) for field in by if row[field] is not None)
+      peak = '-' if row['peak_bytes'] is None else '{:.2f}'.format(row['peak_bytes'] / 2**20)
+      print('{:<72} {:>7} {:>10.4f} {:>10.4f} {:>12}'.format(label, row['count'], row['total_s'], row['mean_s'], peak), file = file)
+
+    if self.counters :
+      print('--- 카운터 ---', file = file)
+
+      for name, value in sorted(self.counters.items()) :
+        print('{:<72} {:>7}'.format(name, value), file = file)
+
+    print('------------------------------------------', file = file)
+
+  # ---------- 내보내기 (Chrome trace / JSON) ----------
+
+  def to_chrome_trace(self) :
+
+    # Chrome trace event 형식 : 완료 이벤트('X'), 시간 단위는 마이크로초
+    trace = []
+
+    for event in self.events :
+      args = dict(event['labels'])
+
+      if 'peak_bytes' in event :
+        args['peak_bytes'] = event['peak_bytes']
+
+      trace.append({'name' : event['name'], 'cat' : event['category'], 'ph' : 'X',
+                    'ts' : event['start_ns'] / 1000, 'dur' : event['duration_ns'] / 1000,
+                    'pid' : event['pid'], 'tid' : event['tid'], 'args' : args})
+
+    for name, value in self.counters.items() :
+      trace.append({'name' : name, 'ph' : 'C', 'ts' : 0, 'pid' : os.getpid(), 'args' : {name : value}})
+
+    return {'traceEvents' : trace, 'displayTimeUnit' : 'ms'}
+
+  def save_chrome_trace(self, path) :
+
+    output_dir = os.path.dirname(path)
+
+    if output_dir :
+      os.makedirs(output_dir, exist_ok = True)
+
+    with open(path, 'w') as f :
+      json.dump(self.to_chrome_trace(), f)
+
+    return path
+
+  def save_json(self, path) :
+
+    output_dir = os.path.dirname(path)
+
+    if output_dir :
+      os.makedirs(output_dir, exist_ok = True)
+
+    with open(path, 'w') as f :
+      json.dump({'summary' : self.summary(), 'counters' : self.counters, 'events' : self.events}, f, indent = 2)
+
+    return path
+
+
+
+
+
+# -------------------- 계측 켜기 / 끄기 (context manager) --------------------
+@contextmanager
+def profiling(memory = False, output = None) :
+
+  # with 블록 안에서만 계측, 블록이 끝나면 이전 상태(꺼짐 또는 환경 변수 Profiler)로 복원
+  global _PROFILER
+
+  previous = _PROFILER
+  profiler = Profiler(memory = memory)
+  profiler.start()
+  _PROFILER = profiler
+
+  try :
+    yield profiler
+
+  finally :
+    _PROFILER = previous
+    profiler.stop()
+
+    if output :
+      profiler.save_chrome_trace(output)
+
+
+
+
+
+# -------------------- 현재 활성화된 Profiler 반환 (꺼져 있으면 None) --------------------
+def get_profiler() :
+
+  return _PROFILER
+
+
+
+
+
+# -------------------- 계측 decorator : 함수 / 메서드 호출 1회를 단계 이벤트 하나로 기록 --------------------
+def profile_stage(category, name = None) :
+
+  def decorator(fn) :
+    stage_name = name or fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs) :
+      profiler = _PROFILER
+
+      if profiler is None :
+        return fn(*args, **kwargs)
+
+      profiler.push(stage_name, category, {})
+
+      try :
+        return fn(*args, **kwargs)
+
+      finally :
+        profiler.pop()
+
+    return wrapper
+
+  return decorator
+
+
+
+
+
+# -------------------- 계측 블록 : 코드 구간을 이벤트로 기록하고 label(model 등)을 안쪽 단계에 전달 --------------------
+@contextmanager
+def profile_block(name, category = 'block', **labels) :
+
+  profiler = _PROFILER
+
+  if profiler is None :
+    yield
+    return
+
+  profiler.push(name, category, labels)
+
+  try :
+    yield
+
+  finally :
+    profiler.pop()
+
+
+
+
+
+# -------------------- 카운터 증가 --------------------
+def count(name, value = 1) :
+
+  profiler = _PROFILER
+
+  if profiler is not None :
+    profiler.count(name, value)
+
+
+
+
+
+# -------------------- 환경 변수로 켠 경우 : import 시 Profiler 생성, 종료 시 요약 출력 및 trace 저장 --------------------
+def _enable_from_env() :
+
+  global _PROFILER
+
+  value = os.environ.get(PROFILE_ENV, '').strip().lower()
+
+  if value in ('', '0', 'false', 'off', 'no') :
+    return None
+
+  profiler = Profiler(memory = (value == 'memory'))
+  profiler.start()
+  _PROFILER = profiler
+
+  def report() :
+    if not profiler.events :
+      return
+
+    profiler.print_summary(file = sys.stderr)
+    output = os.environ.get(PROFILE_OUTPUT_ENV)
+
+    if output :
+      profiler.save_chrome_trace(output)
+      print('[profiling] Chrome trace 저장 : {}'.format(output), file = sys.stderr)
+
+  atexit.register(report)
+
+  return profiler
+
+
+_enable_from_env()
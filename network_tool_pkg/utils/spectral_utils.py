@@ -0,0 +1,262 @@
+import numpy as np
+from scipy.sparse.linalg import eigsh, LinearOperator, ArpackNoConvergence
+
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
+# 🚨 CSR 인접 행렬(대칭, 가중치 없음)에서 고유벡터 / PageRank / Katz 중심성을 계산하는 벡터 반복 solver 모음
+# 🚨 모든 solver는 (벡터, info)를 반환하며 info에 수렴 여부와 진단 값을 기록 (max_iter에 도달해도 조용히 실패하지 않음)
+#    - info = {'method', 'converged', 'iterations', 'residual', ...}
+# 🚨 x0에 이전 결과 벡터를 넣으면 그 벡터에서 반복을 시작 (같은 모델의 앙상블 표본처럼 비슷한 네트워크를 연속으로 계산할 때 반복 횟수 감소)
+
+# -------------------- 보조 함수 : 시작 벡터 준비 --------------------
+def _start_vector(x0, n) :
+
+  if x0 is None :
+    return np.ones(n)
+
+  x = np.abs(np.asarray(x0, dtype = np.float64)).ravel()
+
+  if x.shape[0] != n :
+    raise ValueError('시작 벡터 x0의 길이가 노드 수와 다릅니다. 현재 길이 = {}, 노드 수 = {}'.format(x.shape[0], n))
+
+  if not np.isfinite(x).all() or not x.any() :
+    raise ValueError('시작 벡터 x0는 유한한 값이며 0이 아닌 원소가 하나 이상 있어야 합니다.')
+
+  return x
+
+
+
+
+
+# -------------------- 보조 함수 : 단위 벡터 x의 Rayleigh quotient와 고유값 잔차 ||Ax - λx|| --------------------
+def _eigen_residual(A, x) :
+
+  Ax = A @ x
+  eigenvalue = float(x @ Ax)
+
+  return eigenvalue, float(np.linalg.norm(Ax - eigenvalue * x))
+
+
+
+
+
+# -------------------- 고유벡터 solver : shifted power iteration --------------------
+@profile_stage('kernel')
+def power_iteration(A, x0 = None, shift = 0.0, max_iter = 100, tol = 1e-6) :
+
+  # 🚨 x ← (A + shift·I) x / ||(A + shift·I) x|| 를 원소별 최대 변화량이 tol 미만이 될 때까지 반복
+  # 🚨 bipartite 네트워크는 A의 고유값 -λ₁이 있어 shift = 0이면 진동하며 수렴하지 않음 → shift > 0 (예 : 1.0, networkx와 동일)으로 해결
+  # 🚨 info['residual'] = ||Ax - λx|| (λ는 Rayleigh quotient), info['delta'] = 마지막 반복의 최대 변화량
+
+  n = A.shape[0]
+  x = _start_vector(x0, n)
+  delta = np.inf
+  iterations = 0
+  converged = False
+
+  while iterations < max_iter :
+    y = A @ x
+
+    if shift :
+      y = y + shift * x
+
+    norm_value = np.linalg.norm(y)
+    iterations += 1
+
+    if norm_value == 0 :
+      return np.zeros(n), {'method' : 'power', 'converged' : True, 'iterations' : iterations, 'residual' : 0.0,
+                           'delta' : 0.0, 'eigenvalue' : 0.0, 'shift' : shift}
+
+    y = y / norm_value
+    delta = float(np.max(np.abs(y - x)))
+    x = y
+
+    if delta < tol :
+      converged = True
+      break
+
+  eigenvalue, residual = _eigen_residual(A, x)
+
+  return x, {'method' : 'power', 'converged' : converged, 'iterations' : iterations, 'residual' : residual,
+             'delta' : delta, 'eigenvalue' : eigenvalue, 'shift' : shift}
+
+
+
+
+
+# -------------------- 고유벡터 solver : Lanczos (scipy eigsh / ARPACK) --------------------
+@profile_stage('kernel')
+def lanczos_eigenvector(A, x0 = None, max_iter = None, tol = 1e-6) :
+
+  # 🚨 가장 큰 고유값의 고유벡터를 Lanczos로 계산 (power iteration보다 고유값 간격이 좁은 네트워크에서 훨씬 적은 행렬-벡터 곱으로 수렴)
+  # 🚨 x0는 ARPACK 시작 벡터(v0)로 사용, info['iterations']는 행렬-벡터 곱 횟수
+  # 🚨 eigsh는 k < N 조건이 필요하므로 노드가 2개 이하이면 ValueError, 수렴 실패 시 ArpackNoConvergence 발생
+
+  n = A.shape[0]
+
+  if n <= 2 :
+    raise ValueError('Lanczos solver는 노드가 3개 이상이어야 합니다. 현재 노드 수 = {}'.format(n))
+
+  matvecs = [0]
+
+  def matvec(v) :
+    matvecs[0] += 1
+    return A @ v
+
+  operator = LinearOperator((n, n), matvec = matvec, dtype = np.float64)
+  v0 = None if x0 is None else _start_vector(x0, n)
+
+  _, vecs = eigsh(operator, k = 1, which = 'LA', v0 = v0, maxiter = max_iter, tol = tol)
+  x = np.abs(vecs[:, 0])
+  norm_value = np.linalg.norm(x)
+
+  if norm_value > 0 :
+    x = x / norm_value
+
+  eigenvalue, residual = _eigen_residual(A, x)
+
+  return x, {'method' : 'lanczos', 'converged' : True, 'iterations' : matvecs[0], 'residual' : residual,
+             'eigenvalue' : eigenvalue, 'shift' : 0.0}
+
+
+
+
+
+# -------------------- 고유벡터 중심성 solver : method에 따라 power / Lanczos 선택 --------------------
+def eigenvector_solve(A, method = 'power', x0 = None, shift = 0.0, max_iter = 100, tol = 1e-6) :
+
+  # 🚨 method = 'power' : shifted power iteration / 'lanczos' : eigsh (노드 2개 이하 또는 수렴 실패 시 power iteration으로 대체)
+  # 🚨 대체된 경우 info['fallback'] = 'lanczos'
+  # 🚨 ARPACK의 maxiter는 재시작 횟수이므로 Lanczos에는 max_iter · N을 상한으로 전달
+
+  if method not in ('power', 'lanczos') :
+    raise ValueError("method는 'power' 또는 'lanczos' 이어야 합니다. 현재 method = {}".format(method))
+
+  if method == 'lanczos' and A.shape[0] > 2 :
+    try :
+      return lanczos_eigenvector(A, x0 = x0, max_iter = max_iter * A.shape[0], tol = tol)
+
+    except ArpackNoConvergence :
+      x, info = power_iteration(A, x0 = x0, shift = shift, max_iter = max_iter, tol = tol)
+      info['fallback'] = 'lanczos'
+
+      return x, info
+
+  return power_iteration(A, x0 = x0, shift = shift, max_iter = max_iter, tol = tol)
+
+
+
+
+
+# -------------------- PageRank solver : dangling 노드를 포함한 power iteration --------------------
+@profile_stage('kernel')
+def pagerank_solve(A, alpha = 0.85, x0 = None, max_iter = 100, tol = 1e-6) :
+
+  # 🚨 x ← α·A·D⁻¹·x + α·(dangling 노드 값의 합)/N + (1-α)/N, 합이 1인 확률 벡터
+  # 🚨 수렴 기준과 결과는 networkx.pagerank와 동일 (L1 변화량 < N·tol), info['residual'] = 마지막 L1 변화량
+
+  if not 0 < alpha < 1 :
+    raise ValueError('alpha는 0과 1 사이여야 합니다. 현재 alpha = {}'.format(alpha))
+
+  n = A.shape[0]
+  out_degree = np.asarray(A.sum(axis = 1)).ravel().astype(np.float64)
+  dangling = out_degree == 0
+  inv_degree = np.divide(1.0, out_degree, out = np.zeros(n), where = ~dangling)
+
+  x = _start_vector(x0, n)
+  x = x / x.sum()
+  residual = np.inf
+  iterations = 0
+  converged = False
+
+  while iterations < max_iter :
+    y = alpha * (A.T @ (x * inv_degree)) + (alpha * x[dangling].sum() + 1 - alpha) / n
+    residual = float(np.abs(y - x).sum())
+    x = y
+    iterations += 1
+
+    if residual < n * tol :
+      converged = True
+      break
+
+  return x, {'method' : 'pagerank', 'converged' : converged, 'iterations' : iterations, 'residual' : residual, 'alpha' : alpha}
+
+
+
+
+
+# -------------------- 보조 함수 : 인접 행렬의 최대 고유값 λ₁ (Katz 수렴 조건 확인용) --------------------
+def _largest_eigenvalue(A) :
+
+  # 🚨 Lanczos 1회 (노드 2개 이하 또는 수렴 실패 시 shifted power iteration), 반환값은 Rayleigh quotient
+  if A.shape[0] > 2 :
+    try :
+      return lanczos_eigenvector(A, max_iter = 100 * A.shape[0])[1]['eigenvalue']
+
+    except ArpackNoConvergence :
+      pass
+
+  return power_iteration(A, shift = 1.0, max_iter = 1000)[1]['eigenvalue']
+
+
+
+
+
+# -------------------- Katz 중심성 solver : x ← α·A·x + β 고정점 반복 --------------------
+@profile_stage('kernel')
+def katz_solve(A, alpha = 0.1, beta = 1.0, x0 = None, max_iter = 1000, tol = 1e-6, normalized = True) :
+
+  # 🚨 α < 1/λ₁ (λ₁ = 인접 행렬의 최대 고유값, 최대 degree 이하)일 때만 수렴 → 반복 전에 α·λ₁ >= 1 이면 ValueError
+  #    (α·최대 degree < 1 이면 λ₁ 계산 생략)
+  # 🚨 α·λ₁이 1보다 조금만 커도 변화량이 max_iter 안에 처음 값을 넘지 못해 미수렴 벡터가 반환되므로 반복 결과로만 판단하지 않음
+  # 🚨 수렴 기준과 결과는 networkx.katz_centrality와 동일 (L1 변화량 < N·tol, normalized = True이면 L2 정규화)
+  # 🚨 x0 warm start는 정규화하지 않은 이전 결과(normalized = False)를 넣어야 효과가 있음
+
+  if alpha <= 0 :
+    raise ValueError('alpha는 0보다 커야 합니다. 현재 alpha = {}'.format(alpha))
+
+  # ---------- 수렴 조건 확인 (α·λ₁ < 1) ----------
+
+  row_sum = np.asarray(A.sum(axis = 1)).ravel()
+
+  if row_sum.size > 0 and alpha * row_sum.max() >= 1 :
+    lambda_max = _largest_eigenvalue(A)
+
+    if alpha * lambda_max >= 1 :
+      raise ValueError('Katz 중심성 반복이 발산합니다. alpha를 1/λ₁(인접 행렬의 최대 고유값)보다 작게 설정하십시오. 현재 alpha = {}, 1/λ₁ = {:.6g}'.format(alpha, 1 / lambda_max))
+
+  n = A.shape[0]
+  x = np.zeros(n) if x0 is None else _start_vector(x0, n)
+  residual = np.inf
+  first_residual = None
+  iterations = 0
+  converged = False
+
+  with np.errstate(over = 'ignore', invalid = 'ignore') :
+    while iterations < max_iter :
+      y = alpha * (A @ x) + beta
+      residual = float(np.abs(y - x).sum())
+      x = y
+      iterations += 1
+
+      if first_residual is None :
+        first_residual = residual
+
+      if residual < n * tol :
+        converged = True
+        break
+
+      if not np.isfinite(residual) :
+        break
+
+  # 수렴하지 않고 변화량이 처음보다 커졌으면 α·λ₁ >= 1로 발산한 것으로 판단
+  if not converged and (not np.isfinite(residual) or residual > first_residual) :
+    raise ValueError('Katz 중심성 반복이 발산했습니다. alpha를 1/λ₁(인접 행렬의 최대 고유값)보다 작게 설정하십시오. 현재 alpha = {}'.format(alpha))
+
+  if normalized :
+    norm_value = np.linalg.norm(x)
+
+    if norm_value > 0 :
+      x = x / norm_value
+
+  return x, {'method' : 'katz', 'converged' : converged, 'iterations' : iterations, 'residual' : residual, 'alpha' : alpha, 'beta' : beta}
@@ -0,0 +1,130 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+from network_tool_pkg.utils.csr_graph import CSRGraph, EnsembleEdges
+from network_tool_pkg.utils.matrix_utils import to_csr_adjacency
+from network_tool_pkg.utils.profiling_utils import profile_stage
+
+# -------------------- 삼각형 계산 커널 : degree 순서로 방향을 준 CSR 행렬 곱으로 노드별 삼각형 수를 계산하는 함수 --------------------
+@profile_stage('kernel')
+def triangles_from_adjacency(A) :
+
+  # 🚨 엣지를 degree가 작은 노드 → 큰 노드로만 남긴 상삼각 행렬 U 사용 (각 삼각형 a → b → c를 한 번만 셈, O(M^1.5))
+  #    - W = U ⊙ (U @ U)   : W[a, c] = a가 가장 낮은, c가 가장 높은 순위인 삼각형 수
+  #    - V = U ⊙ (Uᵀ @ U)  : V[b, c] = b가 중간 순위(b → c)인 삼각형 수
+  #    - 노드별 삼각형 수 = W 행 합 (최저 순위) + W 열 합 (최고 순위) + V 행 합 (중간 순위)
+  # 🚨 A는 self-loop가 없는 대칭 CSR 인접 행렬이어야 함
+
+  n = A.shape[0]
+
+  if n == 0 or A.nnz == 0 :
+    return np.zeros(n, dtype = np.int64)
+
+  A = sp.csr_matrix(A)
+  degrees = np.diff(A.indptr)
+
+  # degree 오름차순 (같으면 인덱스 순) 순위
+  rank = np.empty(n, dtype = np.int64)
+  rank[np.lexsort((np.arange(n), degrees))] = np.arange(n)
+
+  rows = np.repeat(np.arange(n), degrees)
+  cols = A.indices
+  mask = rank[rows] < rank[cols]
+
+  U = sp.csr_matrix((np.ones(int(mask.sum()), dtype = np.int64), (rows[mask], cols[mask])), shape = (n, n))
+
+  W = U.multiply(U @ U).tocsr()
+  V = U.multiply((U.T @ U).tocsr()).tocsr()
+
+  triangles = np.asarray(W.sum(axis = 1)).ravel() + np.asarray(W.sum(axis = 0)).ravel() + np.asarray(V.sum(axis = 1)).ravel()
+
+  return triangles.astype(np.int64)
+
+
+
+
+
+# -------------------- 보조 함수 : 삼각형 수와 degree로 클러스터링 지표 계산 (마지막 축 = 노드) --------------------
+def _clustering_from_triangles(triangles, degrees) :
+
+  # local clustering : 2t / (d(d-1)), degree가 2 미만인 노드는 0 (nx.clustering과 동일)
+  triangles = np.asarray(triangles, dtype = np.float64)
+  degrees = np.asarray(degrees, dtype = np.float64)
+  pairs = degrees * (degrees - 1)
+
+  with np.errstate(divide = 'ignore', invalid = 'ignore') :
+    clustering = np.where(pairs > 0, 2 * triangles / pairs, 0.0)
+
+  # transitivity : 3 × 삼각형 수 / 연결된 triple 수 = Σt / Σ d(d-1)/2 (triple이 없으면 0, nx.transitivity와 동일)
+  triads = pairs.sum(axis = -1)
+
+  transitivity = np.where(triads > 0, 2 * triangles.sum(axis = -1) / np.where(triads > 0, triads, 1), 0.0)
+
+  return clustering, clustering.mean(axis = -1), transitivity
+
+
+
+
+
+# -------------------- 클러스터링 지표 계산 함수 : 노드별 삼각형 수, local / average clustering, transitivity를 한 번에 계산 --------------------
+def calculate_triangle_stats(G) :
+
+  if not isinstance(G, (nx.Graph, CSRGraph)) :
+    raise TypeError('입력한 네트워크의 형태가 올바르지 않습니다. networkx.Graph 또는 CSRGraph 형태로 입력하십시오.')
+
+  nodes = G.nodes() if isinstance(G, CSRGraph) else list(G.nodes())
+
+  if len(nodes) == 0 :
+    raise ValueError('입력한 네트워크는 빈 그래프입니다. 다른 네트워크를 입력하십시오.')
+
+  A = to_csr_adjacency(G, nodes)
+
+  return triangle_stats_from_adjacency(A, nodes)
+
+
+
+
+
+# -------------------- 클러스터링 지표 계산 본체 : 인접 행렬이 이미 주어진 경우 (AnalysisContext에서 재사용) --------------------
+def triangle_stats_from_adjacency(A, nodes) :
+
+  triangles = triangles_from_adjacency(A)
+  clustering, average_clustering, transitivity = _clustering_from_triangles(triangles, np.diff(A.indptr))
+
+  return {'nodes' : list(nodes),
+          'triangles' : {node : int(triangles[i]) for i, node in enumerate(nodes)},
+          'clustering' : {node : float(clustering[i]) for i, node in enumerate(nodes)},
+          'average_clustering' : float(average_clustering),
+          'transitivity' : float(transitivity)}
+
+
+
+
+
+# -------------------- 앙상블 클러스터링 지표 계산 함수 : 모든 표본을 block diagonal 행렬 하나로 묶어 한 번에 계산 --------------------
+def ensemble_triangle_stats(ensemble) :
+
+  # 🚨 표본 s의 노드 i를 s·N + i로 옮겨 표본들을 서로 연결되지 않은 하나의 큰 네트워크로 만든 뒤 삼각형 커널을 한 번만 실행
+  # 🚨 반환값의 배열은 (표본 수, N) 또는 (표본 수,) 형태
+
+  if not isinstance(ensemble, EnsembleEdges) :
+    raise TypeError('입력한 앙상블의 형태가 올바르지 않습니다. EnsembleEdges 형태로 입력하십시오.')
+
+  n = ensemble.n_nodes
+  S = len(ensemble)
+
+  if n == 0 or S == 0 :
+    raise ValueError('앙상블에 노드 또는 표본이 존재하지 않습니다.')
+
+  shifted = ensemble.edges + (ensemble.sample_ids() * n)[:, None]
+  A = CSRGraph.from_edges(S * n, shifted).to_scipy()
+
+  triangles = triangles_from_adjacency(A).reshape(S, n)
+  degrees = np.diff(A.indptr).reshape(S, n)
+  clustering, average_clustering, transitivity = _clustering_from_triangles(triangles, degrees)
+
+  return {'triangles' : triangles,
+          'clustering' : clustering,
+          'average_clustering' : average_clustering,
+          'transitivity' : transitivity}
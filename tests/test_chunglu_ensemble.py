@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from network_tool_pkg.analysis.random_nets_generator import RandomNetGenerator
+
+# 🚨 generate_ensemble('Chung-Lu')의 skip sampling 결과가 노드쌍별 Chung-Lu 확률을 따르는지 표본 빈도로 확인
+
+# weight 0 노드, clip 경계(w_i·w_j > 2m)를 넘는 노드쌍, 여러 log2 등급을 모두 포함하는 degree sequence
+DEGREES = [9, 8, 7, 3, 3, 2, 2, 1, 1, 1, 1, 0, 5, 4, 16, 12]
+NUM_SAMPLES = 20000
+
+# -------------------- 보조 함수 : 노드쌍별 Chung-Lu 확률 행렬 --------------------
+def _expected_probabilities(degrees, clip) :
+
+  w = np.asarray(degrees, dtype = np.float64)
+  W = np.outer(w, w)
+  P = W / w.sum()
+
+  if clip == 'max_degree' :
+    P = np.where(P > 1, W / w.max() ** 2, P)
+
+  return np.clip(P, 0, 1)
+
+
+
+
+
+# -------------------- 표본 빈도 vs min(1, w_i·w_j / S) (clip = 'one') 및 max(k)² 보정 (clip = 'max_degree') --------------------
+@pytest.mark.parametrize('clip', ['one', 'max_degree'])
+def test_pair_frequencies_match_chunglu_probabilities(clip) :
+
+  n = len(DEGREES)
+  generator = RandomNetGenerator(n, DEGREES)
+  ensemble = generator.generate_ensemble('Chung-Lu', NUM_SAMPLES, seed = 3, clip = clip, chunk_size = 5000)
+
+  edges = ensemble.edges
+
+  # 엣지는 (i < j) 형태, 표본 순서로 정렬, 표본 내 중복 없음
+  assert (edges[:, 0] < edges[:, 1]).all()
+  assert (np.diff(ensemble.sample_ids()) >= 0).all()
+
+  keys = ensemble.sample_ids() * n * n + edges[:, 0] * n + edges[:, 1]
+  assert len(np.unique(keys)) == len(keys)
+
+  counts = np.zeros((n, n))
+  np.add.at(counts, (edges[:, 0], edges[:, 1]), 1)
+
+  iu = np.triu_indices(n, 1)
+  observed = counts[iu] / NUM_SAMPLES
+  expected = _expected_probabilities(DEGREES, clip)[iu]
+
+  # 확률 0인 노드쌍은 한 번도 나오지 않아야 하고, 나머지는 이항분포 기준 5 표준오차 이내
+  assert observed[expected == 0].sum() == 0
+
+  stderr = np.sqrt(expected * (1 - expected) / NUM_SAMPLES)
+  z = np.abs(observed - expected) / np.maximum(stderr, 1e-12)
+
+  assert z.max() < 5, (clip, z.max())
@@ -0,0 +1,66 @@
+import json
+import os
+import numpy as np
+import pytest
+
+from data_loader_script import load_network_from_file_fast
+from network_tool_pkg.utils.disk_graph import build_disk_graph, open_disk_graph
+
+# 🚨 build_disk_graph(외부 정렬)의 CSR 배열이 메모리 로더 load_network_from_file_fast(as_csr = True)와 같은지 확인
+
+# -------------------- 보조 함수 : 중복 엣지, 역방향 중복, self-loop, self-loop에만 등장하는 노드를 포함한 엣지 파일 생성 --------------------
+def _write_edge_file(path, seed = 0) :
+
+  rng = np.random.default_rng(seed)
+  names = ['id{}'.format(i) for i in rng.permutation(300)]
+  pairs = rng.integers(0, 250, size = (2000, 2))
+
+  lines = ['{},{}'.format(names[a], names[b]) for a, b in pairs]
+  lines += ['{},{}'.format(names[b], names[a]) for a, b in pairs[:300]]
+  lines += ['{},{}'.format(names[a], names[a]) for a in range(240, 300)]
+  lines = [lines[i] for i in rng.permutation(len(lines))]
+
+  with open(path, 'w') as f :
+    f.write('\n'.join(lines) + '\n')
+
+
+
+
+
+# -------------------- 작은 chunk / bucket으로 여러 bucket을 거쳐도 메모리 로더와 같은 CSR --------------------
+@pytest.mark.parametrize('chunk_size, bucket_edges', [(1 << 24, 1 << 24), (512, 64)])
+def test_disk_graph_matches_fast_loader(tmp_path, chunk_size, bucket_edges) :
+
+  edge_path = os.path.join(tmp_path, 'edges.txt')
+  _write_edge_file(edge_path)
+
+  expected = load_network_from_file_fast(edge_path, as_csr = True)
+  graph = open_disk_graph(build_disk_graph(edge_path, os.path.join(tmp_path, 'disk'), chunk_size = chunk_size, bucket_edges = bucket_edges))
+
+  assert np.array_equal(graph.indptr, expected.indptr)
+  assert np.array_equal(graph.indices, expected.indices)
+  assert graph.labels == expected.labels
+
+  with open(os.path.join(tmp_path, 'disk', 'meta.json')) as f :
+    meta = json.load(f)
+
+  assert meta['num_nodes'] == expected.number_of_nodes()
+  assert meta['num_edges'] == expected.number_of_edges()
+  assert meta['self_loops'] > 0 and meta['multi_edges'] > 0
+
+
+
+
+
+# -------------------- 형식이 잘못된 줄은 디스크에 기록하지 않고 ValueError --------------------
+def test_disk_graph_rejects_malformed_lines(tmp_path) :
+
+  edge_path = os.path.join(tmp_path, 'bad.txt')
+
+  with open(edge_path, 'w') as f :
+    f.write('a\nb,c,d\n')
+
+  with pytest.raises(ValueError) :
+    build_disk_graph(edge_path, os.path.join(tmp_path, 'disk'))
+
+  assert not os.path.exists(os.path.join(tmp_path, 'disk', 'indices.npy'))
@@ -0,0 +1,117 @@
+import random
+import networkx as nx
+import numpy as np
+
+from network_tool_pkg.analysis.dynamic_graph import DynamicGraph
+from network_tool_pkg.utils.global_utils import calculate_global
+from network_tool_pkg.utils.context_utils import AnalysisContext
+
+# 🚨 DynamicGraph의 증분 갱신 결과(삼각형, union-find 구성요소, 영향받는 source BFS)를 같은 네트워크를 새로 계산한 결과와 비교
+
+# -------------------- 보조 함수 : DynamicGraph와 networkx 그래프 H의 모든 지표 비교 --------------------
+def _assert_same_metrics(D, H) :
+
+  # ---------- 삼각형 수 / 클러스터링 계수 ----------
+
+  triangles = nx.triangles(H)
+  clustering = nx.clustering(H)
+
+  for node in H :
+    assert D.triangle_count(node) == triangles[node]
+    assert np.isclose(D.clustering(node), clustering[node])
+
+  # ---------- 연결 구성요소 / LCC ----------
+
+  context = AnalysisContext(H)
+
+  assert D.num_components() == nx.number_connected_components(H)
+  assert D.lcc_size() == context.lcc_size
+
+  # ---------- 전역 지표 / 거리 기반 중심성 ----------
+
+  expected = calculate_global(H, mode = 'exact')
+  actual = D.global_metrics()
+
+  for key in ('CC', 'APL', 'DIAM') :
+    assert np.isclose(expected[key], actual[key], equal_nan = True), (key, expected, actual)
+
+  metrics = context.distance_metrics()
+  dynamic_metrics = D.distance_metrics()
+
+  assert set(metrics['nodes']) == set(dynamic_metrics['nodes'])
+
+  for node in metrics['nodes'] :
+    assert np.isclose(metrics['closeness'][node], dynamic_metrics['closeness'][node])
+    assert np.isclose(metrics['harmonic'][node], dynamic_metrics['harmonic'][node])
+
+
+
+
+
+# -------------------- 무작위 엣지 추가 / 삭제 후 새로 계산한 결과와 비교 --------------------
+def test_random_edits_match_fresh_computation() :
+
+  rng = random.Random(1)
+  G = nx.gnm_random_graph(60, 80, seed = 3)
+
+  D = DynamicGraph(G)
+  H = G.copy()
+
+  for step in range(300) :
+    u, v = rng.sample(range(62), 2)
+
+    # 삭제를 자주 섞어 구성요소가 나뉘고 합쳐지는 경우를 모두 포함
+    if H.has_edge(u, v) or (H.number_of_edges() > 0 and rng.random() < 0.4) :
+      if not H.has_edge(u, v) :
+        u, v = rng.choice(list(H.edges()))
+
+      H.remove_edge(u, v)
+      D.remove_edge(u, v)
+    else :
+      H.add_edge(u, v)
+      D.add_edge(u, v)
+
+    if step % 10 == 0 :
+      _assert_same_metrics(D, H)
+
+  _assert_same_metrics(D, H)
+  assert D.number_of_edges() == H.number_of_edges()
+
+
+
+
+
+# -------------------- 변경 되돌리기 : 엣지 추가 후 삭제(또는 삭제 후 추가)하면 원래 지표로 복원 --------------------
+def test_edit_rollback_restores_metrics() :
+
+  G = nx.karate_club_graph()
+  D = DynamicGraph(G)
+
+  before = D.global_metrics()
+  closeness = D.closeness_centrality()
+
+  rng = random.Random(7)
+  non_edges = rng.sample(list(nx.non_edges(G)), 20)
+  edges = rng.sample(list(G.edges()), 20)
+
+  for u, v in non_edges :
+    D.add_edge(u, v)
+
+  for u, v in edges :
+    D.remove_edge(u, v)
+
+  for u, v in reversed(edges) :
+    D.add_edge(u, v)
+
+  for u, v in reversed(non_edges) :
+    D.remove_edge(u, v)
+
+  after = D.global_metrics()
+
+  for key in ('CC', 'APL', 'DIAM') :
+    assert np.isclose(before[key], after[key])
+
+  restored = D.closeness_centrality()
+
+  assert all(np.isclose(closeness[node], restored[node]) for node in closeness)
+  _assert_same_metrics(D, G)